@@ -1,3 +1,6 @@
+from easyprotocol.base.capture import CaptureReader as CaptureReader  # noqa
+from easyprotocol.base.framer import StreamFramer as StreamFramer  # noqa
+from easyprotocol.base.metrics import MetricsRegistry as MetricsRegistry  # noqa
 from easyprotocol.base.parse_field_dict import ParseFieldDict as ParseFieldDict  # noqa
 from easyprotocol.base.parse_field_dict import (  # noqa
     ParseFieldDictGeneric as ParseFieldDictGeneric,
@@ -6,10 +9,12 @@ from easyprotocol.base.parse_field_list import ParseFieldList as ParseFieldList
 from easyprotocol.base.parse_field_list import (  # noqa
     ParseFieldListGeneric as ParseFieldListGeneric,
 )
+from easyprotocol.base.parse_numpy import get_numpy_dtype as get_numpy_dtype  # noqa
 from easyprotocol.base.parse_value_list import ParseValueList as ParseValueList  # noqa
 from easyprotocol.base.parse_value_list import (  # noqa
     ParseValueListGeneric as ParseValueListGeneric,
 )
+from easyprotocol.base.profiler import FieldProfiler as FieldProfiler  # noqa
 from easyprotocol.base.utils import dataT as dataT  # noqa
 from easyprotocol.base.utils import hex as hex  # noqa
 from easyprotocol.base.utils import input_to_bytes as input_to_bytes  # noqa
@@ -0,0 +1,159 @@
+"""Read records from binary capture files without reading the files into memory."""
+from __future__ import annotations
+
+import mmap
+import os
+from types import TracebackType
+from typing import IO, Any, Iterator, Union
+
+from bitarray import bitarray
+
+from easyprotocol.base.framer import get_length_field
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.base.parse_batch import parse_many
+from easyprotocol.base.parse_generic_value import ParseGenericValue
+from easyprotocol.base.utils import input_to_bytes
+
+pathT = Union[str, "os.PathLike[str]"]
+
+
+class CaptureReader:
+    """Iterate the records of a binary capture file, parsing them directly from a memory map of the file.
+
+    Records are either parsed back to back (fixed-size records, or records whose size follows from
+    their own fields), or are length-prefixed: a named field of the schema, such as ModbusLength,
+    holds the number of bytes in the record after the end of that field.
+
+    The same schema object is parsed and yielded for every record, so use its clone method to keep
+    a record. Lazily parsed schemas reference the memory map until the reader is closed, which
+    loads their remaining fields first.
+    """
+
+    def __init__(
+        self,
+        path: pathT,
+        schema: ParseBase,
+        length_field: str | None = None,
+        length_adjustment: int = 0,
+    ) -> None:
+        """Open a binary capture file for reading records.
+
+        Args:
+            path: path of the capture file
+            schema: the field that each record is parsed into
+            length_field: name of the sub-field of the schema that holds the length of each record, if any
+            length_adjustment: number of bytes to add to the value of the length field (e.g. for a trailing checksum)
+
+        Raises:
+            KeyError: if the schema has no sub-field with the name of the length field
+        """
+        self._schema = schema
+        self._length_adjustment = length_adjustment
+        self._length_field: ParseGenericValue[Any] | None = None
+        self._length_end = 0
+        if length_field is not None:
+            self._length_field, self._length_end = get_length_field(schema=schema, name=length_field)
+        self._file: IO[bytes] = open(path, "rb")
+        self._mmap: mmap.mmap | None = None
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._bits = input_to_bytes(data=memoryview(self._mmap))
+        else:
+            self._bits = bitarray(endian="little")
+
+    def __iter__(self) -> Iterator[ParseBase]:
+        """Iterate the records in the capture file.
+
+        Returns:
+            record iterator
+        """
+        return self.iter_records()
+
+    def iter_records(self) -> Iterator[ParseBase]:
+        """Iterate the records in the capture file.
+
+        Yields:
+            the schema, parsed from each record in turn
+
+        Raises:
+            IndexError: if the last record is truncated
+        """
+        schema = self._schema
+        length_field = self._length_field
+        offset = 0
+        # the bits are not kept in a local, so that a partly used iterator does not keep the memory map open
+        while offset < len(self._bits):
+            end = schema.parse_at(bits=self._bits, offset=offset)
+            if length_field is not None:
+                end = offset + self._length_end + 8 * (int(length_field.value) + self._length_adjustment)
+                if end > len(self._bits):
+                    raise IndexError("Too little data to parse field.")
+            offset = end
+            yield schema
+
+    def parse_many(self, count: int | None = None, as_numpy: bool = False) -> dict[str, Any]:
+        """Parse the fixed-size records in the capture file into columns, one per sub-field of the schema.
+
+        Args:
+            count: number of records to parse, or None to parse as many complete records as there are
+            as_numpy: if true, return numpy arrays instead of array.array (requires numpy)
+
+        Returns:
+            the columns of values, by sub-field name
+        """
+        return parse_many(schema=self._schema, data=self._bits, count=count, as_numpy=as_numpy)
+
+    def close(self) -> None:
+        """Close the memory map and the capture file.
+
+        The lazily parsed fields of the schema are loaded first, so they can still be used afterwards.
+        The capture file is closed even if the memory map cannot be.
+
+        Raises:
+            BufferError: if bits that refer to the memory map are still in use
+        """
+        self._schema._load_lazy_fields()
+        self._bits = bitarray(endian="little")
+        try:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError as error:
+                    raise BufferError(
+                        "Cannot close the memory map of the capture file while bits taken from it are still in use"
+                    ) from error
+                self._mmap = None
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> CaptureReader:
+        """Use the reader as a context manager that closes it on exit.
+
+        Returns:
+            this reader
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the reader.
+
+        If the block raised an exception, failing to close the memory map does not hide it.
+
+        Args:
+            exc_type: type of the exception that was raised, if any
+            exc_value: the exception that was raised, if any
+            traceback: traceback of the exception that was raised, if any
+
+        Raises:
+            BufferError: if the block did not raise and bits that refer to the memory map are still in use
+        """
+        try:
+            self.close()
+        except BufferError:
+            if exc_type is None:
+                raise
@@ -0,0 +1,147 @@
+"""Split a stream of bytes into frames, whatever the size of the chunks the bytes arrive in."""
+from __future__ import annotations
+
+from typing import Any, Callable, List, cast
+
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.base.parse_generic_value import ParseGenericValue
+
+
+def get_length_field(schema: ParseBase, name: str) -> tuple[ParseGenericValue[Any], int]:
+    """Find the sub-field of a schema that holds the length of a frame.
+
+    Args:
+        schema: the schema
+        name: name of the length field
+
+    Returns:
+        the length field, and the number of bits from the start of the schema to the end of the length field
+
+    Raises:
+        KeyError: if the schema has no sub-field with that name
+    """
+    bit_count = 0
+    for child_name, child in schema._children.items():
+        bit_count += len(child.bits_lsb)
+        if child_name == name:
+            return cast(ParseGenericValue[Any], child), bit_count
+    raise KeyError(name)
+
+
+class StreamFramer:
+    """Split a stream of bytes into frames, whatever the size of the chunks the bytes arrive in.
+
+    Each frame starts with a fixed-size header that has a length field, which holds the number of
+    bytes in the frame after the end of the length field. The header of each frame is parsed as soon
+    as it is complete, and the frame as soon as it is complete, so a frame is never parsed again from
+    the start when more bytes arrive, however the stream is chunked.
+
+    A header whose length field makes the frame longer than the maximum frame size is taken to be
+    corrupt. Since there is then no telling where the next frame starts, all the buffered bytes are
+    dropped, so one bad header cannot stall the stream waiting for bytes that never make a frame.
+    """
+
+    def __init__(
+        self,
+        header: ParseBase,
+        length_field: str,
+        length_adjustment: int = 0,
+        frame_factory: Callable[[ParseBase], ParseBase | None] | None = None,
+        max_frame_bytes: int | None = None,
+    ) -> None:
+        """Create a framer for a stream of bytes.
+
+        Args:
+            header: the fixed-size header that every frame starts with
+            length_field: name of the sub-field of the header that holds the length of each frame
+            length_adjustment: number of bytes to add to the value of the length field (e.g. for a trailing checksum)
+            frame_factory: function that gets the parsed header and returns the (unparsed) field to parse the
+                whole frame into, or None to skip the frame. Defaults to a clone of the header.
+            max_frame_bytes: the number of bytes in the longest valid frame, or None for no limit
+        """
+        self._header = header
+        self._length_field, length_bit_count = get_length_field(schema=header, name=length_field)
+        self._length_byte_count = (length_bit_count + 7) // 8
+        self._header_byte_count = (len(header.bits_lsb) + 7) // 8
+        self._length_adjustment = length_adjustment
+        self._frame_factory = frame_factory
+        self._max_frame_bytes = max_frame_bytes
+        self._buffer = bytearray()
+        self._frame_byte_count: int | None = None
+        self._error_count = 0
+
+    def feed(self, chunk: bytes | bytearray | memoryview) -> List[ParseBase]:
+        """Add a chunk of bytes to the stream and parse the frames that it completes.
+
+        Frames that fail to parse, that the frame factory skips or that are longer than the maximum frame
+        size are dropped and counted as errors.
+
+        Args:
+            chunk: the next bytes of the stream
+
+        Returns:
+            the completed frames, in order
+        """
+        buffer = self._buffer
+        buffer += chunk
+        frames: list[ParseBase] = []
+        start = 0
+        # the parsed bytes are copied out of the buffer, since parsing does not copy them
+        with memoryview(buffer) as view:
+            while True:
+                available = len(buffer) - start
+                if self._frame_byte_count is None:
+                    if available < self._header_byte_count:
+                        break
+                    self._header.parse(bytes(view[start : start + self._header_byte_count]))
+                    length = int(self._length_field.value) + self._length_adjustment
+                    frame_byte_count = max(self._length_byte_count + length, 1)
+                    if self._max_frame_bytes is not None and frame_byte_count > self._max_frame_bytes:
+                        self._error_count += 1
+                        start = len(buffer)
+                        break
+                    self._frame_byte_count = frame_byte_count
+                frame_byte_count = self._frame_byte_count
+                if available < frame_byte_count:
+                    break
+                data = bytes(view[start : start + frame_byte_count])
+                start += frame_byte_count
+                self._frame_byte_count = None
+                if self._frame_factory is None:
+                    frame = self._header.clone()
+                else:
+                    frame = self._frame_factory(self._header)
+                if frame is None:
+                    self._error_count += 1
+                    continue
+                try:
+                    frame.parse(data)
+                except Exception:
+                    self._error_count += 1
+                    continue
+                frames.append(frame)
+        del buffer[:start]
+        return frames
+
+    def reset(self) -> None:
+        """Drop any partially received frame."""
+        self._buffer = bytearray()
+        self._frame_byte_count = None
+
+    @property
+    def buffered(self) -> int:
+        """Get the number of bytes received for frames that are not complete yet.
+
+        Returns:
+            the number of buffered bytes
+        """
+        return len(self._buffer)
+
+    @property
+    def error_count(self) -> int:
+        """Get the number of frames that were dropped because they failed to parse, were skipped or were too long.
+
+        Returns:
+            the number of dropped frames
+        """
+        return self._error_count
@@ -0,0 +1,306 @@
+"""Count events and record timings in process, to be polled as snapshots."""
+from __future__ import annotations
+
+import bisect
+import threading
+import weakref
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+"""Upper bounds of the default histogram buckets, in seconds."""
+
+labelsT = Dict[str, str]
+"""Names and values that break a metric down, e.g. {"function": "ReadCoils"}."""
+
+
+def get_metric_key(name: str, labels: labelsT | None = None) -> str:
+    """Get the key of a metric in a snapshot, which is its name followed by its labels in braces, if any.
+
+    Args:
+        name: name of the metric
+        labels: labels of the metric
+
+    Returns:
+        the key, e.g. modbus_frames_received_total{function="ReadCoils"}
+    """
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in sorted(labels.items())) + "}"
+
+
+class ThreadMarker:
+    """An object kept in the local storage of a thread, which is freed when the thread ends."""
+
+    __slots__ = ("__weakref__",)
+
+
+def retire_counter_cell(lock: threading.Lock, cells: Dict[int, List[int]], retired: List[int], cell: List[int]) -> None:
+    """Add the cell of a thread that has ended to the count of ended threads, and forget the cell.
+
+    Args:
+        lock: lock of the cells
+        cells: the cells of the running threads, by id
+        retired: the count of the threads that have ended
+        cell: the cell of the thread that ended
+    """
+    with lock:
+        retired[0] += cell[0]
+        del cells[id(cell)]
+
+
+class Counter:
+    """A count that only goes up.
+
+    Each thread adds to a cell of its own, and reading the count adds up the cells, so
+    counting never takes a lock and no increments are lost between threads. When a thread
+    ends, its cell is added to a total and dropped, so threads that come and go do not
+    pile up cells.
+    """
+
+    __slots__ = ("_name", "_local", "_lock", "_cells", "_retired")
+
+    def __init__(self, name: str) -> None:
+        """Create a counter at zero.
+
+        Args:
+            name: key of the counter
+        """
+        self._name = name
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells: Dict[int, List[int]] = {}
+        self._retired = [0]
+
+    def _get_cell(self) -> List[int]:
+        """Get the cell that the current thread adds to.
+
+        Returns:
+            the cell
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell: List[int] = [0]
+            with self._lock:
+                self._cells[id(cell)] = cell
+            self._local.cell = cell
+            self._local.marker = marker = ThreadMarker()
+            weakref.finalize(marker, retire_counter_cell, self._lock, self._cells, self._retired, cell)
+            return cell
+
+    def inc(self, amount: int = 1) -> None:
+        """Add to the count.
+
+        Args:
+            amount: the amount to add
+        """
+        self._get_cell()[0] += amount
+
+    @property
+    def name(self) -> str:
+        """Get the key of the counter.
+
+        Returns:
+            the key of the counter
+        """
+        return self._name
+
+    @property
+    def value(self) -> int:
+        """Get the count.
+
+        Returns:
+            the count
+        """
+        with self._lock:
+            return self._retired[0] + sum([cell[0] for cell in self._cells.values()])
+
+
+class HistogramSnapshot(NamedTuple):
+    """The observations of a histogram at one time."""
+
+    buckets: Tuple[float, ...]
+    """Upper bounds of the buckets."""
+    counts: Tuple[int, ...]
+    """Number of observations in each bucket (not cumulative), plus one more for those above the last bound."""
+    count: int
+    """Total number of observations."""
+    sum: float
+    """Sum of the observations."""
+
+
+histogramCellT = Tuple[List[int], List[float]]
+"""The counts and sum of the observations recorded by one thread."""
+
+
+def retire_histogram_cell(
+    lock: threading.Lock,
+    cells: Dict[int, histogramCellT],
+    retired: histogramCellT,
+    cell: histogramCellT,
+) -> None:
+    """Add the cell of a thread that has ended to the observations of ended threads, and forget the cell.
+
+    Args:
+        lock: lock of the cells
+        cells: the cells of the running threads, by id
+        retired: the observations of the threads that have ended
+        cell: the cell of the thread that ended
+    """
+    with lock:
+        counts, total = retired
+        cell_counts, cell_total = cell
+        for index, count in enumerate(cell_counts):
+            counts[index] += count
+        total[0] += cell_total[0]
+        del cells[id(cell)]
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, plus their sum.
+
+    Like counters, each thread records to cells of its own, so observing never takes a lock,
+    and the cells of threads that have ended are added to a total.
+    """
+
+    __slots__ = ("_name", "_buckets", "_local", "_lock", "_cells", "_retired")
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Create an empty histogram.
+
+        Args:
+            name: key of the histogram
+            buckets: upper bounds of the buckets, in increasing order
+
+        Raises:
+            ValueError: if there are no buckets or they are not in increasing order
+        """
+        if len(buckets) == 0 or any(lower >= upper for lower, upper in zip(buckets, buckets[1:])):
+            raise ValueError(f"Histogram {name} buckets must be in increasing order")
+        self._name = name
+        self._buckets = tuple(buckets)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells: Dict[int, histogramCellT] = {}
+        self._retired: histogramCellT = ([0] * (len(self._buckets) + 1), [0.0])
+
+    def _get_cell(self) -> histogramCellT:
+        """Get the counts and sum that the current thread records to.
+
+        Returns:
+            the cell
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell: histogramCellT = ([0] * (len(self._buckets) + 1), [0.0])
+            with self._lock:
+                self._cells[id(cell)] = cell
+            self._local.cell = cell
+            self._local.marker = marker = ThreadMarker()
+            weakref.finalize(marker, retire_histogram_cell, self._lock, self._cells, self._retired, cell)
+            return cell
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: the observation, e.g. a duration in seconds
+        """
+        counts, total = self._get_cell()
+        counts[bisect.bisect_left(self._buckets, value)] += 1
+        total[0] += value
+
+    @property
+    def name(self) -> str:
+        """Get the key of the histogram.
+
+        Returns:
+            the key of the histogram
+        """
+        return self._name
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get the observations so far.
+
+        Returns:
+            the observations
+        """
+        with self._lock:
+            counts, total_cell = self._retired
+            total = total_cell[0]
+            for cell_counts, cell_total in self._cells.values():
+                counts = [count + cell_count for count, cell_count in zip(counts, cell_counts)]
+                total += cell_total[0]
+        return HistogramSnapshot(buckets=self._buckets, counts=tuple(counts), count=sum(counts), sum=total)
+
+
+class MetricsSnapshot(NamedTuple):
+    """The values of all the metrics of a registry at one time."""
+
+    counters: Dict[str, int]
+    """Counts, by key."""
+    histograms: Dict[str, HistogramSnapshot]
+    """Histogram observations, by key."""
+
+
+class MetricsRegistry:
+    """The counters and histograms of a process (or of whatever shares the registry), by name and labels.
+
+    Metrics are created the first time they are asked for, and the same metric is returned after that,
+    so callers can keep a metric to update it without looking it up again.
+    """
+
+    def __init__(self) -> None:
+        """Create a registry without any metrics."""
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def counter(self, name: str, labels: labelsT | None = None) -> Counter:
+        """Get a counter, creating it if needed.
+
+        Args:
+            name: name of the counter
+            labels: labels of the counter
+
+        Returns:
+            the counter
+        """
+        key = get_metric_key(name=name, labels=labels)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, Counter(name=key))
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        labels: labelsT | None = None,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get a histogram, creating it if needed.
+
+        Args:
+            name: name of the histogram
+            labels: labels of the histogram
+            buckets: upper bounds of the buckets, if the histogram is created
+
+        Returns:
+            the histogram
+        """
+        key = get_metric_key(name=name, labels=labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms.setdefault(key, Histogram(name=key, buckets=buckets))
+        return histogram
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get the values of all the metrics.
+
+        Returns:
+            the values, by key
+        """
+        return MetricsSnapshot(
+            counters={key: counter.value for key, counter in list(self._counters.items())},
+            histograms={key: histogram.snapshot() for key, histogram in list(self._histograms.items())},
+        )
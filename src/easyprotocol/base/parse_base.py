@@ -1,20 +1,52 @@
 """The base parsing object for handling parsing in a convenient (to modify) package."""
 from __future__ import annotations
 
-from typing import Literal, Sequence, SupportsBytes, TypeVar
+from typing import Any, Literal, Sequence, SupportsBytes, TypeVar, cast
 
 from bitarray import bitarray
 
-from easyprotocol.base.utils import DEFAULT_ENDIANNESS, dataT, endianT, hex
+from easyprotocol.base.parse_children import ParseChildren
+from easyprotocol.base.parse_numpy import get_numpy_format
+from easyprotocol.base.parse_struct import StructPlan
+from easyprotocol.base.utils import (
+    DEFAULT_ENDIANNESS,
+    dataT,
+    endianT,
+    hex,
+    input_to_bytes,
+)
 
 UNDEFINED = "?UNDEFINED?"
 
 T = TypeVar("T")
+ParseBaseT = TypeVar("ParseBaseT", bound="ParseBase")
+
+SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+"""The names of the slots of each parsing class that has been copied, by class."""
+
+TEMPLATES: dict[type, ParseBase] = {}
+"""The prototype of each parsing class that has been used as a template."""
 
 
 class ParseBase(SupportsBytes):
     """The base parsing object for handling parsing in a convenient (to modify) package."""
 
+    __slots__ = (
+        "_name",
+        "_endian",
+        "_bits",
+        "_bit_count",
+        "_initialized",
+        "_parent",
+        "_children",
+        "_struct_plan",
+        "_bits_cache",
+        "_bytes_cache",
+        "_lazy_bits",
+        "_lazy_offset",
+        "_string_format",
+    )
+
     def __init__(
         self,
         name: str,
@@ -39,7 +71,12 @@ class ParseBase(SupportsBytes):
         self._name = name
         self._initialized = False
         self._parent: ParseBase | None = None
-        self._children: dict[str, ParseBase] = dict()
+        self._children: ParseChildren = self._create_children()
+        self._struct_plan: StructPlan | None = None
+        self._bits_cache: bitarray | None = None
+        self._bytes_cache: bytes | None = None
+        self._lazy_bits: bitarray | None = None
+        self._lazy_offset: int = 0
         if string_format is None:
             self._string_format = "{}"
         else:
@@ -47,14 +84,311 @@ class ParseBase(SupportsBytes):
         if data is not None:
             self.parse(data=data)
 
-    def parse(self, data: dataT) -> bitarray:
+    def _create_children(self) -> ParseChildren:
+        """Create the (empty) sub-field dictionary of this field.
+
+        Returns:
+            the sub-field dictionary
+        """
+        return ParseChildren(owner=self)
+
+    @classmethod
+    def template(cls: type[ParseBaseT]) -> ParseBaseT:
+        """Create an instance of this class by cloning a prototype made with the default arguments.
+
+        The prototype is made the first time a class is used as a template, which requires a
+        class that can be created without arguments. Use clone on an instance of your own
+        for anything else.
+
+        Returns:
+            a new instance of this class
+        """
+        prototype = TEMPLATES.get(cls)
+        if prototype is None:
+            prototype = cls()  # pyright:ignore[reportGeneralTypeIssues]
+            TEMPLATES[cls] = prototype
+        return cast(ParseBaseT, prototype.clone())
+
+    def clone(self: ParseBaseT) -> ParseBaseT:
+        """Create a copy of this field and all of its sub-fields, without calling any constructors.
+
+        The copy has the same structure and bits as this field, but no parent. Bits are never
+        modified in place, so they are shared with the copy until either one is changed.
+
+        Returns:
+            a copy of this field
+        """
+        memo: dict[int, ParseBase] = {}
+        return cast(ParseBaseT, self._clone(memo=memo))
+
+    def _clone(self, memo: dict[int, ParseBase]) -> ParseBase:
+        """Create a copy of this field and all of its sub-fields, without calling any constructors.
+
+        Args:
+            memo: the copies made so far, by the id of the field they were copied from
+
+        Returns:
+            a copy of this field
+        """
+        cls = type(self)
+        other = cls.__new__(cls)
+        memo[id(self)] = other
+        names = SLOT_NAMES.get(cls)
+        if names is None:
+            names = get_slot_names(cls)
+        for name in names:
+            try:
+                setattr(other, name, getattr(self, name))
+            except AttributeError:
+                # slots that are not set are skipped
+                pass
+        state = getattr(self, "__dict__", None)
+        if state is not None:
+            other.__dict__.update(state)
+        other._parent = None
+        other._children = other._create_children()
+        if len(self._children) > 0:
+            other._children.replace({key: child._clone(memo=memo) for key, child in self._children.items()})
+            if self._struct_plan is not None:
+                other._struct_plan = self._struct_plan.copy_for(fields=list(other._children.values()))
+            other._bits_cache = self._bits_cache
+            other._bytes_cache = self._bytes_cache
+        return other
+
+    def parse(self, data: dataT, validate_checksum: bool = False) -> bitarray:
         """Parse the passed bits or bytes into meaningful data.
 
+        This is a thin wrapper around parse_at, which does the actual work.
+
         Args:
             data: bits or bytes to be parsed
+            validate_checksum: if true, check the checksum sub-fields of this field against the bytes
+                that were parsed, without serializing this field again
+
+        Returns:
+            any leftover bits after parsing the ones belonging to this field
+        """
+        bits = input_to_bytes(
+            data=data,
+            bit_count=self._bit_count,
+        )
+        offset = self.parse_at(bits=bits, offset=0)
+        if validate_checksum:
+            with memoryview(bits) as frame:
+                self._validate_checksums(frame=frame[: offset // 8])
+        return bits[offset:]
+
+    def _validate_checksums(self, frame: memoryview) -> None:
+        """Check the checksum sub-fields of this field, and of all the fields it holds, against the parsed bytes.
+
+        Each sub-field is passed the bytes of the field that holds it, so nested frames are checked
+        against their own bytes. Sub-fields that do not start and end on a byte boundary are skipped,
+        since a checksum only covers whole bytes.
+
+        Args:
+            frame: the parsed bytes of this field
+        """
+        bit_offset = 0
+        for child in self._children.values():
+            bit_count = len(child.bits_lsb)
+            if bit_offset % 8 == 0 and bit_count % 8 == 0:
+                start = bit_offset // 8
+                end = start + bit_count // 8
+                child._validate_checksum(frame=frame, start=start, end=end)
+                if len(child._children) > 0:
+                    child._validate_checksums(frame=frame[start:end])
+            bit_offset += bit_count
+
+    def _validate_checksum(self, frame: memoryview, start: int, end: int) -> None:
+        """Check that the value of this field is the checksum of the frame holding it.
+
+        Only checksum fields have anything to check.
+
+        Args:
+            frame: the parsed bytes of the field that holds this field
+            start: byte offset of this field in the frame
+            end: byte offset just past the end of this field in the frame
+        """
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse this field from a shared buffer of bits, starting at the bit offset.
+
+        Parsing with a cursor means the buffer is never copied between fields, so
+        parsing a frame is linear in the size of the frame.
+
+        Sub-classes that only override parse are still supported by this default
+        implementation, but it has to copy the remaining bits to do so.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+
+        Raises:
+            NotImplementedError: if neither parse nor parse_at is implemented for this field
+        """
+        if type(self).parse is ParseBase.parse:
+            raise NotImplementedError()
+        leftover = self.parse(data=bits[offset:])
+        return len(bits) - len(leftover)
+
+    def _parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Parse this field from a shared buffer of bits, deferring decoding until it is needed.
+
+        Fields that support lazy parsing only record where they are in the buffer, and are
+        decoded the first time their value or bits are requested. All other fields are parsed
+        immediately. The buffer must not be modified while it is referenced by lazy fields.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+
+        Raises:
+            IndexError: if there is too little data to parse this field
+        """
+        bit_count = self._get_lazy_bit_count()
+        if bit_count is None:
+            return self.parse_at(bits=bits, offset=offset)
+        end = offset + bit_count
+        if len(bits) < end:
+            raise IndexError("Too little data to parse field.")
+        self._bits = None  # pyright:ignore[reportGeneralTypeIssues]
+        self._lazy_bits = bits
+        self._lazy_offset = offset
+        return end
+
+    def _uses_default_codec(self, codec: type[ParseBase]) -> bool:
+        """Check that this field parses and serializes its bits with the methods of a field class.
+
+        The struct module and lazy parsing fast paths decode and encode fields without calling parse,
+        parse_at or get_bits_lsb, so they are only used for fields that do not override any of them.
+        The values they pack come from the get_value method of the field class itself, so overriding
+        get_value does not change the bits, as with get_bits_lsb.
+
+        Args:
+            codec: the field class whose methods the fast paths stand in for
+
+        Returns:
+            true if this field does not override the methods that the fast paths skip
+        """
+        cls = type(self)
+        return (
+            cls.parse is ParseBase.parse and cls.parse_at is codec.parse_at and cls.get_bits_lsb is codec.get_bits_lsb
+        )
+
+    def _get_lazy_bit_count(self) -> int | None:
+        """Get the number of bits this field takes up when it is parsed lazily.
+
+        Returns:
+            the bit count, or None if this field cannot be parsed lazily
+        """
+        return None
+
+    def _load_lazy_bits(self) -> bitarray:
+        """Slice the bits of this field out of the buffer it was lazily parsed from.
+
+        Returns:
+            lsb bits
+        """
+        lazy_bits = cast(bitarray, self._lazy_bits)
+        self._bits = lazy_bits[self._lazy_offset : self._lazy_offset + self._bit_count]
+        self._lazy_bits = None
+        return self._bits
+
+    def _load_lazy_fields(self) -> None:
+        """Slice the bits of this field and of all its sub-fields out of the buffers they were lazily parsed from.
+
+        Afterwards none of these fields refers to those buffers, so the buffers can be changed or released.
+        """
+        if self._lazy_bits is not None:
+            self._load_lazy_bits()
+        for child in self._children.values():
+            child._load_lazy_fields()
+
+    def _get_struct_plan(self) -> StructPlan:
+        """Get the compiled parsing plan for the current children of this field.
+
+        The plan is rebuilt after the children of this field have changed.
+
+        Returns:
+            the compiled parsing plan
+        """
+        plan = self._struct_plan
+        if plan is None:
+            plan = StructPlan(fields=list(self._get_children().values()))
+            self._struct_plan = plan
+        return plan
+
+    def _get_children_bits_lsb(self) -> bitarray:
+        """Get the bits of the children of this field, serializing them only if they changed.
+
+        Returns:
+            lsb bits
+        """
+        bits = self._bits_cache
+        if bits is None:
+            bits = self._get_struct_plan().get_bits_lsb()
+            self._bits_cache = bits
+        return bits
+
+    def _invalidate_bits_cache(self) -> None:
+        """Drop the cached bits of this field and of all the fields that contain it.
+
+        The walk always goes up to the root. A field without cached bits can still be held by fields
+        that have them, e.g. when it overrides get_bits_lsb and never fills its cache.
+        """
+        self._bits_cache = None
+        self._bytes_cache = None
+        parent = self._parent
+        while parent is not None:
+            parent._bits_cache = None
+            parent._bytes_cache = None
+            parent = parent._parent
+
+    def _on_children_changed(self) -> None:
+        """Drop everything cached about the children of this field after they were added, replaced or removed."""
+        self._struct_plan = None
+        self._invalidate_bits_cache()
+
+    def _get_struct_format(self) -> str | None:
+        """Get the struct module format (including byte order) of this field.
+
+        Returns:
+            the struct format, or None if this field cannot be decoded by the struct module
+        """
+        return None
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy data type description of this field.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        return get_numpy_format(self._get_struct_format())
+
+    def _get_struct_value(self) -> Any:
+        """Get the raw value of this field to be packed by the struct module.
+
+        Raises:
+            NotImplementedError: for fields that do not have a struct format
+        """
+        raise NotImplementedError()
+
+    def _set_struct_value(self, value: Any, bits: bitarray, offset: int) -> None:
+        """Set this field from a raw value that was unpacked by the struct module.
+
+        Args:
+            value: the raw unpacked value
+            bits: the buffer the value was unpacked from
+            offset: bit offset of this field in the buffer
 
         Raises:
-            NotImplementedError: if not implemented for this field
+            NotImplementedError: for fields that do not have a struct format
         """
         raise NotImplementedError()
 
@@ -80,6 +414,8 @@ class ParseBase(SupportsBytes):
         Returns:
             lsb bits
         """
+        if self._bits is None:
+            return self._load_lazy_bits()
         return self._bits
 
     def get_bits_msb(self) -> bitarray:
@@ -113,23 +449,36 @@ class ParseBase(SupportsBytes):
     def _set_parent_generic(self, parent: ParseBase | None) -> None:
         self._parent = parent
 
-    def _get_children_generic(self) -> dict[str, ParseBase]:
+    def _get_children(self) -> ParseChildren:
+        """Get the sub-field dictionary of this field, creating any sub-fields that were put off.
+
+        Fields that decode all of their sub-fields at once (such as arrays of numbers) only create
+        the sub-field objects when something needs them, by overriding this. Anything that uses the
+        sub-fields themselves gets them from here rather than from _children.
+
+        Returns:
+            the sub-field dictionary
+        """
         return self._children
 
+    def _get_children_generic(self) -> dict[str, ParseBase]:
+        return self._get_children()
+
     def _set_children_generic(
         self,
         children: dict[str, ParseBase] | Sequence[ParseBase],
     ) -> None:
-        self._children.clear()
+        own_children = self._get_children()
+        own_children.clear()
         if isinstance(children, (dict, dict)):
             keys = list(children.keys())
             for key in keys:
                 value = children[key]
-                self._children[key] = value
+                own_children[key] = value
                 value._set_parent_generic(self)
         elif isinstance(children, list):
             for value in children:
-                self._children[value._name] = value
+                own_children[value._name] = value
                 value._set_parent_generic(self)
 
     def get_string_value(self) -> str:
@@ -266,7 +615,12 @@ class ParseBase(SupportsBytes):
         Returns:
             the bytes of this field
         """
-        return self.get_bits_lsb().tobytes()
+        data = self._bytes_cache
+        if data is None:
+            data = self.get_bits_lsb().tobytes()
+            if self._bits_cache is not None:
+                self._bytes_cache = data
+        return data
 
     def __str__(self) -> str:
         """Get a nicely formatted string describing this field.
@@ -283,3 +637,28 @@ class ParseBase(SupportsBytes):
             a nicely formatted string describing this field
         """
         return f"<{self.__class__.__name__}> {self.__str__()}"
+
+
+def get_slot_names(cls: type) -> tuple[str, ...]:
+    """Get the names of all the slots of a class, including those of its base classes.
+
+    The names are looked up once per class and kept in SLOT_NAMES.
+
+    Args:
+        cls: the class
+
+    Returns:
+        the (mangled) slot names
+    """
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = vars(klass).get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = f"_{klass.__name__.lstrip('_')}{slot}"
+            if slot not in ("__dict__", "__weakref__"):
+                names.append(slot)
+    SLOT_NAMES[cls] = tuple(names)
+    return SLOT_NAMES[cls]
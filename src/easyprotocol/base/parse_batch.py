@@ -0,0 +1,149 @@
+"""Parse many consecutive records of the same layout into columns of values."""
+from __future__ import annotations
+
+import array
+from typing import Any, Dict, List, Union, cast
+
+from bitarray import bitarray
+
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.base.parse_numpy import get_numpy_dtype
+from easyprotocol.base.parse_struct import StructRun
+from easyprotocol.base.utils import dataT, input_to_bytes
+
+columnT = Union["array.array[Any]", List[Any]]
+
+ARRAY_TYPECODES: dict[str, str] = {
+    "b": "b",
+    "B": "B",
+    "h": "h",
+    "H": "H",
+    "i": "i",
+    "I": "I",
+    "q": "q",
+    "Q": "Q",
+    "e": "f",
+    "f": "f",
+    "d": "d",
+}
+"""The array module type code to store the values of each struct module format character in."""
+
+
+def parse_many(
+    schema: ParseBase,
+    data: dataT,
+    count: int | None = None,
+    as_numpy: bool = False,
+) -> dict[str, Any]:
+    """Parse consecutive records that are laid out like the sub-fields of a schema into columns.
+
+    There is one column per sub-field, keyed by name. Sub-fields that the struct module can decode
+    get array.array columns holding their raw values (so enum fields hold integers); all other
+    sub-fields get list columns. When every sub-field can be decoded by the struct module, all
+    records are decoded with a single struct.iter_unpack call, otherwise each record is parsed into
+    a copy of the schema. Either way, no field objects are created per record and the schema itself
+    is left untouched.
+
+    When numpy arrays are requested and the schema can be described by a numpy dtype, all records
+    are decoded with a single numpy.frombuffer call instead, and the columns are views of the result.
+
+    Args:
+        schema: the field whose sub-fields describe the layout of one record
+        data: bits or bytes holding the records
+        count: number of records to parse, or None to parse as many complete records as there are
+        as_numpy: if true, return numpy arrays instead of array.array (requires numpy)
+
+    Returns:
+        the columns of values, by sub-field name
+    """
+    bits = input_to_bytes(data=data)
+    if as_numpy:
+        spec = schema._get_numpy_dtype()
+        if isinstance(spec, list):
+            return _parse_many_numpy(schema=schema, bits=bits, count=count)
+    children = list(schema._children.items())
+    plan = schema._get_struct_plan()
+    if len(children) > 0 and len(plan.steps) == 1 and isinstance(plan.steps[0], StructRun):
+        columns = _parse_many_struct(run=plan.steps[0], names=[name for name, _ in children], bits=bits, count=count)
+    else:
+        columns = _parse_many_fields(schema=schema, bits=bits, count=count)
+    if as_numpy:
+        import numpy
+
+        return {name: numpy.asarray(column) for name, column in columns.items()}
+    return columns
+
+
+def _parse_many_numpy(schema: ParseBase, bits: bitarray, count: int | None) -> dict[str, Any]:
+    import numpy
+
+    dtype = get_numpy_dtype(schema)
+    if count is None:
+        count = len(bits) // (dtype.itemsize * 8)
+    elif len(bits) < count * dtype.itemsize * 8:
+        raise IndexError("Too little data to parse field.")
+    records = numpy.frombuffer(bits, dtype=dtype, count=count)
+    return {name: records[name] for name in dtype.names}
+
+
+def _parse_many_struct(run: StructRun, names: list[str], bits: bitarray, count: int | None) -> Dict[str, columnT]:
+    size = run.struct.size
+    if count is None:
+        count = len(bits) // run.bit_count
+    elif len(bits) < count * run.bit_count:
+        raise IndexError("Too little data to parse field.")
+    with memoryview(bits) as view:  # pyright:ignore[reportGeneralTypeIssues]
+        rows = run.struct.iter_unpack(view[: count * size])
+        values = list(zip(*rows))
+    columns: Dict[str, columnT] = {}
+    for index, (name, field) in enumerate(zip(names, run.fields)):
+        typecode = ARRAY_TYPECODES.get(cast(str, field._get_struct_format())[-1])
+        column = values[index] if len(values) > 0 else ()
+        if typecode is None:
+            columns[name] = list(column)
+        else:
+            columns[name] = array.array(typecode, column)
+    return columns
+
+
+def _parse_many_fields(schema: ParseBase, bits: bitarray, count: int | None) -> Dict[str, columnT]:
+    scratch = schema.clone()
+    children = list(scratch._children.items())
+    columns: Dict[str, columnT] = {}
+    raw: list[bool] = []
+    for name, field in children:
+        fmt = field._get_struct_format()
+        typecode = None if fmt is None else ARRAY_TYPECODES.get(fmt[-1])
+        columns[name] = [] if typecode is None else array.array(typecode)
+        raw.append(typecode is not None)
+    offset = 0
+    bit_length = len(bits)
+    index = 0
+    while (count is None and offset < bit_length) or (count is not None and index < count):
+        try:
+            offset = scratch.parse_at(bits=bits, offset=offset)
+        except IndexError:
+            if count is not None:
+                raise
+            break
+        for (name, field), is_raw in zip(children, raw):
+            columns[name].append(field._get_struct_value() if is_raw else get_plain_value(field))
+        index += 1
+    return columns
+
+
+def get_plain_value(field: ParseBase) -> Any:
+    """Get the value of a field with any sub-fields replaced by their own values.
+
+    Args:
+        field: the field
+
+    Returns:
+        the value, made up of plain python objects only
+    """
+    value = getattr(field, "value")
+    if isinstance(value, dict):
+        return {key: get_plain_value(item) for key, item in cast(Dict[str, ParseBase], value).items()}
+    if isinstance(value, list) and len(value) > 0 and isinstance(value[0], ParseBase):
+        return [get_plain_value(item) for item in cast(List[ParseBase], value)]
+    return value
@@ -0,0 +1,328 @@
+"""The dictionary that holds the sub-fields of a parse object."""
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Any, Dict, Mapping, SupportsIndex, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from easyprotocol.base.parse_base import ParseBase
+
+
+class ParseChildren(Dict[str, "ParseBase"]):
+    """The sub-fields of a parse object, keyed by name.
+
+    The owning object is notified whenever a sub-field is added, replaced or removed, so that it can
+    drop anything it has cached about its sub-fields. Added sub-fields have their parent set to the owner.
+
+    The names and sub-fields are also kept in lists, built the first time they are looked up by index, so
+    that positional access is constant-time. The lists are updated in place by the positional methods
+    (set_at, insert_at and del_at), which never touch the other sub-fields. Removing sub-fields by name
+    drops the lists until they are needed again.
+    """
+
+    __slots__ = ("_owner", "_keys", "_values", "_positions")
+
+    def __init__(self, owner: ParseBase) -> None:
+        """Create the (empty) sub-field dictionary of a parse object.
+
+        Args:
+            owner: the parse object that these are the sub-fields of
+        """
+        super().__init__()
+        self._owner = owner
+        self._keys: list[str] | None = None
+        self._values: list[ParseBase] | None = None
+        self._positions: dict[str, int] | None = None
+
+    def get_list(self) -> list[ParseBase]:
+        """Get the sub-fields in order, to look them up by index.
+
+        The list must not be modified.
+
+        Returns:
+            the sub-fields
+        """
+        values = self._values
+        if values is None:
+            values = self._values = list(super().values())
+            self._keys = list(super().keys())
+        return values
+
+    def get_keys(self) -> list[str]:
+        """Get the names of the sub-fields in order, to look them up by index.
+
+        The list must not be modified.
+
+        Returns:
+            the names of the sub-fields
+        """
+        if self._keys is None:
+            self.get_list()
+        return cast("list[str]", self._keys)
+
+    def _get_positions(self) -> dict[str, int]:
+        """Get the index of each sub-field, by name.
+
+        Returns:
+            the index of each sub-field
+        """
+        positions = self._positions
+        if positions is None:
+            keys = self.get_keys()
+            positions = self._positions = dict(zip(keys, range(len(keys))))
+        return positions
+
+    def _forget_order(self) -> None:
+        """Drop the lists of sub-fields after sub-fields are removed or reordered."""
+        self._keys = None
+        self._values = None
+        self._positions = None
+
+    def _reorder(self, keys: list[str], values: list[ParseBase]) -> None:
+        """Rebuild the dictionary in a new order, without notifying anything.
+
+        Args:
+            keys: the names of the sub-fields, in order
+            values: the sub-fields, in order
+        """
+        super().clear()
+        super().update(zip(keys, values))
+        if len(self) == len(keys):
+            self._keys = keys
+            self._values = values
+            self._positions = None
+        else:
+            self._forget_order()
+
+    def __setitem__(self, key: str, value: ParseBase) -> None:
+        """Add or replace a sub-field.
+
+        Args:
+            key: name of the sub-field
+            value: the sub-field
+        """
+        values = self._values
+        keys = self._keys
+        if values is not None and keys is not None:
+            if key in self:
+                values[self._get_positions()[key]] = value
+            else:
+                positions = self._positions
+                if positions is not None:
+                    positions[key] = len(values)
+                keys.append(key)
+                values.append(value)
+        super().__setitem__(key, value)
+        value._set_parent_generic(self._owner)
+        self._owner._on_children_changed()
+
+    def set_at(self, index: SupportsIndex, key: str, value: ParseBase) -> ParseBase:
+        """Replace the sub-field at an index.
+
+        Args:
+            index: index of the sub-field
+            key: name of the new sub-field
+            value: the new sub-field
+
+        Returns:
+            the replaced sub-field
+        """
+        keys = self.get_keys()
+        values = self.get_list()
+        old = values[index]
+        if keys[index] == key:
+            self[key] = value
+            return old
+        keys[index] = key
+        values[index] = value
+        self._reorder(keys=keys, values=values)
+        value._set_parent_generic(self._owner)
+        self._owner._on_children_changed()
+        return old
+
+    def insert_at(self, index: SupportsIndex, key: str, value: ParseBase) -> None:
+        """Insert a sub-field before an index, like list.insert.
+
+        A sub-field with the same name is removed first.
+
+        Args:
+            index: the index to insert the sub-field before
+            key: name of the new sub-field
+            value: the new sub-field
+        """
+        if key in self:
+            self.del_at(self._get_positions()[key])
+        if operator.index(index) >= len(self):
+            self[key] = value
+            return
+        keys = self.get_keys()
+        values = self.get_list()
+        keys.insert(index, key)
+        values.insert(index, value)
+        self._reorder(keys=keys, values=values)
+        value._set_parent_generic(self._owner)
+        self._owner._on_children_changed()
+
+    def del_at(self, index: SupportsIndex) -> ParseBase:
+        """Remove the sub-field at an index.
+
+        Args:
+            index: index of the sub-field
+
+        Returns:
+            the removed sub-field
+        """
+        keys = self.get_keys()
+        values = self.get_list()
+        value = values[index]
+        super().__delitem__(keys[index])
+        del keys[index]
+        del values[index]
+        self._positions = None
+        self._owner._on_children_changed()
+        return value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a sub-field.
+
+        Args:
+            key: name of the sub-field
+        """
+        super().__delitem__(key)
+        self._forget_order()
+        self._owner._on_children_changed()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove a sub-field and return it.
+
+        Args:
+            key: name of the sub-field
+            default: optional value to return if there is no such sub-field
+
+        Returns:
+            the removed sub-field (or default)
+        """
+        value = super().pop(key, *default)
+        self._forget_order()
+        self._owner._on_children_changed()
+        return value
+
+    def popitem(self) -> tuple[str, ParseBase]:
+        """Remove the last sub-field and return it with its name.
+
+        Returns:
+            the name and sub-field
+        """
+        item = super().popitem()
+        self._forget_order()
+        self._owner._on_children_changed()
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get a sub-field, adding it first if there is no sub-field with that name.
+
+        Args:
+            key: name of the sub-field
+            default: the sub-field to add if there is no sub-field with that name
+
+        Returns:
+            the sub-field
+        """
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add or replace several sub-fields.
+
+        Args:
+            args: mapping or iterable of name and sub-field pairs
+            kwargs: sub-fields by name
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> ParseChildren:  # pyright:ignore[reportIncompatibleMethodOverride]
+        """Add or replace several sub-fields.
+
+        Args:
+            other: mapping or iterable of name and sub-field pairs
+
+        Returns:
+            this dictionary
+        """
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        """Remove all sub-fields."""
+        super().clear()
+        self._forget_order()
+        self._owner._on_children_changed()
+
+    def replace(self, children: Mapping[str, ParseBase]) -> None:
+        """Replace all sub-fields at once.
+
+        Args:
+            children: the new sub-fields, by name
+        """
+        super().clear()
+        self._forget_order()
+        for key, value in children.items():
+            super().__setitem__(key, value)
+            value._set_parent_generic(self._owner)
+        self._owner._on_children_changed()
+
+
+class NoChildren(ParseChildren):
+    """The sub-fields of fields that cannot have sub-fields, which are always empty.
+
+    One instance is shared by all such fields, so it has no owner. Adding a sub-field raises TypeError,
+    and removing sub-fields finds nothing to remove.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Create the empty sub-field dictionary."""
+        super().__init__(owner=cast("ParseBase", None))
+
+    def __setitem__(self, key: str, value: ParseBase) -> None:
+        """Refuse to add a sub-field.
+
+        Args:
+            key: name of the sub-field
+            value: the sub-field
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError(f"Cannot add sub-field {key}, this field cannot have sub-fields")
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Get the default value, since there is no sub-field to remove.
+
+        Args:
+            key: name of the sub-field
+            default: optional value to return
+
+        Returns:
+            the default value
+        """
+        return dict.pop(self, key, *default)
+
+    def clear(self) -> None:
+        """Do nothing, since there are no sub-fields to remove."""
+
+    def replace(self, children: Mapping[str, ParseBase]) -> None:
+        """Replace all sub-fields at once, which only works when there are no new sub-fields.
+
+        Args:
+            children: the new sub-fields, by name
+        """
+        for key, value in children.items():
+            self[key] = value
+
+
+NO_CHILDREN = NoChildren()
+"""The shared, read-only sub-fields of fields that cannot have sub-fields."""
@@ -7,10 +7,12 @@ from typing import Any, Generic, Iterator, Mapping, Sequence, Union, cast
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, ParseBase, endianT
+from easyprotocol.base.parse_batch import parse_many
 from easyprotocol.base.parse_generic_dict import K, ParseGenericDict
 from easyprotocol.base.parse_generic_list import ParseGenericList
 from easyprotocol.base.parse_generic_value import ParseGenericValue, T
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.parse_numpy import get_numpy_fields
+from easyprotocol.base.utils import copy_mutable_data, dataT
 
 parseGenericT = Union[ParseGenericValue[T], ParseGenericDict[K, T], ParseGenericList[T]]
 
@@ -22,6 +24,8 @@ class ParseFieldDictGeneric(
 ):
     """The base parsing object for handling parsing in a convenient package."""
 
+    __slots__ = ("_lazy",)
+
     def __init__(
         self,
         name: str,
@@ -34,6 +38,7 @@ class ParseFieldDictGeneric(
         bit_count: int = -1,
         string_format: str | None = None,
         endian: endianT = DEFAULT_ENDIANNESS,
+        lazy: bool = False,
     ) -> None:
         """Create the base parsing object for handling parsing in a convenient package.
 
@@ -44,7 +49,11 @@ class ParseFieldDictGeneric(
             bit_count: number of bits assigned to this field
             string_format: python format string (e.g. "{}")
             endian: the byte endian-ness of this object
+            lazy: if true, sub-fields are only decoded when they are accessed. Lazy sub-fields keep a
+                reference to the parsed data, so parse copies a bytearray, writable memoryview or bitarray
+                once per frame instead of importing it without copying
         """
+        self._lazy = lazy
         super().__init__(
             name=name,
             data=None,
@@ -58,19 +67,94 @@ class ParseFieldDictGeneric(
         if data is not None:
             self.parse(data)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse(self, data: dataT, validate_checksum: bool = False) -> bitarray:
+        """Parse the passed bits or bytes into meaningful data.
+
+        In lazy mode, modifiable data is copied first, so that changing or resizing it later does not
+        affect the sub-fields that have not been decoded yet.
 
         Args:
-            data: bytes to be parsed
+            data: bits or bytes to be parsed
+            validate_checksum: if true, check the checksum sub-fields of this field against the bytes
+                that were parsed, without serializing this field again
 
         Returns:
             any leftover bits after parsing the ones belonging to this field
         """
-        bit_data = input_to_bytes(data=data)
-        for field in self._children.values():
-            bit_data = field.parse(data=bit_data)
-        return bit_data
+        if self._lazy:
+            data = copy_mutable_data(data)
+        return super().parse(data=data, validate_checksum=validate_checksum)
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        return self._parse_children_at(bits=bits, offset=offset, lazy=self._lazy)
+
+    def _parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Record where each sub-field is in a shared buffer of bits, decoding them only when accessed.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        if type(self).parse_at is not ParseFieldDictGeneric.parse_at:
+            return self.parse_at(bits=bits, offset=offset)
+        return self._parse_children_at(bits=bits, offset=offset, lazy=True)
+
+    def _parse_children_at(self, bits: bitarray, offset: int, lazy: bool) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits, or only record where they are.
+
+        This never calls back into parse_at, so sub-classes can override parse_at and call this
+        class's parse_at from it, lazily or not.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+            lazy: if true, the sub-fields are only decoded when they are accessed
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        self._invalidate_bits_cache()
+        if lazy:
+            return self._get_struct_plan().parse_lazy_at(bits=bits, offset=offset)
+        return self._get_struct_plan().parse_at(bits=bits, offset=offset)
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy structured data type description of this field.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        if type(self).parse_at is not ParseFieldDictGeneric.parse_at:
+            return None
+        return get_numpy_fields(children=self._children)
+
+    def parse_many(self, data: dataT, count: int | None = None, as_numpy: bool = False) -> dict[str, Any]:
+        """Parse consecutive records that are laid out like the sub-fields of this field into columns.
+
+        There is one column of values per sub-field, keyed by name. This field is not modified,
+        and no field objects are created per record.
+
+        Args:
+            data: bits or bytes holding the records
+            count: number of records to parse, or None to parse as many complete records as there are
+            as_numpy: if true, return numpy arrays instead of array.array (requires numpy)
+
+        Returns:
+            the columns of values, by sub-field name
+        """
+        return parse_many(schema=self, data=data, count=count, as_numpy=as_numpy)
 
     def popitem(self) -> tuple[K, parseGenericT[K, T]]:
         """Remove item from list.
@@ -139,11 +223,7 @@ class ParseFieldDictGeneric(
         Returns:
             lsb bits
         """
-        data = bitarray(endian="little")
-        values = list(self._children.values())
-        for value in values:
-            data += value.bits_lsb
-        return data
+        return self._get_children_bits_lsb()
 
     def get_children(self) -> dict[str, parseGenericT[str, Any]]:
         """Get the children of this field as an ordered dictionary.
@@ -217,6 +297,22 @@ class ParseFieldDictGeneric(
     ) -> None:
         self.set_value(value)
 
+    @property
+    def lazy(self) -> bool:
+        """Get whether sub-fields are only decoded when they are accessed.
+
+        Lazy sub-fields keep a reference to the parsed bits. Bits passed to parse_at are shared with them,
+        so they must not be modified while those sub-fields are in use.
+
+        Returns:
+            true if sub-fields are parsed lazily
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool) -> None:
+        self._lazy = value
+
     @property
     def parent(self) -> parseGenericT[str, Any] | None:
         """Get the field (if any) that is this field's parent.
@@ -295,4 +391,4 @@ class ParseFieldDictGeneric(
 class ParseFieldDict(ParseFieldDictGeneric[str, Any]):
     """The base field dictionary."""
 
-    ...
+    __slots__ = ()
@@ -17,10 +17,12 @@ from typing import (
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, ParseBase, T, endianT
+from easyprotocol.base.parse_batch import parse_many
 from easyprotocol.base.parse_generic_dict import K, ParseGenericDict
 from easyprotocol.base.parse_generic_list import ParseGenericList
 from easyprotocol.base.parse_generic_value import ParseGenericValue
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.parse_numpy import get_numpy_fields
+from easyprotocol.base.utils import copy_mutable_data, dataT
 
 parseGenericT = Union[ParseGenericValue[T], ParseGenericDict[K, T], ParseGenericList[T]]
 valueGenericT = Union[T, Mapping[K, T], Sequence[T]]
@@ -33,6 +35,8 @@ class ParseFieldListGeneric(
 ):
     """The base generic field dictionary."""
 
+    __slots__ = ("_lazy",)
+
     def __init__(
         self,
         name: str,
@@ -44,6 +48,7 @@ class ParseFieldListGeneric(
         bit_count: int = -1,
         string_format: str = "{}",
         endian: endianT = DEFAULT_ENDIANNESS,
+        lazy: bool = False,
     ) -> None:
         """Create a generic field dictionary.
 
@@ -54,7 +59,11 @@ class ParseFieldListGeneric(
             bit_count: number of bits assigned to this field
             string_format: python format string (e.g. "{}")
             endian: the byte endian-ness of this object
+            lazy: if true, sub-fields are only decoded when they are accessed. Lazy sub-fields keep a
+                reference to the parsed data, so parse copies a bytearray, writable memoryview or bitarray
+                once per frame instead of importing it without copying
         """
+        self._lazy = lazy
         super().__init__(
             name=name,
             data=None,
@@ -69,19 +78,94 @@ class ParseFieldListGeneric(
         elif default is not None:
             self.set_value(default)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse(self, data: dataT, validate_checksum: bool = False) -> bitarray:
+        """Parse the passed bits or bytes into meaningful data.
+
+        In lazy mode, modifiable data is copied first, so that changing or resizing it later does not
+        affect the sub-fields that have not been decoded yet.
 
         Args:
-            data: bytes to be parsed
+            data: bits or bytes to be parsed
+            validate_checksum: if true, check the checksum sub-fields of this field against the bytes
+                that were parsed, without serializing this field again
 
         Returns:
             any leftover bits after parsing the ones belonging to this field
         """
-        bit_data = input_to_bytes(data=data)
-        for field in self._children.values():
-            bit_data = field.parse(data=bit_data)
-        return bit_data
+        if self._lazy:
+            data = copy_mutable_data(data)
+        return super().parse(data=data, validate_checksum=validate_checksum)
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        return self._parse_children_at(bits=bits, offset=offset, lazy=self._lazy)
+
+    def _parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Record where each sub-field is in a shared buffer of bits, decoding them only when accessed.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        if type(self).parse_at is not ParseFieldListGeneric.parse_at:
+            return self.parse_at(bits=bits, offset=offset)
+        return self._parse_children_at(bits=bits, offset=offset, lazy=True)
+
+    def _parse_children_at(self, bits: bitarray, offset: int, lazy: bool) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits, or only record where they are.
+
+        This never calls back into parse_at, so sub-classes can override parse_at and call this
+        class's parse_at from it, lazily or not.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+            lazy: if true, the sub-fields are only decoded when they are accessed
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        self._invalidate_bits_cache()
+        if lazy:
+            return self._get_struct_plan().parse_lazy_at(bits=bits, offset=offset)
+        return self._get_struct_plan().parse_at(bits=bits, offset=offset)
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy structured data type description of this field.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        if type(self).parse_at is not ParseFieldListGeneric.parse_at:
+            return None
+        return get_numpy_fields(children=self._get_children())
+
+    def parse_many(self, data: dataT, count: int | None = None, as_numpy: bool = False) -> dict[str, Any]:
+        """Parse consecutive records that are laid out like the sub-fields of this field into columns.
+
+        There is one column of values per sub-field, keyed by name. This field is not modified,
+        and no field objects are created per record.
+
+        Args:
+            data: bits or bytes holding the records
+            count: number of records to parse, or None to parse as many complete records as there are
+            as_numpy: if true, return numpy arrays instead of array.array (requires numpy)
+
+        Returns:
+            the columns of values, by sub-field name
+        """
+        return parse_many(schema=self, data=data, count=count, as_numpy=as_numpy)
 
     def insert(self, index: SupportsIndex, value: parseGenericT[K, T]) -> None:
         """Insert a new field into this list.
@@ -90,12 +174,7 @@ class ParseFieldListGeneric(
             index: the index at which the new field will be inserted
             value: the new field to be inserted
         """
-        c: dict[str, ParseBase] = dict()
-        existing_values = list(self._children.values())
-        existing_values.insert(index, value)
-        for v in existing_values:
-            c[v.name] = v
-        self.children = cast(dict[str, parseGenericT[K, T]], c)
+        self._get_children().insert_at(index=index, key=value._name, value=value)
 
     def append(self, value: parseGenericT[K, T] | Any) -> None:
         """Append a new field to this list.
@@ -126,11 +205,12 @@ class ParseFieldListGeneric(
         Args:
             value: the new list of fields or dictionary of fields to assign to this field
         """
+        children = self._get_children()
         if isinstance(value, (dict, dict)):
             values = list(value.values())
             for index, (key, item) in enumerate(value.items()):
                 item = values[index]
-                if index < len(self._children):
+                if index < len(children):
                     if isinstance(item, (ParseFieldList, ParseGenericDict, ParseGenericValue)):
                         self[index] = item
                     else:
@@ -141,15 +221,15 @@ class ParseFieldListGeneric(
                         self.children[item.name] = item
                     else:
                         self.children[key].value = item
-                    self._children[item.name]._set_parent_generic(self)
+                    children[item.name]._set_parent_generic(self)
         else:
             for index in range(len(value)):
                 item = value[index]
-                if index < len(self._children):
+                if index < len(children):
                     self[index] = item
                     self[index]._set_parent_generic(self)
                 else:
-                    self._children[item.name] = item
+                    children[item.name] = item
                     item._set_parent_generic(self)
 
     def get_bits_lsb(self) -> bitarray:
@@ -158,11 +238,7 @@ class ParseFieldListGeneric(
         Returns:
             lsb bits
         """
-        data = bitarray(endian="little")
-        values = list(self._children.values())
-        for value in values:
-            data += value.bits_lsb
-        return data
+        return self._get_children_bits_lsb()
 
     def get_children(self) -> dict[str, parseGenericT[K, T]]:
         """Get the children of this field as an ordered dictionary.
@@ -170,7 +246,7 @@ class ParseFieldListGeneric(
         Returns:
             the children of this field
         """
-        return cast(dict[str, parseGenericT[K, T]], self._children)
+        return cast(dict[str, parseGenericT[K, T]], self._get_children())
 
     def set_children(
         self,
@@ -184,16 +260,17 @@ class ParseFieldListGeneric(
         Args:
             children: the new children for this field
         """
-        self._children.clear()
+        own_children = self._get_children()
+        own_children.clear()
         if isinstance(children, (dict, dict)):
             keys = list(children.keys())
             for key in keys:
                 value = children[key]
-                self._children[key] = value
+                own_children[key] = value
                 value._set_parent_generic(self)
         elif isinstance(children, list):
             for value in children:
-                self._children[value._name] = value
+                own_children[value._name] = value
                 value._set_parent_generic(self)
 
     def get_parent(self) -> parseGenericT[K, T] | None:
@@ -212,6 +289,22 @@ class ParseFieldListGeneric(
         """
         self._parent = parent
 
+    @property
+    def lazy(self) -> bool:
+        """Get whether sub-fields are only decoded when they are accessed.
+
+        Lazy sub-fields keep a reference to the parsed bits. Bits passed to parse_at are shared with them,
+        so they must not be modified while those sub-fields are in use.
+
+        Returns:
+            true if sub-fields are parsed lazily
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool) -> None:
+        self._lazy = value
+
     @property
     def parent(self) -> parseGenericT[K, T] | None:
         """Get the field (if any) that is this field's parent.
@@ -247,7 +340,7 @@ class ParseFieldListGeneric(
         Returns:
             the value of the field with custom formatting
         """
-        return f'[{", ".join([str(value) for value in self._children .values()])}]'
+        return f'[{", ".join([str(value) for value in self._get_children().values()])}]'
 
     @property
     def value(self) -> Sequence[parseGenericT[K, T]]:
@@ -289,7 +382,7 @@ class ParseFieldListGeneric(
         Returns:
             the field or fields
         """
-        vs = list(self.children.values())[index]
+        vs = self._get_children().get_list()[index]
         if isinstance(vs, list):
             return [v for v in vs]
         else:
@@ -301,14 +394,12 @@ class ParseFieldListGeneric(
         Args:
             index: index or slice to delete
         """
-        item = list(self._children.values())[index]
-        if isinstance(item, list):
-            for x in item:
-                x._set_parent_generic(None)
-                self._children.pop(x._name)
+        children = self._get_children()
+        if isinstance(index, slice):
+            for position in reversed(range(*index.indices(len(children)))):
+                children.del_at(position)._set_parent_generic(None)
         else:
-            item._set_parent_generic(None)
-            self._children = dict({k: v for k, v in self._children.items() if k != item.name})
+            children.del_at(index)._set_parent_generic(None)
 
     @overload
     def __setitem__(self, index: SupportsIndex, value: parseGenericT[K, T] | Any) -> None:
@@ -339,7 +430,14 @@ class ParseFieldListGeneric(
             index: one ore more indices
             value: one or more values
         """
-        indexed_keys = list(self._children.keys())[index]
+        if not isinstance(index, slice):
+            if isinstance(value, ParseBase):
+                children = self._get_children()
+                children[children.get_keys()[index]] = value
+            else:
+                self._get_children().get_list()[index].value = value
+            return
+        indexed_keys = list(self._get_children().keys())[index]
         c: dict[str, ParseBase] = dict()
         for existing_key in self.children:
             if isinstance(indexed_keys, str):
@@ -379,7 +477,7 @@ class ParseFieldListGeneric(
         Returns:
             the length of this field list
         """
-        return len(self._children)
+        return len(self._get_children())
 
     def __iter__(self) -> Iterator[parseGenericT[K, T]]:
         """Iterate over the fields in this list.
@@ -393,4 +491,4 @@ class ParseFieldListGeneric(
 class ParseFieldList(ParseFieldListGeneric[str, Any]):
     """The base field list."""
 
-    ...
+    __slots__ = ()
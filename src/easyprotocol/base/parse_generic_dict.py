@@ -7,7 +7,7 @@ from typing import Any, Generic, Mapping, Sequence, TypeVar, cast
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, ParseBase, endianT
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.utils import dataT
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -20,6 +20,8 @@ class ParseGenericDict(
 ):
     """This class is the basic parsing class for dictionary types."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -50,19 +52,18 @@ class ParseGenericDict(
         if data is not None:
             self.parse(data)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
 
         Args:
-            data: bytes to be parsed
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
         """
-        bit_data = input_to_bytes(data=data)
-        for field in self._children.values():
-            bit_data = field.parse(data=bit_data)
-        return bit_data
+        self._invalidate_bits_cache()
+        return self._get_struct_plan().parse_at(bits=bits, offset=offset)
 
     def popitem(self) -> tuple[K, ParseBase]:
         """Remove item from list.
@@ -125,11 +126,7 @@ class ParseGenericDict(
         Returns:
             lsb bits
         """
-        data = bitarray(endian="little")
-        values = list(self._children.values())
-        for value in values:
-            data += value.bits_lsb
-        return data
+        return self._get_children_bits_lsb()
 
     def _get_children_generic(self) -> dict[str, ParseBase]:
         return self._children
@@ -190,14 +187,6 @@ class ParseGenericDict(
     ) -> None:
         self._set_children_generic(children=children)
 
-    def __bytes__(self) -> bytes:
-        """Get the bytes that make up this field.
-
-        Returns:
-            the bytes of this field
-        """
-        return self.bits_lsb.tobytes()
-
     def __str__(self) -> str:
         """Get a nicely formatted string describing this field.
 
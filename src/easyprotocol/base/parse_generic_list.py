@@ -15,7 +15,7 @@ from typing import (
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, ParseBase, T, endianT
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.utils import dataT
 
 
 class ParseGenericList(
@@ -25,6 +25,8 @@ class ParseGenericList(
 ):
     """The base parsing object for handling parsing in a convenient package."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -59,19 +61,18 @@ class ParseGenericList(
         if data is not None:
             self.parse(data)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
 
         Args:
-            data: bytes to be parsed
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
         """
-        bit_data = input_to_bytes(data=data)
-        for field in self._children.values():
-            bit_data = field.parse(data=bit_data)
-        return bit_data
+        self._invalidate_bits_cache()
+        return self._get_struct_plan().parse_at(bits=bits, offset=offset)
 
     def insert(self, index: SupportsIndex, value: ParseBase) -> None:
         """Insert a new field into this list.
@@ -80,12 +81,7 @@ class ParseGenericList(
             index: the index at which the new field will be inserted
             value: the new field to be inserted
         """
-        c: dict[str, ParseBase] = dict()
-        existing_values = list(self._children.values())
-        existing_values.insert(index, value)
-        for v in existing_values:
-            c[v._name] = v
-        self._children = c
+        self._children.insert_at(index=index, key=value._name, value=value)
 
     def append(self, value: ParseBase) -> None:
         """Append a new field to this list.
@@ -138,11 +134,7 @@ class ParseGenericList(
         Returns:
             lsb bits
         """
-        data = bitarray(endian="little")
-        values = list(self._children.values())
-        for value in values:
-            data += value.bits_lsb
-        return data
+        return self._get_children_bits_lsb()
 
     def get_string_value(self) -> str:
         """Get a formatted value for the field (for any custom formatting).
@@ -192,7 +184,7 @@ class ParseGenericList(
         Returns:
             the field or fields
         """
-        vs = list(self._children.values())[index]
+        vs = self._children.get_list()[index]
         if isinstance(vs, list):
             return [v for v in vs]
         else:
@@ -204,14 +196,11 @@ class ParseGenericList(
         Args:
             index: index or slice to delete
         """
-        item = list(self._children.values())[index]
-        if isinstance(item, list):
-            for x in item:
-                x._set_parent_generic(None)
-                self._children.pop(x._name)
+        if isinstance(index, slice):
+            for position in reversed(range(*index.indices(len(self._children)))):
+                self._children.del_at(position)._set_parent_generic(None)
         else:
-            item._set_parent_generic(None)
-            self._children = dict({k: v for k, v in self._children.items() if k != item.name})
+            self._children.del_at(index)._set_parent_generic(None)
 
     @overload
     def __setitem__(self, index: SupportsIndex, value: ParseBase) -> None:
@@ -240,6 +229,12 @@ class ParseGenericList(
             index: one ore more indices
             value: one or more values
         """
+        if not isinstance(index, slice):
+            if isinstance(value, ParseBase):
+                self._children[self._children.get_keys()[index]] = value
+            else:
+                self._children.get_list()[index].value = value
+            return
         indexed_keys = list(self._children.keys())[index]
         c: dict[str, ParseBase] = dict()
         for existing_key in self._children:
@@ -257,7 +252,7 @@ class ParseGenericList(
                         else:
                             c[sub_value._name] = sub_value
                             sub_value._set_parent_generic(self)
-        self._children = c
+        self._children.replace(c)
 
     def __len__(self) -> int:
         """Get the count of this field's sub-fields.
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any, Generic, TypeVar
 
 from easyprotocol.base.parse_base import ParseBase, dataT, endianT
+from easyprotocol.base.parse_children import NO_CHILDREN, ParseChildren
 
 T = TypeVar("T", covariant=True)
 
@@ -14,6 +15,8 @@ class ParseGenericValue(
 ):
     """This class is the basic parsing class for value types."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -43,6 +46,14 @@ class ParseGenericValue(
         if data is None and default is not None:
             self.value = default
 
+    def _create_children(self) -> ParseChildren:
+        """Value fields never have sub-fields, so they all share the same empty sub-field dictionary.
+
+        Returns:
+            the shared, read-only sub-field dictionary
+        """
+        return NO_CHILDREN
+
     def get_value(self) -> Any:
         """Get the parsed value of this class.
 
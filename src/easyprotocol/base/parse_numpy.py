@@ -0,0 +1,84 @@
+"""Describe the layout of parse objects as NumPy structured data types (NumPy is optional)."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:  # pragma: no cover
+    from easyprotocol.base.parse_base import ParseBase
+
+NUMPY_TYPES: dict[str, str] = {
+    "b": "i1",
+    "B": "u1",
+    "h": "i2",
+    "H": "u2",
+    "i": "i4",
+    "I": "u4",
+    "q": "i8",
+    "Q": "u8",
+    "e": "f2",
+    "f": "f4",
+    "d": "f8",
+}
+"""The NumPy type (without byte order) of each struct module format character."""
+
+
+def get_numpy_dtype(schema: ParseBase) -> Any:
+    """Get the NumPy structured data type that has the same memory layout as a parse object.
+
+    Integer and floating-point fields map to NumPy numbers with the same size and byte order,
+    fixed-count string and bytes fields map to fixed-size byte strings and field dictionaries
+    and lists map to (nested) structured types. With it, numpy.frombuffer can decode a whole
+    buffer of records at once. NumPy must be installed to use this function.
+
+    Args:
+        schema: the parse object
+
+    Returns:
+        the NumPy data type
+
+    Raises:
+        TypeError: if the parse object is not byte-aligned or has fields that NumPy cannot describe
+    """
+    import numpy
+
+    spec = schema._get_numpy_dtype()
+    if spec is None:
+        raise TypeError(f"{schema.name} cannot be described by a numpy dtype.")
+    return numpy.dtype(spec)
+
+
+def get_numpy_format(struct_format: str | None) -> str | None:
+    """Get the NumPy type that matches a struct module format.
+
+    Args:
+        struct_format: the struct module format, including the byte order character
+
+    Returns:
+        the NumPy type, including the byte order character, or None if there is no such type
+    """
+    if struct_format is None:
+        return None
+    code = NUMPY_TYPES.get(struct_format[1:])
+    if code is None:
+        return None
+    return struct_format[0] + code
+
+
+def get_numpy_fields(children: Mapping[str, ParseBase]) -> list[tuple[str, Any]] | None:
+    """Get the NumPy structured data type description of a set of sub-fields.
+
+    Args:
+        children: the sub-fields, by name
+
+    Returns:
+        the list of name and type pairs, or None if any sub-field cannot be described by NumPy
+    """
+    fields: list[tuple[str, Any]] = []
+    for name, child in children.items():
+        spec = child._get_numpy_dtype()
+        if spec is None:
+            return None
+        fields.append((name, spec))
+    if len(fields) == 0:
+        return None
+    return fields
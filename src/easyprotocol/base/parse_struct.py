@@ -0,0 +1,200 @@
+"""Compiled struct.Struct plans for parsing runs of byte-aligned fields."""
+from __future__ import annotations
+
+import copy
+import struct
+from typing import TYPE_CHECKING, Sequence
+
+from bitarray import bitarray
+
+if TYPE_CHECKING:  # pragma: no cover
+    from easyprotocol.base.parse_base import ParseBase
+
+
+class StructRun:
+    """A run of consecutive fields that are decoded with a single struct.Struct call."""
+
+    def __init__(self, fields: Sequence[ParseBase], formats: Sequence[str]) -> None:
+        """Create a run of consecutive fields that are decoded with a single struct.Struct call.
+
+        Args:
+            fields: the fields in this run
+            formats: the struct format of each field, including the byte order character
+        """
+        byte_order = "<"
+        for fmt in formats:
+            if struct.calcsize(fmt[1:]) > 1:
+                byte_order = fmt[0]
+                break
+        self.fields = tuple(fields)
+        self.struct = struct.Struct(byte_order + "".join([fmt[1:] for fmt in formats]))
+        self.bit_count = self.struct.size * 8
+        offsets: list[int] = []
+        bit_offset = 0
+        for fmt in formats:
+            offsets.append(bit_offset)
+            bit_offset += 8 * struct.calcsize(fmt)
+        self.offsets = tuple(offsets)
+        self.packable = all([fmt[-1] not in "efd" for fmt in formats])
+
+    def copy_for(self, fields: dict[int, ParseBase]) -> StructRun:
+        """Copy this run for the copies of its fields, without compiling it again.
+
+        Args:
+            fields: the copied fields, by the id of the field they were copied from
+
+        Returns:
+            the copied run
+        """
+        run = copy.copy(self)
+        run.fields = tuple([fields[id(field)] for field in self.fields])
+        return run
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the fields of this run from a shared buffer of bits.
+
+        Falls back to parsing field by field when the run is not byte-aligned in the buffer
+        or when there is too little data (so the usual errors are raised).
+
+        Args:
+            bits: little-endian bits holding (at least) this run
+            offset: bit offset where this run starts
+
+        Returns:
+            the bit offset just past the end of this run
+        """
+        if offset & 7 or len(bits) < offset + self.bit_count:
+            for field in self.fields:
+                offset = field.parse_at(bits=bits, offset=offset)
+            return offset
+        values = self.struct.unpack_from(bits, offset >> 3)
+        for field, value, field_offset in zip(self.fields, values, self.offsets):
+            field._set_struct_value(value=value, bits=bits, offset=offset + field_offset)
+        return offset + self.bit_count
+
+    def get_bits_lsb(self, bits: bitarray) -> None:
+        """Append the bits of the fields of this run to a bit buffer.
+
+        Args:
+            bits: the bits to append to
+        """
+        if self.packable:
+            bits.frombytes(self.struct.pack(*[field._get_struct_value() for field in self.fields]))
+        else:
+            for field in self.fields:
+                bits += field.bits_lsb
+
+
+class StructPlan:
+    """A parsing plan that decodes byte-aligned, fixed-size runs of fields with precompiled structs.
+
+    Fields that cannot be decoded by the struct module are parsed with their own parse_at method.
+    """
+
+    def __init__(self, fields: Sequence[ParseBase]) -> None:
+        """Create a parsing plan for a sequence of fields.
+
+        Args:
+            fields: the fields to be parsed, in order
+        """
+        self.fields = tuple(fields)
+        self.lazy_steps = tuple([(field, field._get_lazy_bit_count()) for field in self.fields])
+        self.steps: list[StructRun | ParseBase] = []
+        run_fields: list[ParseBase] = []
+        run_formats: list[str] = []
+        run_byte_order = ""
+        for field in self.fields:
+            fmt = field._get_struct_format()
+            if fmt is not None and struct.calcsize(fmt[1:]) > 1:
+                if run_byte_order == "":
+                    run_byte_order = fmt[0]
+                elif run_byte_order != fmt[0]:
+                    self._add_run(run_fields, run_formats)
+                    run_fields, run_formats, run_byte_order = [], [], fmt[0]
+            if fmt is None:
+                self._add_run(run_fields, run_formats)
+                run_fields, run_formats, run_byte_order = [], [], ""
+                self.steps.append(field)
+            else:
+                run_fields.append(field)
+                run_formats.append(fmt)
+        self._add_run(run_fields, run_formats)
+
+    def _add_run(self, fields: Sequence[ParseBase], formats: Sequence[str]) -> None:
+        if len(fields) > 0:
+            self.steps.append(StructRun(fields=fields, formats=formats))
+
+    def copy_for(self, fields: Sequence[ParseBase]) -> StructPlan:
+        """Copy this plan for the copies of its fields, without compiling it again.
+
+        Args:
+            fields: the copied fields, in the same order as the fields of this plan
+
+        Returns:
+            the copied plan
+        """
+        copies = {id(field): other for field, other in zip(self.fields, fields)}
+        plan = copy.copy(self)
+        plan.fields = tuple(fields)
+        plan.lazy_steps = tuple([(copies[id(field)], bit_count) for field, bit_count in self.lazy_steps])
+        plan.steps = [
+            step.copy_for(fields=copies) if isinstance(step, StructRun) else copies[id(step)] for step in self.steps
+        ]
+        return plan
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the fields of this plan from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) these fields
+            offset: bit offset where the first field starts
+
+        Returns:
+            the bit offset just past the end of the last field
+        """
+        for step in self.steps:
+            offset = step.parse_at(bits=bits, offset=offset)
+        return offset
+
+    def parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Record where each field of this plan is in a shared buffer of bits, without decoding them.
+
+        Fields that cannot be parsed lazily are parsed immediately.
+
+        Args:
+            bits: little-endian bits holding (at least) these fields
+            offset: bit offset where the first field starts
+
+        Returns:
+            the bit offset just past the end of the last field
+
+        Raises:
+            IndexError: if there is too little data to parse the fields
+        """
+        bit_length = len(bits)
+        for field, bit_count in self.lazy_steps:
+            if bit_count is None:
+                offset = field._parse_lazy_at(bits=bits, offset=offset)
+                continue
+            end = offset + bit_count
+            if bit_length < end:
+                raise IndexError("Too little data to parse field.")
+            field._bits = None  # pyright:ignore[reportGeneralTypeIssues]
+            field._lazy_bits = bits
+            field._lazy_offset = offset
+            offset = end
+        return offset
+
+    def get_bits_lsb(self) -> bitarray:
+        """Get the bits of the fields of this plan in least-significant-bit first format.
+
+        Returns:
+            lsb bits
+        """
+        bits = bitarray(endian="little")
+        for step in self.steps:
+            if isinstance(step, StructRun):
+                step.get_bits_lsb(bits)
+            else:
+                bits += step.bits_lsb
+        return bits
@@ -18,7 +18,7 @@ from bitarray import bitarray
 from easyprotocol.base.parse_base import ParseBase
 from easyprotocol.base.parse_generic_dict import K
 from easyprotocol.base.parse_generic_value import ParseGenericValue
-from easyprotocol.base.utils import DEFAULT_ENDIANNESS, dataT, endianT, input_to_bytes
+from easyprotocol.base.utils import DEFAULT_ENDIANNESS, dataT, endianT
 
 T = TypeVar("T", covariant=True)
 parseGenericT = ParseGenericValue[T]
@@ -32,6 +32,8 @@ class ParseValueListGeneric(
 ):
     """The base parsing object for handling parsing in a convenient package."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -61,19 +63,18 @@ class ParseValueListGeneric(
         if data is not None:
             self.parse(data)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
 
         Args:
-            data: bytes to be parsed
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
         """
-        bit_data = input_to_bytes(data=data)
-        for field in self._children.values():
-            bit_data = field.parse(data=bit_data)
-        return bit_data
+        self._invalidate_bits_cache()
+        return self._get_struct_plan().parse_at(bits=bits, offset=offset)
 
     def insert(self, index: SupportsIndex, value: ParseGenericValue[T]) -> None:
         """Insert a new field into this list.
@@ -82,12 +83,7 @@ class ParseValueListGeneric(
             index: the index at which the new field will be inserted
             value: the new field to be inserted
         """
-        c: dict[str, ParseBase] = dict()
-        existing_values = list(self._children.values())
-        existing_values.insert(index, value)
-        for v in existing_values:
-            c[v.name] = v
-        self.children = cast(dict[str, parseGenericT[T]], c)
+        self._get_children().insert_at(index=index, key=value._name, value=value)
 
     def append(self, value: ParseGenericValue[T]) -> None:
         """Append a new field to this list.
@@ -130,11 +126,7 @@ class ParseValueListGeneric(
         Returns:
             lsb bits
         """
-        data = bitarray(endian="little")
-        values = list(self._children.values())
-        for value in values:
-            data += value.bits_lsb
-        return data
+        return self._get_children_bits_lsb()
 
     def get_string_value(self) -> str:
         """Get a formatted value for the field (for any custom formatting).
@@ -142,15 +134,7 @@ class ParseValueListGeneric(
         Returns:
             the value of the field with custom formatting
         """
-        return f'[{", ".join([str(value) for value in self._children .values()])}]'
-
-    def __bytes__(self) -> bytes:
-        """Get the bytes that make up this field.
-
-        Returns:
-            the bytes of this field
-        """
-        return self.bits_lsb.tobytes()
+        return f'[{", ".join([str(value) for value in self._get_children().values()])}]'
 
     def __str__(self) -> str:
         """Get a nicely formatted string describing this field.
@@ -190,8 +174,7 @@ class ParseValueListGeneric(
         Returns:
             the field
         """
-        children = cast(list[ParseGenericValue[T]], list(self._children.values()))
-        return children[index]
+        return cast(ParseGenericValue[T], self._get_children().get_list()[index])
 
     @overload
     def __getitem__(self, index: SupportsIndex) -> valueGenericT[T]:
@@ -220,7 +203,7 @@ class ParseValueListGeneric(
         Returns:
             the value(s) of the field(s)
         """
-        vs = list(self.children.values())[index]
+        vs = self._get_children().get_list()[index]
         if isinstance(vs, list):
             return ([v.value for v in vs],)
         else:
@@ -232,14 +215,12 @@ class ParseValueListGeneric(
         Args:
             index: index or slice to delete
         """
-        item = list(self.children.values())[index]
-        if isinstance(item, list):
-            for x in item:
-                x._set_parent_generic(None)
-                self._children.pop(x._name)
+        children = self._get_children()
+        if isinstance(index, slice):
+            for position in reversed(range(*index.indices(len(children)))):
+                children.del_at(position)._set_parent_generic(None)
         else:
-            item._set_parent_generic(None)
-            self._children = dict({k: v for k, v in self._children.items() if k != item.name})
+            children.del_at(index)._set_parent_generic(None)
 
     @overload
     def __setitem__(self, index: SupportsIndex, value: valueGenericT[T] | ParseGenericValue[T]) -> None:
@@ -272,7 +253,15 @@ class ParseValueListGeneric(
             index: one ore more indices
             value: one or more values
         """
-        indexed_keys = list(self._children.keys())[index]
+        if not isinstance(index, slice):
+            if isinstance(value, ParseGenericValue):
+                old = self._get_children().set_at(index=index, key=value._name, value=value)
+                if old is not value:
+                    old._set_parent_generic(None)
+            else:
+                self._get_children().get_list()[index].value = value
+            return
+        indexed_keys = list(self._get_children().keys())[index]
         c: dict[str, ParseGenericValue[T]] = dict()
         for existing_key in self.children:
             if isinstance(indexed_keys, str):
@@ -309,7 +298,7 @@ class ParseValueListGeneric(
         Returns:
             the length of this field list
         """
-        return len(self._children)
+        return len(self._get_children())
 
     def get_children(self) -> dict[str, ParseGenericValue[T]]:
         """Get the children of this field as an ordered dictionary.
@@ -322,7 +311,7 @@ class ParseValueListGeneric(
                 str,
                 ParseGenericValue[T],
             ],
-            self._children,
+            self._get_children(),
         )
 
     def set_children(
@@ -334,16 +323,17 @@ class ParseValueListGeneric(
         Args:
             children: the new children for this field
         """
-        self._children.clear()
+        own_children = self._get_children()
+        own_children.clear()
         if isinstance(children, (dict, dict)):
             keys = list(children.keys())
             for key in keys:
                 value = children[key]
-                self._children[key] = value
+                own_children[key] = value
                 value._set_parent_generic(self)
         elif isinstance(children, list):
             for value in children:
-                self._children[value._name] = value
+                own_children[value._name] = value
                 value._set_parent_generic(self)
 
     def get_parent(self) -> ParseGenericValue[Any] | None:
@@ -397,10 +387,10 @@ class ParseValueListGeneric(
         Returns:
             field iterator
         """
-        return cast("Iterator[ParseGenericValue[T]]", self._children.values().__iter__())
+        return cast("Iterator[ParseGenericValue[T]]", self._get_children().values().__iter__())
 
 
 class ParseValueList(ParseValueListGeneric[str, T], Generic[T]):
     """The base field value list."""
 
-    ...
+    __slots__ = ()
@@ -0,0 +1,324 @@
+"""Count and time the calls to the parsing methods of each field, by field path."""
+from __future__ import annotations
+
+import functools
+import pstats
+import time
+from types import TracebackType
+from typing import Any, Callable, Sequence, Tuple
+
+from bitarray import bitarray
+
+from easyprotocol.base.parse_base import ParseBase
+
+PROFILED_METHODS = ("parse", "parse_at", "get_value", "set_value", "get_bits_lsb")
+"""The methods of the parsing classes that are profiled by default."""
+
+PROFILE_SORT_KEYS = ("cumulative", "own", "calls", "bytes", "path")
+"""The columns that a profile table can be sorted by."""
+
+profileKeyT = Tuple[str, str]
+"""A field path and a method name."""
+
+
+class ProfileEntry:
+    """The calls to one method of the field at one path."""
+
+    __slots__ = ("calls", "cumulative", "own", "byte_count", "callers")
+
+    def __init__(self) -> None:
+        """Create an entry without any calls."""
+        self.calls = 0
+        """Number of calls."""
+        self.cumulative = 0.0
+        """Time spent in the calls, in seconds."""
+        self.own = 0.0
+        """Time spent in the calls minus the time spent in profiled calls that they made, in seconds."""
+        self.byte_count = 0
+        """Number of bytes parsed or serialized by the calls."""
+        self.callers: dict[profileKeyT, list[float]] = {}
+        """Number of calls, own time and cumulative time, by the profiled call that made them."""
+
+
+def get_field_path(field: ParseBase) -> str:
+    """Get the path of a field, which is the names of the fields that hold it and its own name, joined by dots.
+
+    Args:
+        field: the field
+
+    Returns:
+        the path, e.g. modbusTCPHeader.bit array.#3
+    """
+    names = [field._name]
+    parent = field._parent
+    while parent is not None:
+        names.append(parent._name)
+        parent = parent._parent
+    return ".".join(reversed(names))
+
+
+def get_parse_classes() -> list[type[ParseBase]]:
+    """Get ParseBase and all of its sub-classes that have been defined so far.
+
+    Returns:
+        the classes, base classes first
+    """
+    classes: list[type[ParseBase]] = [ParseBase]
+    seen = {ParseBase}
+    for cls in classes:
+        for subclass in cls.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                classes.append(subclass)
+    return classes
+
+
+def count_bytes(method: str, args: tuple[Any, ...], kwargs: dict[str, Any], result: Any) -> int:
+    """Get the number of bytes that a call to a profiled method parsed or serialized.
+
+    Args:
+        method: name of the method
+        args: positional arguments of the call, after the field
+        kwargs: keyword arguments of the call
+        result: what the call returned
+
+    Returns:
+        the number of bytes, or 0 for the methods that get or set values
+    """
+    if method == "get_bits_lsb":
+        return len(result) // 8
+    if method == "parse_at":
+        offset = args[1] if len(args) > 1 else kwargs["offset"]
+        return (result - offset) // 8
+    if method == "parse":
+        data = args[0] if args else kwargs["data"]
+        if isinstance(data, bitarray):
+            return (len(data) - len(result)) // 8
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return len(data) - len(result) // 8
+    return 0
+
+
+class FieldProfiler:
+    """Count and time the calls to the parsing methods of each field, broken down by field path.
+
+    While the profiler is enabled, the profiled methods of ParseBase and of every sub-class that defines
+    them are replaced by wrappers that record each call. Disabling it puts the original methods back, so a
+    disabled profiler costs nothing. Only one profiler can be enabled at a time, and classes that are
+    defined while it is enabled are not profiled.
+
+    A method that calls the same method of a base class (or of the same field) is counted once. Fields
+    that a field list or dictionary decodes in bulk with the struct module are not parsed one by one, so
+    their parse time is only counted in the field that holds them.
+
+    The results can be printed as a table with get_table, or loaded into pstats.Stats (the profiler has
+    the create_stats method and stats attribute of cProfile.Profile), where the field path takes the place
+    of the file name and the method name that of the function name.
+    """
+
+    _enabled_profiler: FieldProfiler | None = None
+
+    def __init__(self, methods: Sequence[str] = PROFILED_METHODS) -> None:
+        """Create a disabled profiler.
+
+        Args:
+            methods: names of the methods to profile
+        """
+        self._methods = tuple(methods)
+        self._entries: dict[profileKeyT, ProfileEntry] = {}
+        self._originals: list[tuple[type[ParseBase], str, Callable[..., Any]]] = []
+        self._stack: list[tuple[profileKeyT, list[float]]] = []
+        self._active: set[profileKeyT] = set()
+        self.stats: dict[tuple[str, int, str], tuple[int, int, float, float, dict[Any, Any]]] = {}
+
+    def enable(self) -> None:
+        """Start profiling the calls to the parsing methods.
+
+        Raises:
+            RuntimeError: if another profiler is enabled
+        """
+        if FieldProfiler._enabled_profiler is self:
+            return
+        if FieldProfiler._enabled_profiler is not None:
+            raise RuntimeError("Another field profiler is already enabled.")
+        FieldProfiler._enabled_profiler = self
+        for cls in get_parse_classes():
+            for method in self._methods:
+                original = cls.__dict__.get(method)
+                if callable(original):
+                    self._originals.append((cls, method, original))
+                    setattr(cls, method, self._wrap(method=method, original=original))
+
+    def disable(self) -> None:
+        """Stop profiling, putting the original parsing methods back."""
+        if FieldProfiler._enabled_profiler is not self:
+            return
+        for cls, method, original in reversed(self._originals):
+            setattr(cls, method, original)
+        self._originals.clear()
+        FieldProfiler._enabled_profiler = None
+
+    @property
+    def enabled(self) -> bool:
+        """Get whether this profiler is enabled.
+
+        Returns:
+            true if the calls are being profiled
+        """
+        return FieldProfiler._enabled_profiler is self
+
+    def clear(self) -> None:
+        """Forget the calls profiled so far."""
+        self._entries.clear()
+        self.stats = {}
+
+    def _wrap(self, method: str, original: Callable[..., Any]) -> Callable[..., Any]:
+        """Create the wrapper that profiles the calls to one method of one class.
+
+        Args:
+            method: name of the method
+            original: the method
+
+        Returns:
+            the wrapper
+        """
+        entries = self._entries
+        stack = self._stack
+        active = self._active
+        perf_counter = time.perf_counter
+
+        @functools.wraps(original)
+        def wrapper(field: ParseBase, *args: Any, **kwargs: Any) -> Any:
+            key = (get_field_path(field), method)
+            if key in active:
+                return original(field, *args, **kwargs)
+            active.add(key)
+            times = [0.0]
+            stack.append((key, times))
+            start = perf_counter()
+            try:
+                result = original(field, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                active.discard(key)
+                entry = entries.get(key)
+                if entry is None:
+                    entry = entries[key] = ProfileEntry()
+                entry.calls += 1
+                entry.cumulative += elapsed
+                entry.own += elapsed - times[0]
+                if stack:
+                    caller, caller_times = stack[-1]
+                    caller_times[0] += elapsed
+                    edge = entry.callers.get(caller)
+                    if edge is None:
+                        edge = entry.callers[caller] = [0, 0.0, 0.0]
+                    edge[0] += 1
+                    edge[1] += elapsed - times[0]
+                    edge[2] += elapsed
+            entry.byte_count += count_bytes(method=method, args=args, kwargs=kwargs, result=result)
+            return result
+
+        return wrapper
+
+    @property
+    def entries(self) -> dict[profileKeyT, ProfileEntry]:
+        """Get the profiled calls.
+
+        Returns:
+            the profiled calls, by field path and method name
+        """
+        return self._entries
+
+    def get_table(self, sort_by: str = "cumulative", limit: int | None = None) -> str:
+        """Format the profiled calls as a text table.
+
+        Args:
+            sort_by: the column to sort by, one of PROFILE_SORT_KEYS
+            limit: maximum number of rows
+
+        Returns:
+            the table
+
+        Raises:
+            ValueError: if the sort column is unknown
+        """
+        if sort_by not in PROFILE_SORT_KEYS:
+            raise ValueError(f"Cannot sort by {sort_by}, only by one of {', '.join(PROFILE_SORT_KEYS)}")
+        sort_keys: dict[str, Callable[[tuple[profileKeyT, ProfileEntry]], Any]] = {
+            "cumulative": lambda item: -item[1].cumulative,
+            "own": lambda item: -item[1].own,
+            "calls": lambda item: -item[1].calls,
+            "bytes": lambda item: -item[1].byte_count,
+            "path": lambda item: item[0],
+        }
+        items = sorted(self._entries.items(), key=sort_keys[sort_by])[:limit]
+        rows = [("path", "method", "calls", "cumulative ms", "own ms", "bytes")]
+        rows.extend(
+            (
+                path,
+                method,
+                str(entry.calls),
+                f"{entry.cumulative * 1e3:.3f}",
+                f"{entry.own * 1e3:.3f}",
+                str(entry.byte_count),
+            )
+            for (path, method), entry in items
+        )
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+                + [cell.rjust(width) for cell, width in zip(row[2:], widths[2:])]
+            ).rstrip()
+            for row in rows
+        )
+
+    def create_stats(self) -> None:
+        """Fill in the stats attribute in the format of cProfile.Profile, which pstats.Stats loads."""
+        self.stats = {
+            (path, 0, method): (
+                entry.calls,
+                entry.calls,
+                entry.own,
+                entry.cumulative,
+                {
+                    (caller_path, 0, caller_method): (int(calls), int(calls), own, cumulative)
+                    for (caller_path, caller_method), (calls, own, cumulative) in entry.callers.items()
+                },
+            )
+            for (path, method), entry in self._entries.items()
+        }
+
+    def get_stats(self) -> pstats.Stats:
+        """Get the profiled calls as a pstats.Stats object, e.g. to sort and print them like cProfile results.
+
+        Returns:
+            the statistics
+        """
+        return pstats.Stats(self)
+
+    def __enter__(self) -> FieldProfiler:
+        """Enable the profiler for the duration of a with block.
+
+        Returns:
+            this profiler
+        """
+        self.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Disable the profiler.
+
+        Args:
+            exc_type: type of the exception that was raised, if any
+            exc_value: the exception that was raised, if any
+            traceback: traceback of the exception that was raised, if any
+        """
+        self.disable()
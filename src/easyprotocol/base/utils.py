@@ -1,21 +1,66 @@
 """Utility functions for parsers."""
 from __future__ import annotations
 
-from typing import Literal, SupportsBytes, Union
+import math
+from typing import Literal, NamedTuple, SupportsBytes, Union
 
 from bitarray import bitarray
+from bitarray.util import zeros
 
-dataT = Union[bitarray, bytearray, bytes, None]
+dataT = Union[bitarray, bytearray, bytes, memoryview, None]
 endianT = Literal["little", "big"]
 DEFAULT_ENDIANNESS: endianT = "big"
 
 
+class BitCountInfo(NamedTuple):
+    """Precomputed sizes and limits for fields of one bit count."""
+
+    byte_count: int
+    mask: int
+    unsigned_limit: int
+    signed_limit: int
+    int_backed: bool
+
+
+BIT_COUNT_INFO: dict[int, BitCountInfo] = {}
+
+
+def get_bit_count_info(bit_count: int) -> BitCountInfo:
+    """Get the precomputed sizes and limits for fields of a bit count.
+
+    Values are computed once per bit count and shared by all fields of that size.
+
+    Args:
+        bit_count: the number of bits in the field
+
+    Returns:
+        the byte count, value mask, value limits and whether values of this size can be stored
+        as plain integers (i.e. they survive conversion to bytes and back unchanged)
+    """
+    info = BIT_COUNT_INFO.get(bit_count)
+    if info is None:
+        byte_count = math.ceil(bit_count / 8) if bit_count > 0 else 0
+        info = BitCountInfo(
+            byte_count=byte_count,
+            mask=(1 << bit_count) - 1 if bit_count > 0 else 0,
+            unsigned_limit=1 << (8 * byte_count),
+            signed_limit=1 << max(8 * byte_count - 1, 0),
+            int_backed=0 < bit_count < 8 or (bit_count > 0 and bit_count % 8 == 0),
+        )
+        BIT_COUNT_INFO[bit_count] = info
+    return info
+
+
 def input_to_bytes(
     data: dataT | SupportsBytes,
     bit_count: int | None = None,
 ) -> bitarray:
     """Convert bits or bytes into valid bits.
 
+    Byte buffers (bytes, bytearray, memoryview and other contiguous buffers) are imported
+    without copying, so the returned bits share memory with the passed buffer. Little-endian
+    bits are returned as-is. Callers must not modify the returned bits.
+
     Args:
         data: data that needs to be little-endian bits
         bit_count: the number of desired output bits
@@ -26,16 +71,14 @@ def input_to_bytes(
     Raises:
         TypeError: if the passed type is not supported
     """
-    if isinstance(data, (bytes, bytearray)):
-        bits = bitarray(endian="little")
-        bits.frombytes(data)
-        if len(bits) < (8 * len(data)):
-            bits = bits + bitarray("0" * ((8 * len(data)) - len(bits)), endian="little")
-    elif isinstance(data, bitarray):
-        bit_length = len(data)
-        bits = bitarray(endian="little")
-        bits.frombytes(data.tobytes())
-        bits = bits[:bit_length]
+    if isinstance(data, bitarray):
+        if data.endian() == "little":
+            bits = data
+        else:
+            bit_length = len(data)
+            bits = bitarray(buffer=data, endian="little")[:bit_length]
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        bits = _buffer_to_bits(data)
     elif isinstance(data, SupportsBytes):
         bits = bitarray(endian="little")
         bits.frombytes(bytes(data))
@@ -43,10 +86,45 @@ def input_to_bytes(
         raise TypeError()
     if bit_count is not None:
         if len(bits) < bit_count and isinstance(data, bytes):
-            bits = bits + bitarray("0" * (bit_count - len(bits)), endian="little")
+            bits = bits + zeros(bit_count - len(bits), endian="little")
     return bits
 
 
+def copy_mutable_data(data: dataT) -> dataT:
+    """Copy the passed data if it is a buffer that can be modified.
+
+    Bits imported from a buffer share its memory, so fields that keep those bits would
+    see later changes to the buffer, and a resizable buffer could not be resized.
+
+    Args:
+        data: bits or bytes
+
+    Returns:
+        a read-only copy of modifiable bytes, a copy of bits, or the passed data
+    """
+    if isinstance(data, bitarray):
+        return data.copy()
+    if isinstance(data, bytearray) or (isinstance(data, memoryview) and not data.readonly):
+        return bytes(data)
+    return data
+
+
+def _buffer_to_bits(data: bytes | bytearray | memoryview) -> bitarray:
+    """Import a byte buffer as little-endian bits without copying it when possible.
+
+    Args:
+        data: the byte buffer
+
+    Returns:
+        the bit data
+    """
+    if isinstance(data, memoryview) and not data.c_contiguous:
+        bits = bitarray(endian="little")
+        bits.frombytes(data.tobytes())
+        return bits
+    return bitarray(buffer=data, endian="little")
+
+
 def hex(bts: bytes | SupportsBytes, lsB: bool = True) -> str:  # noqa
     """Convert bytes to hexadecimal, but nicely.
 
@@ -0,0 +1,359 @@
+"""Time the hot paths of the fields, containers and Modbus frames, and compare the timings with a saved baseline.
+
+Run it with ``python -m easyprotocol.bench``. The timings are written as JSON, so that a later run
+can be compared against them with ``--baseline``, which fails if anything got slower than allowed.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import platform
+import sys
+import timeit
+from enum import IntEnum, IntFlag
+from typing import Any, Callable, NamedTuple, Sequence
+
+import crc
+
+from easyprotocol import fields
+from easyprotocol.base import ParseFieldDict, ParseFieldList
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.protocols.modbus import frames
+
+BENCHMARK_FORMAT = 1
+"""Version of the JSON format of the timings."""
+
+CONTAINER_SIZES = (10, 100, 1000)
+"""The numbers of sub-fields of the benchmarked containers."""
+
+
+class Benchmark(NamedTuple):
+    """One timed operation."""
+
+    name: str
+    """Name of the benchmark, e.g. fields.UInt8Field.parse."""
+    run: Callable[[], Any]
+    """Function that does the operation once."""
+
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than allowed."""
+
+    name: str
+    """Name of the benchmark."""
+    baseline: float
+    """Baseline time, in nanoseconds per operation."""
+    current: float
+    """Current time, in nanoseconds per operation."""
+
+
+class BenchEnum(IntEnum):
+    """Enumeration used to benchmark the enum fields."""
+
+    ZERO = 0
+    ONE = 1
+    TWO = 2
+
+
+class BenchFlags(IntFlag):
+    """Flags used to benchmark the flags fields."""
+
+    NONE = 0
+    ONE = 1
+    TWO = 2
+    FOUR = 4
+    EIGHT = 8
+
+
+def create_field(cls: type[ParseBase]) -> tuple[ParseBase, Any]:
+    """Create a field of one of the classes in easyprotocol.fields, and a value to write to it.
+
+    Args:
+        cls: the field class
+
+    Returns:
+        the field, and a value for it
+    """
+    name = cls.__name__
+    parameters = inspect.signature(cls.__init__).parameters
+    kwargs: dict[str, Any] = {"name": "bench"}
+    value: Any = 0x5A
+    if "enum_type" in parameters:
+        kwargs.update(enum_type=BenchEnum, default=BenchEnum.ONE)
+        value = BenchEnum.TWO
+    elif "flags_type" in parameters:
+        kwargs.update(flags_type=BenchFlags, default=BenchFlags.ONE)
+        value = BenchFlags.TWO | BenchFlags.EIGHT
+    elif "crc_configuration" in parameters:
+        kwargs.update(crc_configuration=crc.Crc16.CCITT.value)
+    elif "array_item_class" in parameters:
+        kwargs.update(count=16, array_item_class=fields.UInt16Field, array_item_default=0, default=[0] * 16)
+        value = list(range(16))
+    elif "Bool" in name:
+        value = True
+    elif "Float" in name:
+        value = 1.5
+    elif "Char" in name:
+        value = "Z"
+    elif "Byte" in name and "Bytes" not in name:
+        value = b"Z"
+    elif "String" in name:
+        value = "easyprotocol".ljust(16)
+    elif "Bytes" in name:
+        value = b"easyprotocol".ljust(16)
+    if "count" in parameters and "count" not in kwargs:
+        kwargs.update(count=16)
+    if "bit_count" in parameters:
+        kwargs.update(bit_count=32 if "Float" in name else 16)
+    return cls(**kwargs), value
+
+
+def create_operations(prefix: str, field: ParseBase, value: Any) -> list[Benchmark]:
+    """Create the benchmarks of the operations on a field.
+
+    Args:
+        prefix: prefix of the benchmark names
+        field: the field
+        value: a value to write to the field
+
+    Returns:
+        the parse, serialize, value read, value write and str benchmarks
+    """
+    field.value = value
+    data = bytes(field)
+
+    def serialize() -> bytes:
+        field._invalidate_bits_cache()
+        return bytes(field)
+
+    def read() -> Any:
+        return field.value
+
+    def write() -> None:
+        field.value = value
+
+    return [
+        Benchmark(name=f"{prefix}.parse", run=lambda: field.parse(data)),
+        Benchmark(name=f"{prefix}.serialize", run=serialize),
+        Benchmark(name=f"{prefix}.value_read", run=read),
+        Benchmark(name=f"{prefix}.value_write", run=write),
+        Benchmark(name=f"{prefix}.str", run=lambda: str(field)),
+    ]
+
+
+def get_field_classes() -> list[type[ParseBase]]:
+    """Get the field classes exported by easyprotocol.fields.
+
+    Returns:
+        the field classes, by name
+    """
+    classes = [
+        value
+        for value in vars(fields).values()
+        if inspect.isclass(value) and issubclass(value, ParseBase) and value is not ParseBase
+    ]
+    return sorted(classes, key=lambda cls: cls.__name__)
+
+
+def get_field_benchmarks() -> list[Benchmark]:
+    """Get the benchmarks of every (concrete) field class exported by easyprotocol.fields.
+
+    Returns:
+        the benchmarks
+    """
+    benchmarks: list[Benchmark] = []
+    for cls in get_field_classes():
+        try:
+            field, value = create_field(cls)
+        except NotImplementedError:
+            # abstract base classes, such as FloatField
+            continue
+        benchmarks.extend(create_operations(prefix=f"fields.{cls.__name__}", field=field, value=value))
+    return benchmarks
+
+
+def get_container_benchmarks(sizes: Sequence[int] = CONTAINER_SIZES) -> list[Benchmark]:
+    """Get the benchmarks of field lists and field dictionaries of several sizes.
+
+    Args:
+        sizes: numbers of sub-fields
+
+    Returns:
+        the benchmarks
+    """
+    benchmarks: list[Benchmark] = []
+    for size in sizes:
+        children = [fields.UInt16Field(name=f"f{index}", default=index) for index in range(size)]
+        field_list = ParseFieldList(name="bench", default=children)
+        benchmarks.extend(
+            create_operations(prefix=f"containers.ParseFieldList[{size}]", field=field_list, value=list(range(size)))
+        )
+        children = [fields.UInt16Field(name=f"f{index}", default=index) for index in range(size)]
+        field_dict = ParseFieldDict(name="bench", default=children)
+        benchmarks.extend(
+            create_operations(prefix=f"containers.ParseFieldDict[{size}]", field=field_dict, value=field_dict.value)
+        )
+    return benchmarks
+
+
+def get_modbus_benchmarks() -> list[Benchmark]:
+    """Get the benchmarks of every Modbus TCP and RTU frame class.
+
+    Returns:
+        the benchmarks
+    """
+    benchmarks: list[Benchmark] = []
+    for name, cls in sorted(vars(frames).items()):
+        if inspect.isclass(cls) and issubclass(cls, ParseBase) and name.startswith(("ModbusTCP", "ModbusRTU")):
+            frame = cls.template()
+            benchmarks.extend(create_operations(prefix=f"modbus.{name}", field=frame, value=frame.value))
+    return benchmarks
+
+
+def get_benchmarks(pattern: str | None = None) -> list[Benchmark]:
+    """Get all the benchmarks.
+
+    Args:
+        pattern: if given, only the benchmarks with names that contain it
+
+    Returns:
+        the benchmarks
+    """
+    benchmarks = get_field_benchmarks() + get_container_benchmarks() + get_modbus_benchmarks()
+    if pattern is not None:
+        benchmarks = [benchmark for benchmark in benchmarks if pattern in benchmark.name]
+    return benchmarks
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int = 3, min_time: float = 0.02) -> float:
+    """Time one benchmark, taking the best of several runs.
+
+    Args:
+        benchmark: the benchmark
+        repeat: number of runs
+        min_time: minimum duration of each run, in seconds
+
+    Returns:
+        the time taken, in nanoseconds per operation
+    """
+    timer = timeit.Timer(stmt=benchmark.run)
+    number = 1
+    while True:
+        duration = timer.timeit(number=number)
+        if duration >= min_time:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+    best = min([duration] + timer.repeat(repeat=repeat - 1, number=number))
+    return best / number * 1e9
+
+
+def run_benchmarks(
+    benchmarks: Sequence[Benchmark],
+    repeat: int = 3,
+    min_time: float = 0.02,
+) -> dict[str, float]:
+    """Time several benchmarks.
+
+    Args:
+        benchmarks: the benchmarks
+        repeat: number of runs of each benchmark
+        min_time: minimum duration of each run, in seconds
+
+    Returns:
+        the time taken by each benchmark, in nanoseconds per operation, by name
+    """
+    return {
+        benchmark.name: round(time_benchmark(benchmark=benchmark, repeat=repeat, min_time=min_time), 1)
+        for benchmark in benchmarks
+    }
+
+
+def create_report(results: dict[str, float]) -> dict[str, Any]:
+    """Create the JSON report of benchmark timings.
+
+    Args:
+        results: the time taken by each benchmark, by name
+
+    Returns:
+        the report
+    """
+    return {
+        "format": BENCHMARK_FORMAT,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "unit": "ns",
+        "results": results,
+    }
+
+
+def compare_results(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float = 0.1,
+) -> list[Regression]:
+    """Find the benchmarks that got slower than a baseline allows.
+
+    Benchmarks that are missing from either set of timings are ignored.
+
+    Args:
+        results: the current time taken by each benchmark, by name
+        baseline: the baseline time taken by each benchmark, by name
+        threshold: the allowed slow-down, as a fraction of the baseline time
+
+    Returns:
+        the regressions, by name
+    """
+    return [
+        Regression(name=name, baseline=baseline[name], current=current)
+        for name, current in sorted(results.items())
+        if name in baseline and current > baseline[name] * (1 + threshold)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv: the command line arguments (defaults to sys.argv)
+
+    Returns:
+        the exit code, 1 if any benchmark regressed
+    """
+    parser = argparse.ArgumentParser(prog="python -m easyprotocol.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", help="only run the benchmarks with names that contain this")
+    parser.add_argument("-o", "--output", help="write the JSON timings to this file instead of stdout")
+    parser.add_argument("-b", "--baseline", help="JSON timings of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slow-down (default: 0.1 for 10%%)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs per benchmark (default: 3)")
+    parser.add_argument("--min-time", type=float, default=0.02, help="minimum seconds per run (default: 0.02)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(benchmarks=get_benchmarks(args.filter), repeat=args.repeat, min_time=args.min_time)
+    report = json.dumps(create_report(results), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare_results(results=results, baseline=baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(
+            f"{regression.name}: {regression.baseline:.1f} ns -> {regression.current:.1f} ns "
+            + f"({regression.current / regression.baseline - 1:+.0%})",
+            file=sys.stderr,
+        )
+    print(
+        f"{len(regressions)} of {len(results)} benchmarks regressed by more than {args.threshold:.0%}", file=sys.stderr
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
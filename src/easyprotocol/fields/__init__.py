@@ -6,7 +6,12 @@ from easyprotocol.fields.array import ParseArrayField as ParseArrayField  # noqa
 from easyprotocol.fields.array import (  # noqa
     ParseArrayFieldGeneric as ParseArrayFieldGeneric,
 )
+from easyprotocol.fields.array import (  # noqa
+    ParseCompactArrayField as ParseCompactArrayField,
+)
 from easyprotocol.fields.checksum import ChecksumField as ChecksumField  # noqa
+from easyprotocol.fields.checksum import CRCEngine as CRCEngine  # noqa
+from easyprotocol.fields.checksum import get_crc_engine as get_crc_engine  # noqa
 from easyprotocol.fields.enum import Enum8Field as Enum8Field  # noqa
 from easyprotocol.fields.enum import Enum16Field as Enum16Field  # noqa
 from easyprotocol.fields.enum import Enum24Field as Enum24Field  # noqa
@@ -35,6 +40,12 @@ from easyprotocol.fields.signed_int import IntFieldGeneric as IntFieldGeneric  #
 from easyprotocol.fields.string import ByteField as ByteField  # noqa
 from easyprotocol.fields.string import BytesField as BytesField  # noqa
 from easyprotocol.fields.string import CharField as CharField  # noqa
+from easyprotocol.fields.string import (  # noqa
+    NullTerminatedBytesField as NullTerminatedBytesField,
+)
+from easyprotocol.fields.string import (  # noqa
+    NullTerminatedStringField as NullTerminatedStringField,
+)
 from easyprotocol.fields.string import StringField as StringField  # noqa
 from easyprotocol.fields.string import UInt8ByteField as UInt8ByteField  # noqa
 from easyprotocol.fields.string import UInt8CharField as UInt8CharField  # noqa
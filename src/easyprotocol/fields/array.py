@@ -1,21 +1,83 @@
 """Classes for parsing fields made up of an array of uniform sub-fields."""
 from __future__ import annotations
 
-from typing import Any, Generic, Sequence, TypeVar, cast
+import array
+import struct
+import sys
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    SupportsIndex,
+    TypeVar,
+    cast,
+)
 
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.base.parse_children import NO_CHILDREN, ParseChildren
 from easyprotocol.base.parse_field_dict import parseGenericT
 from easyprotocol.base.parse_field_list import ParseFieldListGeneric
 from easyprotocol.base.parse_generic_dict import K
 from easyprotocol.base.parse_generic_value import ParseGenericValue
 from easyprotocol.base.parse_value_list import ParseValueListGeneric
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.utils import dataT
+from easyprotocol.fields.float import Float32IEEFieldGeneric
+from easyprotocol.fields.signed_int import IntFieldGeneric
 from easyprotocol.fields.unsigned_int import UIntFieldGeneric
 
 T = TypeVar("T")
 
+NUMERIC_GET_VALUES: tuple[Any, ...] = (
+    UIntFieldGeneric.get_value,
+    IntFieldGeneric.get_value,
+    Float32IEEFieldGeneric.get_value,
+)
+"""The get_value methods of the item classes whose values are the raw values unpacked by the struct module."""
+
+ITEM_PROTOTYPES: dict[type, ParseGenericValue[Any] | None] = {}
+"""An item of each item class to copy items from, by item class (None if the struct module cannot decode it)."""
+
+
+def get_item_prototype(
+    array_item_class: type[ParseGenericValue[T]],
+    array_item_default: T,
+) -> ParseGenericValue[T] | None:
+    """Get an item to copy the items of arrays of an item class from.
+
+    Only item classes that are decoded with a single struct module format have a prototype,
+    since whole arrays of such items can be decoded at once.
+
+    Args:
+        array_item_class: the item class
+        array_item_default: default value of the items
+
+    Returns:
+        the prototype item, or None if the struct module cannot decode the item class
+    """
+    if array_item_class in ITEM_PROTOTYPES:
+        return cast("ParseGenericValue[T] | None", ITEM_PROTOTYPES[array_item_class])
+    prototype: ParseGenericValue[Any] | None = array_item_class(name="#0", default=array_item_default)
+    if cast(ParseGenericValue[Any], prototype)._get_struct_format() is None:
+        prototype = None
+    ITEM_PROTOTYPES[array_item_class] = prototype
+    return prototype
+
+
+def is_numeric_item(prototype: ParseGenericValue[Any] | None) -> bool:
+    """Check if the values of an item class are exactly the raw values unpacked by the struct module.
+
+    Args:
+        prototype: the prototype item of the item class
+
+    Returns:
+        true for integer and floating-point item classes
+    """
+    return prototype is not None and type(prototype).get_value in NUMERIC_GET_VALUES
+
 
 class ParseArrayFieldGeneric(
     ParseFieldListGeneric[T, K],
@@ -23,6 +85,8 @@ class ParseArrayFieldGeneric(
 ):
     """Generic base class for parsing an array of uniform sub-fields."""
 
+    __slots__ = ("_count", "_array_item_class", "_array_item_default")
+
     def __init__(
         self,
         name: str,
@@ -57,29 +121,82 @@ class ParseArrayFieldGeneric(
         elif default is not None:
             self.create_default(default=default)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def _clone(self, memo: dict[int, ParseBase]) -> ParseBase:
+        """Create a copy of this field and all of its sub-fields, without calling any constructors.
+
+        A count field that was copied along with this field (normally a preceding sibling) is
+        replaced by its copy.
 
         Args:
-            data: bytes to be parsed
+            memo: the copies made so far, by the id of the field they were copied from
+
+        Returns:
+            a copy of this field
+        """
+        other = cast("ParseArrayFieldGeneric[T, K]", super()._clone(memo=memo))
+        if isinstance(self._count, UIntFieldGeneric):
+            other._count = memo.get(id(self._count), self._count)
+        return other
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy sub-array data type description of this field.
+
+        Only arrays with a fixed number of sub-fields can be described by NumPy.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        if not isinstance(self._count, int) or self._count == 0 or len(self._get_children()) != self._count:
+            return None
+        spec = next(iter(self._get_children().values()))._get_numpy_dtype()
+        if spec is None:
+            return None
+        return (spec, (self._count,))
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
         """
-        bit_data = input_to_bytes(data=data)
+        return self._parse_items_at(bits=bits, offset=offset, lazy=self._lazy)
+
+    def _parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Create the sub-fields of this field, recording where each one is in a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        if type(self).parse_at is not ParseArrayFieldGeneric.parse_at:
+            return self.parse_at(bits=bits, offset=offset)
+        return self._parse_items_at(bits=bits, offset=offset, lazy=True)
+
+    def _parse_items_at(self, bits: bitarray, offset: int, lazy: bool) -> int:
         if isinstance(self._count, UIntFieldGeneric):
             count = self._count.value
         else:
             count = self._count
         if count is not None:
+            children = self._get_children()
             for i in range(count):
                 f = self._array_item_class(
                     name=f"#{i}",
                     default=self._array_item_default,
                 )
-                bit_data = f.parse(data=bit_data)
-                self._children[f.name] = f
-        return bit_data
+                if lazy:
+                    offset = f._parse_lazy_at(bits=bits, offset=offset)
+                else:
+                    offset = f.parse_at(bits=bits, offset=offset)
+                children[f.name] = f
+        return offset
 
     def create_default(self, default: Sequence[T] | Sequence[ParseGenericValue[T]]) -> None:
         """Create an array of default valued sub-fields for this array field.
@@ -98,7 +215,7 @@ class ParseArrayFieldGeneric(
                     name=f"#{i}",
                     default=cast(T, item),
                 )
-            self._children[f.name] = f
+            self._get_children()[f.name] = f
 
     def set_value(
         self,
@@ -127,7 +244,7 @@ class ParseArrayFieldGeneric(
                                 default=item,
                             )
                             item._set_parent_generic(self)
-                            self._children[item.name] = item
+                            self._get_children()[item.name] = item
                     else:
                         self[index].value = item
             else:
@@ -145,7 +262,7 @@ class ParseArrayFieldGeneric(
                                 default=item,
                             )
                             item._set_parent_generic(self)
-                            self._children[item.name] = item
+                            self._get_children()[item.name] = item
                     else:
                         self[index].value = item
 
@@ -156,6 +273,8 @@ class ParseArrayField(
 ):
     """Base class for parsing an array of uniform sub-fields."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -197,8 +316,15 @@ class ParseValueArrayFieldGeneric(
     This class is specialized to appear as an array of value-types instead of field-types.
     This is meant to be used where there is an array of integers or similar rather than an array
     of fields with sub-fields.
+
+    Arrays of items that the struct module can decode (integers, floats, characters and bytes) are
+    decoded all at once, and their item fields are only created when the sub-fields are first used.
+    Until then, the length and bits of the array, and the values of integer and float arrays, come
+    straight from the decoded values.
     """
 
+    __slots__ = ("_count", "_array_item_class", "_array_item_default", "_item_values", "_item_bits")
+
     def __init__(
         self,
         name: str,
@@ -227,6 +353,8 @@ class ParseValueArrayFieldGeneric(
         self._count = count
         self._array_item_class = array_item_class
         self._array_item_default = array_item_default
+        self._item_values: tuple[T, ...] | None = None
+        self._item_bits: bitarray | None = None
         super().__init__(
             name=name,
             data=None,
@@ -237,29 +365,155 @@ class ParseValueArrayFieldGeneric(
         elif default is not None:
             self.create_default(default=default)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def _clone(self, memo: dict[int, ParseBase]) -> ParseBase:
+        """Create a copy of this field and all of its sub-fields, without calling any constructors.
+
+        A count field that was copied along with this field (normally a preceding sibling) is
+        replaced by its copy.
 
         Args:
-            data: bytes to be parsed
+            memo: the copies made so far, by the id of the field they were copied from
+
+        Returns:
+            a copy of this field
+        """
+        other = cast("ParseValueArrayFieldGeneric[T, K]", super()._clone(memo=memo))
+        if isinstance(self._count, UIntFieldGeneric):
+            other._count = memo.get(id(self._count), self._count)
+        return other
+
+    def _get_children(self) -> ParseChildren:
+        """Get the sub-field dictionary of this field, first creating any item fields that were put off.
+
+        Returns:
+            the sub-field dictionary
+        """
+        if self._item_values is not None:
+            self._create_items()
+        return self._children
+
+    def _create_items(self) -> None:
+        """Create the item fields of an array that was decoded all at once."""
+        values = cast("tuple[T, ...]", self._item_values)
+        bits = cast(bitarray, self._item_bits)
+        self._item_values = None
+        self._item_bits = None
+        prototype = cast(ParseGenericValue[T], get_item_prototype(self._array_item_class, self._array_item_default))
+        bit_count = prototype._bit_count
+        items: dict[str, ParseBase] = {}
+        for index, value in enumerate(values):
+            item = prototype.clone()
+            item._name = f"#{index}"
+            item._set_struct_value(value=value, bits=bits, offset=index * bit_count)
+            items[item._name] = item
+        bits_cache = self._bits_cache
+        self._children.replace(items)
+        self._bits_cache = bits_cache
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy sub-array data type description of this field.
+
+        Only arrays with a fixed number of sub-fields can be described by NumPy.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        if not isinstance(self._count, int) or self._count == 0 or len(self._get_children()) != self._count:
+            return None
+        spec = next(iter(self._get_children().values()))._get_numpy_dtype()
+        if spec is None:
+            return None
+        return (spec, (self._count,))
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the sub-fields of this field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
         """
-        bit_data = input_to_bytes(data=data)
+        return self._parse_items_at(bits=bits, offset=offset, lazy=False)
+
+    def _parse_lazy_at(self, bits: bitarray, offset: int) -> int:
+        """Create the sub-fields of this field, recording where each one is in a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+        """
+        if type(self).parse_at is not ParseValueArrayFieldGeneric.parse_at:
+            return self.parse_at(bits=bits, offset=offset)
+        return self._parse_items_at(bits=bits, offset=offset, lazy=True)
+
+    def _parse_items_at(self, bits: bitarray, offset: int, lazy: bool) -> int:
         if isinstance(self._count, UIntFieldGeneric):
             count = self._count.value
         else:
             count = self._count
         if count is not None:
+            end = self._parse_values_at(bits=bits, offset=offset, count=count)
+            if end is not None:
+                return end
+            children = self._get_children()
             for i in range(count):
                 f = self._array_item_class(
                     name=f"#{i}",
                     default=self._array_item_default,
                 )
-                bit_data = f.parse(data=bit_data)
-                self._children[f.name] = f
-        return bit_data
+                if lazy:
+                    offset = f._parse_lazy_at(bits=bits, offset=offset)
+                else:
+                    offset = f.parse_at(bits=bits, offset=offset)
+                children[f.name] = f
+        return offset
+
+    def _parse_values_at(self, bits: bitarray, offset: int, count: int) -> int | None:
+        """Decode all the items of this array with a single struct module call.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+            count: number of items
+
+        Returns:
+            the bit offset just past the end of this field, or None if the items have to be parsed one by one
+        """
+        if offset & 7 or count == 0 or self._get_item_count() > count:
+            return None
+        prototype = get_item_prototype(self._array_item_class, self._array_item_default)
+        if prototype is None:
+            return None
+        fmt = cast(str, prototype._get_struct_format())
+        end = offset + count * prototype._bit_count
+        if len(bits) < end:
+            return None
+        values = struct.unpack_from(f"{fmt[0]}{count}{fmt[1:]}", bits, offset >> 3)
+        self._set_item_values(values=values, bits=bits[offset:end])
+        return end
+
+    def _set_item_values(self, values: tuple[Any, ...], bits: bitarray) -> None:
+        """Replace all the items of this array with raw struct module values, without creating item fields.
+
+        Args:
+            values: the raw value of each item
+            bits: the bits of all the items
+        """
+        self._children.clear()
+        self._item_values = values
+        self._item_bits = bits
+        self._bits_cache = bits
+
+    def _get_item_count(self) -> int:
+        values = self._item_values
+        if values is not None:
+            return len(values)
+        return len(self._children)
 
     def create_default(self, default: Sequence[T] | Sequence[ParseGenericValue[T]]) -> None:
         """Create an array of default valued sub-fields for this array field.
@@ -278,7 +532,7 @@ class ParseValueArrayFieldGeneric(
                     name=f"#{i}",
                     default=cast(T, item),
                 )
-            self._children[f.name] = f
+            self._get_children()[f.name] = f
 
     def set_value(
         self,
@@ -307,7 +561,7 @@ class ParseValueArrayFieldGeneric(
                                 default=item,
                             )
                             item._set_parent_generic(self)
-                            self._children[item.name] = item
+                            self._get_children()[item.name] = item
                     else:
                         self[index] = cast("ParseGenericValue[T]", item)
             else:
@@ -325,7 +579,7 @@ class ParseValueArrayFieldGeneric(
                                 default=item,
                             )
                             item._set_parent_generic(self)
-                            self._children[item.name] = item
+                            self._get_children()[item.name] = item
                     else:
                         self[index] = cast("ParseGenericValue[T]", item)
 
@@ -337,6 +591,43 @@ class ParseValueArrayFieldGeneric(
         """
         self.children[value.name] = value
 
+    def get_value(self) -> Sequence[T]:
+        """Get the parsed value of the field.
+
+        Returns:
+            the value of the field
+        """
+        values = self._item_values
+        if values is not None and is_numeric_item(get_item_prototype(self._array_item_class, self._array_item_default)):
+            return list(values)
+        return super().get_value()
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:
+        """Get the parsed value(s) of the field(s).
+
+        Args:
+            index: index(s) or of the sub-field(s) to retrieve
+
+        Returns:
+            the value(s) of the field(s)
+        """
+        values = self._item_values
+        if (
+            values is not None
+            and not isinstance(index, slice)
+            and is_numeric_item(get_item_prototype(self._array_item_class, self._array_item_default))
+        ):
+            return values[index]
+        return super().__getitem__(index)
+
+    def __len__(self) -> int:
+        """Get the count of this field's sub-fields.
+
+        Returns:
+            the length of this field list
+        """
+        return self._get_item_count()
+
 
 class ParseValueArrayField(
     ParseValueArrayFieldGeneric[T, str],
@@ -348,6 +639,8 @@ class ParseValueArrayField(
     of fields with sub-fields.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -382,3 +675,285 @@ class ParseValueArrayField(
             data,
             string_format,
         )
+
+
+class ParseCompactArrayField(
+    ParseValueListGeneric[str, T],
+    Generic[T],
+):
+    """Array of uniform numeric values stored contiguously in an array.array.
+
+    This is a memory-efficient alternative to ParseValueArrayField for large arrays of integers or
+    floats. There are no item fields at all: indexing, iterating, slicing and assigning work on the
+    values directly, and the array is decoded and encoded in a single step.
+    """
+
+    __slots__ = (
+        "_count",
+        "_array_item_class",
+        "_array_item_default",
+        "_values",
+        "_byteswap",
+        "_item_string_format",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        count: UIntFieldGeneric[int] | int,
+        array_item_class: type[ParseGenericValue[T]],
+        array_item_default: T,
+        default: Sequence[T] | None = None,
+        data: dataT | None = None,
+        string_format: str = "{}",
+    ) -> None:
+        """Create an array of uniform numeric values stored contiguously in an array.array.
+
+        Args:
+            name: name of parsed object
+            count: number of values
+            array_item_class: field class that describes the encoding of each value (e.g. UInt16Field)
+            array_item_default: default value of the items
+            default: the default values for this field
+            data: bytes to be parsed
+            string_format: python format string (e.g. "{}")
+
+        Raises:
+            TypeError: if the values of the item class cannot be stored in an array.array
+        """
+        prototype = get_item_prototype(array_item_class, array_item_default)
+        fmt = None if prototype is None else prototype._get_struct_format()
+        if prototype is None or fmt is None or not is_numeric_item(prototype) or fmt[1] not in array.typecodes:
+            raise TypeError(f"{array_item_class.__name__} values cannot be stored in an array.array.")
+        values: array.array[Any] = array.array(fmt[1])
+        if values.itemsize != struct.calcsize(fmt[1:]):
+            raise TypeError(f"{array_item_class.__name__} values cannot be stored in an array.array.")
+        self._count = count
+        self._array_item_class = array_item_class
+        self._array_item_default = array_item_default
+        self._values = values
+        self._byteswap = values.itemsize > 1 and {"<": "little", ">": "big"}[fmt[0]] != sys.byteorder
+        self._item_string_format = prototype._string_format
+        super().__init__(
+            name=name,
+            data=None,
+            string_format=string_format,
+        )
+        if data is not None:
+            self.parse(data=data)
+        elif default is not None:
+            self.set_value(default)
+
+    def _create_children(self) -> ParseChildren:
+        """Compact arrays never have sub-fields, so they all share the same empty sub-field dictionary.
+
+        Returns:
+            the shared, read-only sub-field dictionary
+        """
+        return NO_CHILDREN
+
+    def _clone(self, memo: dict[int, ParseBase]) -> ParseBase:
+        """Create a copy of this field and its values, without calling any constructors.
+
+        A count field that was copied along with this field (normally a preceding sibling) is
+        replaced by its copy.
+
+        Args:
+            memo: the copies made so far, by the id of the field they were copied from
+
+        Returns:
+            a copy of this field
+        """
+        other = cast("ParseCompactArrayField[T]", super()._clone(memo=memo))
+        other._values = array.array(self._values.typecode, self._values)
+        other._bits_cache = self._bits_cache
+        other._bytes_cache = self._bytes_cache
+        if isinstance(self._count, UIntFieldGeneric):
+            other._count = memo.get(id(self._count), self._count)
+        return other
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy sub-array data type description of this field.
+
+        Only arrays with a fixed number of values can be described by NumPy.
+
+        Returns:
+            the data type description, or None if this field cannot be described by NumPy
+        """
+        if not isinstance(self._count, int) or self._count == 0:
+            return None
+        prototype = cast(ParseGenericValue[T], get_item_prototype(self._array_item_class, self._array_item_default))
+        return (prototype._get_numpy_dtype(), (self._count,))
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the values of this field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+
+        Raises:
+            IndexError: if there is too little data to parse this field
+        """
+        if isinstance(self._count, UIntFieldGeneric):
+            count = self._count.value
+        else:
+            count = self._count
+        values: array.array[Any] = array.array(self._values.typecode)
+        end = offset + count * values.itemsize * 8
+        if len(bits) < end:
+            raise IndexError("Too little data to parse field.")
+        if offset & 7:
+            values.frombytes(bits[offset:end].tobytes())
+        else:
+            with memoryview(bits) as view:  # pyright:ignore[reportGeneralTypeIssues]
+                values.frombytes(view[offset >> 3 : end >> 3])
+        if self._byteswap:
+            values.byteswap()
+        self._values = values
+        self._invalidate_bits_cache()
+        return end
+
+    def get_bits_lsb(self) -> bitarray:
+        """Get the bits of this field in least-significant-bit first format.
+
+        Returns:
+            lsb bits
+        """
+        bits = self._bits_cache
+        if bits is None:
+            values = self._values
+            if self._byteswap:
+                values = array.array(values.typecode, values)
+                values.byteswap()
+            bits = bitarray(endian="little")
+            bits.frombytes(values.tobytes())
+            self._bits_cache = bits
+        return bits
+
+    def get_value(self) -> list[T]:
+        """Get the values of this field.
+
+        Returns:
+            a list of the values of this field
+        """
+        return self._values.tolist()
+
+    def set_value(self, value: Iterable[T]) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
+        """Replace all the values of this field.
+
+        Args:
+            value: the new values
+        """
+        self._values = array.array(self._values.typecode, value)
+        self._invalidate_bits_cache()
+
+    @property
+    def values(self) -> array.array[Any]:
+        """Get the array that stores the values of this field (without copying it).
+
+        Call the set_value method to store changes made to this array directly.
+
+        Returns:
+            the array of values
+        """
+        return self._values
+
+    def get_field_at(self, index: int) -> ParseGenericValue[T]:
+        """Get a (detached) item field holding one of the values of this field.
+
+        Args:
+            index: index of the value
+
+        Returns:
+            a new item field with the value
+        """
+        prototype = cast(ParseGenericValue[T], get_item_prototype(self._array_item_class, self._array_item_default))
+        item = prototype.clone()
+        item._name = f"#{index}"
+        item.value = self._values[index]
+        return item
+
+    def get_string_value(self) -> str:
+        """Get a formatted value for the field (for any custom formatting).
+
+        Returns:
+            the value of the field with custom formatting
+        """
+        fmt = self._item_string_format
+        return f'[{", ".join([fmt.format(value) for value in self._values])}]'
+
+    def insert(self, index: SupportsIndex, value: T) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
+        """Insert a new value into this array.
+
+        Args:
+            index: the index at which the new value will be inserted
+            value: the new value
+        """
+        self._values.insert(int(index), value)
+        self._invalidate_bits_cache()
+
+    def append(self, value: T) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
+        """Append a new value to this array.
+
+        Args:
+            value: the new value
+        """
+        self._values.append(value)
+        self._invalidate_bits_cache()
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:
+        """Get one or more values of this field.
+
+        Args:
+            index: index or slice of the values
+
+        Returns:
+            the value, or a list of the values for a slice
+        """
+        if isinstance(index, slice):
+            return self._values[index].tolist()
+        return self._values[index]
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
+        """Set one or more values of this field.
+
+        Assigning to a slice can change the number of values, as with a list.
+
+        Args:
+            index: index or slice of the values
+            value: the new value, or an iterable of new values for a slice
+        """
+        if isinstance(index, slice):
+            self._values[index] = array.array(self._values.typecode, value)
+        else:
+            self._values[index] = value
+        self._invalidate_bits_cache()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete one or more values of this field.
+
+        Args:
+            index: index or slice of the values
+        """
+        del self._values[index]
+        self._invalidate_bits_cache()
+
+    def __len__(self) -> int:
+        """Get the number of values in this field.
+
+        Returns:
+            the number of values
+        """
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[T]:  # pyright:ignore[reportIncompatibleMethodOverride]
+        """Iterate over the values in this field.
+
+        Returns:
+            value iterator
+        """
+        return iter(self._values)
@@ -1,20 +1,274 @@
 """Classes for handling checksum fields."""
 from __future__ import annotations
 
+import binascii
+import enum
 import math
+import zlib
+from typing import Callable, Dict, Tuple, Union
 
 from bitarray import bitarray
 from bitarray.util import int2ba
-from crc import Calculator, Configuration
+from crc import Configuration
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, endianT
 from easyprotocol.base.utils import dataT, input_to_bytes
 from easyprotocol.fields.unsigned_int import UIntFieldGeneric
 
+crcKeyT = Tuple[int, int, int, int, bool, bool]
+crcDataT = Union[bytes, bytearray, memoryview]
+
+REVERSED_BYTES = bytes(int(f"{index:08b}"[::-1], 2) for index in range(256))
+"""Translation table that reverses the bit order of every byte."""
+
+CRC_ENGINES: Dict[crcKeyT, "CRCEngine"] = {}
+"""CRC engines by configuration, shared by all checksum fields."""
+
+
+def reflect(value: int, width: int) -> int:
+    """Reverse the bit order of an integer.
+
+    Args:
+        value: the integer
+        width: number of bits in the integer
+
+    Returns:
+        the integer with its bits in reverse order
+    """
+    return int(f"{value:0{width}b}"[::-1], 2)
+
+
+class CRCState:
+    """Running state of an incremental CRC calculation."""
+
+    __slots__ = ("_engine", "_register")
+
+    def __init__(self, engine: CRCEngine, register: int) -> None:
+        """Create the running state of an incremental CRC calculation.
+
+        Args:
+            engine: the engine that does the calculation
+            register: the current value of the CRC register
+        """
+        self._engine = engine
+        self._register = register
+
+    def update(self, data: crcDataT) -> CRCState:
+        """Add the next chunk of bytes to the calculation.
+
+        Args:
+            data: the next bytes
+
+        Returns:
+            this state
+        """
+        self._register = self._engine._update(data, self._register)
+        return self
+
+    def digest(self) -> int:
+        """Get the CRC of all the bytes added so far.
+
+        Returns:
+            the CRC
+        """
+        return self._engine._finish(self._register)
+
+    def copy(self) -> CRCState:
+        """Copy the state, e.g. to calculate the CRC of several messages that start with the same bytes.
+
+        Returns:
+            the copy
+        """
+        return CRCState(engine=self._engine, register=self._register)
+
+
+class CRCEngine:
+    """Table-driven CRC calculator for one configuration of the python crc module.
+
+    Engines hold no per-calculation state, so get_crc_engine shares one engine between all the
+    checksum fields with the same configuration. The standard CRC-32 and the CCITT family of CRC-16s
+    are calculated by zlib and binascii; all other configurations use a 256-entry lookup table.
+    """
+
+    __slots__ = ("configuration", "_initial", "_final_xor", "_reflect_output", "_table", "_update")
+
+    def __init__(self, configuration: Configuration) -> None:
+        """Create a table-driven CRC calculator.
+
+        Args:
+            configuration: configuration object from python crc module
+
+        Raises:
+            ValueError: if the width of the CRC is not a whole number of bytes
+        """
+        width = configuration.width
+        if width < 8 or width % 8 != 0:
+            raise ValueError(f"CRC width must be a whole number of bytes, not {width} bits")
+        self.configuration = configuration
+        mask = (1 << width) - 1
+        polynomial = configuration.polynomial & mask
+        self._initial = configuration.init_value & mask
+        self._final_xor = configuration.final_xor_value & mask
+        self._reflect_output = configuration.reverse_output
+        self._table: list[int] = []
+        self._update: Callable[[crcDataT, int], int]
+        if (
+            width == 32
+            and polynomial == 0x04C11DB7
+            and self._initial == mask
+            and self._final_xor == mask
+            and configuration.reverse_input
+            and configuration.reverse_output
+        ):
+            # zlib applies the initial value and the final xor itself.
+            self._initial = 0
+            self._final_xor = 0
+            self._reflect_output = False
+            self._update = zlib.crc32
+        elif width == 16 and polynomial == 0x1021 and not configuration.reverse_input:
+            self._update = binascii.crc_hqx
+        elif configuration.reverse_input and configuration.reverse_output:
+            # keep the register bit-reversed, so that neither the input nor the output need reversing.
+            polynomial = reflect(polynomial, width)
+            for index in range(256):
+                register = index
+                for _ in range(8):
+                    register = (register >> 1) ^ polynomial if register & 1 else register >> 1
+                self._table.append(register)
+            self._initial = reflect(self._initial, width)
+            self._reflect_output = False
+            self._update = self._update_reflected
+        else:
+            top_bit = 1 << (width - 1)
+            for index in range(256):
+                register = index << (width - 8)
+                for _ in range(8):
+                    register = ((register << 1) ^ polynomial if register & top_bit else register << 1) & mask
+                self._table.append(register)
+            if configuration.reverse_input:
+                self._update = self._update_reversed_input
+            else:
+                self._update = self._update_normal
+
+    def _update_reflected(self, data: crcDataT, register: int) -> int:
+        """Add bytes to a bit-reversed CRC register.
+
+        Args:
+            data: the bytes
+            register: the value of the CRC register
+
+        Returns:
+            the new value of the CRC register
+        """
+        table = self._table
+        for byte in data:
+            register = (register >> 8) ^ table[(register ^ byte) & 0xFF]
+        return register
+
+    def _update_normal(self, data: crcDataT, register: int) -> int:
+        """Add bytes to a CRC register.
+
+        Args:
+            data: the bytes
+            register: the value of the CRC register
+
+        Returns:
+            the new value of the CRC register
+        """
+        table = self._table
+        shift = self.configuration.width - 8
+        mask = (1 << self.configuration.width) - 1
+        for byte in data:
+            register = ((register << 8) & mask) ^ table[((register >> shift) ^ byte) & 0xFF]
+        return register
+
+    def _update_reversed_input(self, data: crcDataT, register: int) -> int:
+        """Add bytes to a CRC register, reversing the bit order of each byte first.
+
+        Args:
+            data: the bytes
+            register: the value of the CRC register
+
+        Returns:
+            the new value of the CRC register
+        """
+        return self._update_normal(bytes(data).translate(REVERSED_BYTES), register)
+
+    def _finish(self, register: int) -> int:
+        """Get the CRC from the value of the CRC register.
+
+        Args:
+            register: the value of the CRC register
+
+        Returns:
+            the CRC
+        """
+        if self._reflect_output:
+            register = reflect(register, self.configuration.width)
+        return register ^ self._final_xor
+
+    def start(self) -> CRCState:
+        """Start an incremental CRC calculation.
+
+        Returns:
+            the running state of the calculation
+        """
+        return CRCState(engine=self, register=self._initial)
+
+    def checksum(self, data: crcDataT) -> int:
+        """Calculate the CRC of some bytes.
+
+        Args:
+            data: the bytes
+
+        Returns:
+            the CRC
+        """
+        return self._finish(self._update(data, self._initial))
+
+    def verify(self, data: crcDataT, expected_checksum: int) -> bool:
+        """Check the CRC of some bytes.
+
+        Args:
+            data: the bytes
+            expected_checksum: the CRC that the bytes should have
+
+        Returns:
+            true if the bytes have the expected CRC
+        """
+        return self.checksum(data) == expected_checksum
+
+
+def get_crc_engine(configuration: Configuration | enum.Enum) -> CRCEngine:
+    """Get the shared CRC engine for a configuration, creating it the first time.
+
+    Args:
+        configuration: configuration object from python crc module, or one of its predefined configurations
+
+    Returns:
+        the CRC engine
+    """
+    if isinstance(configuration, enum.Enum):
+        configuration = configuration.value
+    key = (
+        configuration.width,
+        configuration.polynomial,
+        configuration.init_value,
+        configuration.final_xor_value,
+        configuration.reverse_input,
+        configuration.reverse_output,
+    )
+    engine = CRC_ENGINES.get(key)
+    if engine is None:
+        engine = CRC_ENGINES[key] = CRCEngine(configuration=configuration)
+    return engine
+
 
 class ChecksumField(UIntFieldGeneric[int]):
     """Base class for handling checksums."""
 
+    __slots__ = ("crc_calculator",)
+
     def __init__(
         self,
         name: str,
@@ -44,30 +298,85 @@ class ChecksumField(UIntFieldGeneric[int]):
             string_format=string_format,
             endian=endian,
         )
-        self.crc_calculator = Calculator(
-            configuration=crc_configuration,
-        )
+        self.crc_calculator = get_crc_engine(configuration=crc_configuration)
+
+    def calculate_checksum(self, frame: crcDataT) -> int:
+        """Calculate the value of this field from the bytes that it covers.
+
+        Args:
+            frame: the bytes covered by the checksum
+
+        Returns:
+            the checksum
+        """
+        crc_int = self.crc_calculator.checksum(frame)
+        crc_bytes = int.to_bytes(crc_int, length=math.ceil(self._bit_count / 8), byteorder="little")
+        return int.from_bytes(crc_bytes, byteorder=self._endian, signed=False)
+
+    def get_covered_bytes(self, frame: memoryview, start: int, end: int) -> crcDataT:
+        """Get the bytes that this field is the checksum of, which are those of the frame holding it except its own.
+
+        Args:
+            frame: the bytes of the field that holds this field
+            start: byte offset of this field in the frame
+            end: byte offset just past the end of this field in the frame
+
+        Returns:
+            the covered bytes
+        """
+        if end >= len(frame):
+            return frame[:start]
+        return bytes(frame[:start]) + bytes(frame[end:])
+
+    def get_byte_range(self) -> tuple[int, int]:
+        """Get where the bytes of this field are in the bytes of the field that holds it.
+
+        Returns:
+            the byte offset of this field, and the byte offset just past its end
+        """
+        bit_offset = 0
+        if self._parent is not None:
+            for child in self._parent._children.values():
+                if child is self:
+                    break
+                bit_offset += len(child.bits_lsb)
+        start = bit_offset // 8
+        return start, start + math.ceil(self._bit_count / 8)
 
     def update_field(self, data: dataT | None = None) -> tuple[int, bytes, bitarray]:
         """Update the field value by calculating it from the appropriate bytes.
 
         Args:
-            data: optional data to calculate the new checksum value from
+            data: optional data to calculate the new checksum value from. Defaults to the bytes of the
+                field that holds this field, except the bytes of this field.
 
         Returns:
             the new checksum, the bytes of the checksum, and the bits of the checksum
         """
+        byte_data: crcDataT = b""
         if data is None:
-            if self.parent is not None:
-                byte_data = bytes(self.parent)
-            else:
-                byte_data = b""
+            if self._parent is not None:
+                start, end = self.get_byte_range()
+                byte_data = self.get_covered_bytes(frame=memoryview(bytes(self._parent)), start=start, end=end)
         else:
             byte_data = input_to_bytes(data=data, bit_count=self._bit_count).tobytes()
-        crc_int = self.crc_calculator.checksum(byte_data)
-        byte_length = math.ceil(self._bit_count / 8)
-        crc_bytes = int.to_bytes(crc_int, length=byte_length, byteorder="little")
-        crc_int = int.from_bytes(crc_bytes, byteorder=self._endian, signed=False)
+        crc_int = self.calculate_checksum(byte_data)
+        crc_bytes = int.to_bytes(crc_int, length=math.ceil(self._bit_count / 8), byteorder=self._endian)
         crc_bits = int2ba(crc_int, length=self._bit_count)
         self.value = crc_int
         return (crc_int, crc_bytes, crc_bits)
+
+    def _validate_checksum(self, frame: memoryview, start: int, end: int) -> None:
+        """Check that the value of this field is the checksum of the frame holding it.
+
+        Args:
+            frame: the parsed bytes of the field that holds this field
+            start: byte offset of this field in the frame
+            end: byte offset just past the end of this field in the frame
+
+        Raises:
+            ValueError: if the value of this field is not the checksum of the frame
+        """
+        expected = self.calculate_checksum(self.get_covered_bytes(frame=frame, start=start, end=end))
+        if self.value != expected:
+            raise ValueError(f"Checksum {self._name} is {self.value:X} but should be {expected:X}")
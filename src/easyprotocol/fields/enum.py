@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from enum import IntEnum
-from typing import TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, endianT
 from easyprotocol.base.utils import dataT
@@ -10,10 +10,45 @@ from easyprotocol.fields.unsigned_int import UIntFieldGeneric
 
 E = TypeVar("E", bound=Union[IntEnum, int])
 
+ENUM_MEMBERS: dict[type, dict[int, Any]] = {}
+"""The member of each enumeration class for each value looked up (or the plain value if undefined), by class."""
+
+ENUM_MEMBERS_LIMIT = 4096
+"""The maximum number of values to remember per enumeration class, so that wide fields cannot grow it forever."""
+
+
+def get_enum_member(enum_type: type[E], value: int) -> E:
+    """Get the member of an enumeration class that has a value, looking it up only once per class and value.
+
+    The lookup is shared by all the fields that use the class, flags included.
+
+    Args:
+        enum_type: the Enum.IntEnum (or Enum.IntFlag) class
+        value: the integer value
+
+    Returns:
+        the member with the value, or the value itself if the class does not define it
+    """
+    members = ENUM_MEMBERS.get(enum_type)
+    if members is None:
+        members = {member.value: member for member in enum_type}  # pyright:ignore[reportGeneralTypeIssues]
+        ENUM_MEMBERS[enum_type] = members
+    member = members.get(value)
+    if member is None:
+        try:
+            member = enum_type(value)
+        except Exception:
+            member = value
+        if len(members) < ENUM_MEMBERS_LIMIT:
+            members[value] = member
+    return member
+
 
 class EnumField(UIntFieldGeneric[E]):
     """Base IntEnum parsing class."""
 
+    __slots__ = ("_enum_type",)
+
     def __init__(
         self,
         name: str,
@@ -53,11 +88,7 @@ class EnumField(UIntFieldGeneric[E]):
         Returns:
             the parsed value of this class
         """
-        v = super().get_value()
-        try:
-            return self._enum_type(v)
-        except Exception:
-            return v
+        return get_enum_member(self._enum_type, super().get_value())
 
     def set_value(self, value: E) -> None:
         """Set the value of this field.
@@ -101,6 +132,8 @@ class EnumField(UIntFieldGeneric[E]):
 class UInt8EnumField(EnumField[E]):
     """Eight bit enum parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -134,12 +167,14 @@ class UInt8EnumField(EnumField[E]):
 class Enum8Field(UInt8EnumField[E]):
     """Eight bit enum parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt16EnumField(EnumField[E]):
     """Sixteen bit enum parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -173,12 +208,14 @@ class UInt16EnumField(EnumField[E]):
 class Enum16Field(UInt16EnumField[E]):
     """Sixteen bit enum parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt24EnumField(EnumField[E]):
     """Twenty-four bit enum parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -212,12 +249,14 @@ class UInt24EnumField(EnumField[E]):
 class Enum24Field(UInt24EnumField[E]):
     """Twenty-four bit enum parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt32EnumField(EnumField[E]):
     """Thirty-two bit enum parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -251,4 +290,4 @@ class UInt32EnumField(EnumField[E]):
 class Enum32Field(UInt32EnumField[E]):
     """Thirty-two bit enum parsing class."""
 
-    ...
+    __slots__ = ()
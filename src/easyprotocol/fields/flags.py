@@ -2,18 +2,75 @@
 from __future__ import annotations
 
 from enum import IntFlag
-from typing import Sequence, TypeVar, Union, cast
+from typing import TypeVar, Union, cast
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, endianT
 from easyprotocol.base.utils import dataT
+from easyprotocol.fields.enum import ENUM_MEMBERS_LIMIT, get_enum_member
 from easyprotocol.fields.unsigned_int import UIntFieldGeneric
 
 F = TypeVar("F", bound=Union[IntFlag, int])
 
 
+class FlagNames:
+    """The names of the flags that are set in each value of an Enum.IntFlag class, worked out once per value."""
+
+    __slots__ = ("_members", "_names")
+
+    def __init__(self, flags_type: type[IntFlag]) -> None:
+        """Create the flag names of an Enum.IntFlag class.
+
+        Args:
+            flags_type: the Enum.IntFlag class
+        """
+        self._members = [
+            (member.value, member.name)
+            for member in flags_type._member_map_.values()  # pyright:ignore[reportGeneralTypeIssues]
+            if member.name
+        ]
+        self._names: dict[int, str] = {}
+
+    def get(self, value: int) -> str:
+        """Get the names of the flags that are set in a value.
+
+        Args:
+            value: the integer value
+
+        Returns:
+            the names of the flags, separated by "|"
+        """
+        names = self._names.get(value)
+        if names is None:
+            names = "|".join([name for flag, name in self._members if flag & value == flag])
+            if len(self._names) < ENUM_MEMBERS_LIMIT:
+                self._names[value] = names
+        return names
+
+
+FLAG_NAMES: dict[type, FlagNames] = {}
+"""The flag names of each Enum.IntFlag class used by a flags field, by class."""
+
+
+def get_flag_names(flags_type: type[IntFlag]) -> FlagNames:
+    """Get the shared flag names of an Enum.IntFlag class, creating them the first time.
+
+    Args:
+        flags_type: the Enum.IntFlag class
+
+    Returns:
+        the flag names
+    """
+    flag_names = FLAG_NAMES.get(flags_type)
+    if flag_names is None:
+        flag_names = FLAG_NAMES[flags_type] = FlagNames(flags_type=flags_type)
+    return flag_names
+
+
 class FlagsField(UIntFieldGeneric[F]):
     """Base flags parsing class."""
 
+    __slots__ = ("_flags_type",)
+
     def __init__(
         self,
         name: str,
@@ -53,11 +110,7 @@ class FlagsField(UIntFieldGeneric[F]):
         Returns:
             the parsed value of this class
         """
-        v = super().get_value()
-        try:
-            return cast("F", self._flags_type(v))
-        except Exception:
-            return v
+        return cast("F", get_enum_member(self._flags_type, super().get_value()))
 
     def set_value(self, value: F) -> None:
         """Set the value of this field.
@@ -78,10 +131,8 @@ class FlagsField(UIntFieldGeneric[F]):
             the value of the field with custom formatting
         """
         value = self.value
-        flags_dict: dict[str, IntFlag] = dict(self._flags_type._member_map_)  # pyright:ignore[reportGeneralTypeIssues]
-        flags: Sequence[IntFlag] = list(flags_dict.values())
         if isinstance(value, IntFlag):
-            s = "|".join([v.name for v in flags if v in value and v.name])
+            s = get_flag_names(self._flags_type).get(value.value)
         else:
             s = str(value)
         return self.string_format.format(s)
@@ -103,6 +154,8 @@ class FlagsField(UIntFieldGeneric[F]):
 class UInt8FlagsField(FlagsField[F]):
     """Eight bit flags parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -136,12 +189,14 @@ class UInt8FlagsField(FlagsField[F]):
 class Flags8Field(UInt8FlagsField[F]):
     """Eight bit flags parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt16FlagsField(FlagsField[F]):
     """Sixteen bit flags parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -175,12 +230,14 @@ class UInt16FlagsField(FlagsField[F]):
 class Flags16Field(UInt16FlagsField[F]):
     """Sixteen bit flags parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt24FlagsField(FlagsField[F]):
     """Twenty-four bit flags parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -214,12 +271,14 @@ class UInt24FlagsField(FlagsField[F]):
 class Flags24Field(UInt24FlagsField[F]):
     """Twenty-four bit flags parsing class."""
 
-    ...
+    __slots__ = ()
 
 
 class UInt32FlagsField(FlagsField[F]):
     """Thirty-two bit flags parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -253,4 +312,4 @@ class UInt32FlagsField(FlagsField[F]):
 class Flags32Field(UInt32FlagsField[F]):
     """Thirty-two bit flags parsing class."""
 
-    ...
+    __slots__ = ()
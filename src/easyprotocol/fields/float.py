@@ -1,23 +1,26 @@
 """Floating point-number field parsing."""
 from __future__ import annotations
 
-import math
 import struct
 from typing import Any, Generic, TypeVar, Union, cast
 
 from bitarray import bitarray
+from bitarray.util import zeros
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, endianT
 from easyprotocol.base.parse_generic_value import ParseGenericValue
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.utils import dataT
 
 F = TypeVar("F", bound=Union[float, Any])
 FLOAT_STRING_FORMAT = "{:.3e}"
+FLOAT32_STRUCTS: dict[str, struct.Struct] = {"little": struct.Struct("<f"), "big": struct.Struct(">f")}
 
 
 class FloatField(ParseGenericValue[F]):
     """The base floating-point number field parsing."""
 
+    __slots__ = ("bit_count",)
+
     def __init__(
         self,
         name: str,
@@ -44,6 +47,7 @@ class FloatField(ParseGenericValue[F]):
             name=name,
             data=data,
             default=default,
+            bit_count=bit_count,
             string_format=string_format,
             endian=endian,
         )
@@ -58,6 +62,8 @@ class Float32IEEFieldGeneric(
     This class is generic in case there is some other class in the future that can inherit from it.
     """
 
+    __slots__ = ("_value_cache", "_value_cache_bits")
+
     def __init__(
         self,
         name: str,
@@ -77,6 +83,8 @@ class Float32IEEFieldGeneric(
             string_format: python format string (e.g. "{}")
             endian: the byte endian-ness of this object
         """
+        self._value_cache: F = cast(F, 0.0)
+        self._value_cache_bits: bitarray | None = None
         super().__init__(
             name,
             bit_count=32,
@@ -86,41 +94,26 @@ class Float32IEEFieldGeneric(
             endian=endian,
         )
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse bytes that make up this field into meaningful data.
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the bits of this field from a shared buffer of bits.
 
         Args:
-            data: bytes to be parsed
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing this field
+            the bit offset just past the end of this field
 
         Raises:
             IndexError: if there is insufficient data to parse this field
         """
-        bits = input_to_bytes(
-            data=data,
-            bit_count=self.bit_count,
-        )
-        _bit_mask = (2**self.bit_count) - 1
-        bit_mask = bitarray(endian="little")
-        bit_mask.frombytes(
-            int.to_bytes(_bit_mask, length=math.ceil(self.bit_count / 8), byteorder="little", signed=False)
-        )
-        if len(bit_mask) < len(bits):
-            bit_mask = bit_mask + bitarray("0" * (len(bits) - len(bit_mask)), endian="little")
-        if len(bits) < len(bit_mask) or len(bits) < self._bit_count:
+        end = offset + self.bit_count
+        if len(bits) < end:
             raise IndexError("Too little data to parse field.")
-        my_bits = (bits & bit_mask)[: self.bit_count]
-        temp_bits = bitarray(my_bits)
-        byte_count = math.ceil(self.bit_count / 8)
-        if len(temp_bits) < byte_count * 8:
-            temp_bits = temp_bits + bitarray("0" * ((byte_count * 8) - len(temp_bits)), endian="little")
-        self._bits = my_bits[: self.bit_count]
-        if len(bits) >= self.bit_count:
-            return bits[self.bit_count :]
-        else:
-            return bitarray(endian="little")
+        self._bits = bits[offset:end]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
+        return end
 
     def get_value(self) -> F:
         """Get the parsed value of this class.
@@ -128,11 +121,12 @@ class Float32IEEFieldGeneric(
         Returns:
             the parsed value of this class
         """
-        b = self.bits_lsb.tobytes()
-        if self.endian == "little":
-            return cast(F, struct.unpack("<f", b)[0])
-        else:
-            return cast(F, struct.unpack(">f", b)[0])
+        if self._value_cache_bits is self._bits and self._lazy_bits is None:
+            return self._value_cache
+        _bits = self.bits_lsb
+        self._value_cache = cast(F, FLOAT32_STRUCTS[self._endian].unpack(_bits.tobytes())[0])
+        self._value_cache_bits = _bits
+        return self._value_cache
 
     def set_value(self, value: F) -> None:
         """Set the value of this field.
@@ -140,13 +134,11 @@ class Float32IEEFieldGeneric(
         Args:
             value: the new value to assign to this field
         """
-        if self.endian == "little":
-            bytes_val = bytearray(struct.pack("<f", value))
-        else:
-            bytes_val = bytearray(struct.pack(">f", value))
         bits = bitarray(endian="little")
-        bits.frombytes(bytes_val)
+        bits.frombytes(FLOAT32_STRUCTS[self._endian].pack(value))
         self._bits = bits
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
 
     def __bytes__(self) -> bytes:
         """Get the bytes that make up this field.
@@ -154,7 +146,7 @@ class Float32IEEFieldGeneric(
         Returns:
             the bytes of this field
         """
-        return self._bits.tobytes()
+        return self.get_bits_lsb().tobytes()
 
     def set_bits_lsb(self, bits: bitarray) -> None:
         """Set the bits of this field in least-significant-bit first format.
@@ -169,8 +161,54 @@ class Float32IEEFieldGeneric(
         else:
             _bits = bits
         if len(_bits) < self.bit_count:
-            _bits = _bits + bitarray("0" * (self.bit_count - len(_bits)), endian="little")
+            _bits = _bits + zeros(self.bit_count - len(_bits), endian="little")
         self._bits = _bits[: self.bit_count]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
+
+    def _get_struct_format(self) -> str | None:
+        """Get the struct module format (including byte order) of this field.
+
+        Returns:
+            the struct format, or None if this field cannot be decoded by the struct module
+        """
+        if not self._uses_default_codec(Float32IEEFieldGeneric):
+            return None
+        if self._endian == "little":
+            return "<f"
+        return ">f"
+
+    def _get_struct_value(self) -> float:
+        """Get the raw value of this field to be packed by the struct module.
+
+        Returns:
+            the floating-point value of this field
+        """
+        return Float32IEEFieldGeneric.get_value(self)
+
+    def _set_struct_value(self, value: Any, bits: bitarray, offset: int) -> None:
+        """Set this field from a raw value that was unpacked by the struct module.
+
+        The bits are still sliced from the buffer so that NaN payloads are kept exactly.
+
+        Args:
+            value: the raw unpacked value
+            bits: the buffer the value was unpacked from
+            offset: bit offset of this field in the buffer
+        """
+        self._bits = bits[offset : offset + self.bit_count]
+        self._value_cache = value
+        self._value_cache_bits = self._bits
+
+    def _get_lazy_bit_count(self) -> int | None:
+        """Get the number of bits this field takes up when it is parsed lazily.
+
+        Returns:
+            the bit count, or None if this field cannot be parsed lazily
+        """
+        if not self._uses_default_codec(Float32IEEFieldGeneric):
+            return None
+        return self._bit_count
 
     def get_string_value(self) -> str:
         """Get the string value of this field.
@@ -184,10 +222,10 @@ class Float32IEEFieldGeneric(
 class Float32IEEField(Float32IEEFieldGeneric[float]):
     """Thirty-two bit IEEE floating-point number field parsing."""
 
-    ...
+    __slots__ = ()
 
 
 class Float32Field(Float32IEEField):
     """Thirty-two bit IEEE floating-point number field parsing."""
 
-    ...
+    __slots__ = ()
@@ -1,14 +1,14 @@
 """Signed integer parsing fields."""
 from __future__ import annotations
 
-import math
 from typing import Any, Generic, TypeVar, Union, cast
 
 from bitarray import bitarray
+from bitarray.util import zeros
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS, endianT
 from easyprotocol.base.parse_generic_value import ParseGenericValue
-from easyprotocol.base.utils import dataT, input_to_bytes
+from easyprotocol.base.utils import dataT, get_bit_count_info
 
 INT_STRING_FORMAT = "{}"
 INT08_STRING_FORMAT = "{}"
@@ -16,6 +16,7 @@ INT16_STRING_FORMAT = "{}"
 INT24_STRING_FORMAT = "{}"
 INT32_STRING_FORMAT = "{}"
 INT64_STRING_FORMAT = "{}"
+INT_STRUCT_FORMATS: dict[int, str] = {8: "b", 16: "h", 32: "i", 64: "q"}
 
 T = TypeVar("T", bound=Union[Any, int])
 
@@ -26,6 +27,8 @@ class IntFieldGeneric(
 ):
     """Base signed integer parsing class."""
 
+    __slots__ = ("_value_cache", "_value_cache_bits", "_bit_count_info")
+
     def __init__(
         self,
         name: str,
@@ -45,6 +48,9 @@ class IntFieldGeneric(
             string_format: python format string (e.g. "{}")
             endian: the byte endian-ness of this object
         """
+        self._value_cache: T = cast(T, 0)
+        self._value_cache_bits: bitarray | None = None
+        self._bit_count_info = get_bit_count_info(bit_count)
         super().__init__(
             name=name,
             default=default,
@@ -54,39 +60,26 @@ class IntFieldGeneric(
             endian=endian,
         )
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse the bits of this field into meaningful data.
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the bits of this field from a shared buffer of bits.
 
         Args:
-            data: bytes to be parsed
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit offset just past the end of this field
 
         Raises:
             IndexError: if there is too little data to parse this field
         """
-        bits = input_to_bytes(
-            data=data,
-            bit_count=self._bit_count,
-        )
-        _bit_mask = (2**self._bit_count) - 1
-        bit_mask = bitarray(endian="little")
-        bit_mask.frombytes(
-            int.to_bytes(_bit_mask, length=math.ceil(self._bit_count / 8), byteorder="little", signed=False)
-        )
-        if len(bit_mask) < len(bits):
-            bit_mask = bit_mask + bitarray("0" * (len(bits) - len(bit_mask)), endian="little")
-        elif len(bit_mask) > len(bits):
-            bit_mask = bit_mask[: len(bits)]
-        if len(bits) < len(bit_mask) or len(bits) == 0 or len(bits) < self._bit_count:
+        end = offset + self._bit_count
+        if len(bits) < end or len(bits) == offset:
             raise IndexError("Too little data to parse field.")
-        my_bits = (bits & bit_mask)[: self._bit_count]
-        self._bits = my_bits[: self._bit_count]
-        if len(bits) >= self._bit_count:
-            return bits[self._bit_count :]
-        else:
-            return bitarray(endian="little")
+        self._bits = bits[offset:end]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
+        return end
 
     def get_value(self) -> T:
         """Get the parsed value of this class.
@@ -94,14 +87,12 @@ class IntFieldGeneric(
         Returns:
             the parsed value of this class
         """
+        if self._value_cache_bits is self._bits and self._lazy_bits is None:
+            return self._value_cache
         _bits = self.bits_lsb
-        m = len(_bits) % 8
-        if m != 0:
-            bits = _bits + bitarray([False] * (8 - m))
-        else:
-            bits = _bits
-        b = bits.tobytes()
-        return cast(T, int.from_bytes(bytes=b, byteorder=self.endian, signed=True))
+        self._value_cache = cast(T, int.from_bytes(bytes=_bits.tobytes(), byteorder=self._endian, signed=True))
+        self._value_cache_bits = _bits
+        return self._value_cache
 
     def set_value(self, value: T) -> None:
         """Set the value of this field.
@@ -115,11 +106,23 @@ class IntFieldGeneric(
             _value = int(value)
         else:
             _value = value
-        byte_count = math.ceil(self._bit_count / 8)
-        my_bytes = int.to_bytes(_value, length=byte_count, byteorder=self.endian, signed=True)
-        bits = bitarray(endian="little")
-        bits.frombytes(my_bytes)
-        self._bits = bits[: self._bit_count]
+        info = self._bit_count_info
+        if info.int_backed:
+            if _value < -info.signed_limit or _value >= info.signed_limit:
+                # raise the same error as converting the value to bytes
+                int.to_bytes(_value, length=info.byte_count, byteorder=self._endian, signed=True)
+            self._bits = None  # pyright:ignore[reportGeneralTypeIssues]
+            if self._bit_count < 8:
+                _value &= info.mask
+            self._value_cache = cast(T, int(_value))
+            self._value_cache_bits = None
+        else:
+            my_bytes = int.to_bytes(_value, length=info.byte_count, byteorder=self._endian, signed=True)
+            bits = bitarray(endian="little")
+            bits.frombytes(my_bytes)
+            self._bits = bits[: self._bit_count]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
 
     def get_string_value(self) -> str:
         """Get the string value of this field.
@@ -142,6 +145,75 @@ class IntFieldGeneric(
     def value(self, value: T) -> None:
         self.set_value(value)
 
+    def get_bits_lsb(self) -> bitarray:
+        """Get the bits of this field in least-significant-bit first format.
+
+        Returns:
+            lsb bits
+        """
+        if self._bits is None:
+            if self._lazy_bits is not None:
+                return self._load_lazy_bits()
+            bits = bitarray(endian="little")
+            bits.frombytes(
+                int.to_bytes(
+                    self._value_cache, length=self._bit_count_info.byte_count, byteorder=self._endian, signed=True
+                )
+            )
+            if self._bit_count < 8:
+                bits = bits[: self._bit_count]
+            self._bits = bits
+            self._value_cache_bits = bits
+        return self._bits
+
+    def _get_struct_format(self) -> str | None:
+        """Get the struct module format (including byte order) of this field.
+
+        Returns:
+            the struct format, or None if this field cannot be decoded by the struct module
+        """
+        if not self._uses_default_codec(IntFieldGeneric):
+            return None
+        code = INT_STRUCT_FORMATS.get(self._bit_count)
+        if code is None:
+            return None
+        if self._endian == "little":
+            return "<" + code
+        return ">" + code
+
+    def _get_struct_value(self) -> int:
+        """Get the raw value of this field to be packed by the struct module.
+
+        Returns:
+            the raw integer value of this field
+        """
+        return IntFieldGeneric.get_value(self)
+
+    def _set_struct_value(self, value: Any, bits: bitarray, offset: int) -> None:
+        """Set this field from a raw value that was unpacked by the struct module.
+
+        The bits of this field are only created if they are requested.
+
+        Args:
+            value: the raw unpacked value
+            bits: the buffer the value was unpacked from
+            offset: bit offset of this field in the buffer
+        """
+        self._bits = None  # pyright:ignore[reportGeneralTypeIssues]
+        self._lazy_bits = None
+        self._value_cache = value
+        self._value_cache_bits = None
+
+    def _get_lazy_bit_count(self) -> int | None:
+        """Get the number of bits this field takes up when it is parsed lazily.
+
+        Returns:
+            the bit count, or None if this field cannot be parsed lazily
+        """
+        if not self._uses_default_codec(IntFieldGeneric):
+            return None
+        return self._bit_count
+
     def set_bits_lsb(self, bits: bitarray) -> None:
         """Set the bits of this field in least-significant-bit first format.
 
@@ -151,20 +223,24 @@ class IntFieldGeneric(
         if bits.endian() != "little":
             m = len(bits) % 8
             if m != 0:
-                bits = bitarray([False] * (8 - m)) + bits
+                bits = zeros(8 - m) + bits
             v = bits.tobytes()
             _bits = bitarray(endian="little")
             _bits.frombytes(v)
         else:
             _bits = bits
         if len(_bits) < self._bit_count:
-            _bits = _bits + bitarray("0" * (self._bit_count - len(_bits)), endian="little")
+            _bits = _bits + zeros(self._bit_count - len(_bits), endian="little")
         self._bits = _bits[: self._bit_count]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
 
 
 class IntField(IntFieldGeneric[int]):
     """Signed integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -197,6 +273,8 @@ class IntField(IntFieldGeneric[int]):
 class Int8Field(IntField):
     """Signed eight bit integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -227,6 +305,8 @@ class Int8Field(IntField):
 class Int16Field(IntField):
     """Signed sixteen bit integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -257,6 +337,8 @@ class Int16Field(IntField):
 class Int24Field(IntField):
     """Signed twenty-four bit integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -287,6 +369,8 @@ class Int24Field(IntField):
 class Int32Field(IntField):
     """Signed thirty-two bit integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -317,6 +401,8 @@ class Int32Field(IntField):
 class Int64Field(IntField):
     """Signed sixty-four bit integer parsing class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
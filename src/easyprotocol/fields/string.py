@@ -1,14 +1,14 @@
 """String and bytes parsing fields."""
 from __future__ import annotations
 
-import math
 import struct
-from typing import cast
+from typing import Any, Generic, TypeVar
 
 from bitarray import bitarray
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS
-from easyprotocol.base.utils import dataT
+from easyprotocol.base.parse_generic_value import ParseGenericValue
+from easyprotocol.base.utils import dataT, hex
 from easyprotocol.fields.array import ParseValueArrayField
 from easyprotocol.fields.unsigned_int import UIntField, UIntFieldGeneric
 
@@ -16,11 +16,43 @@ DEFAULT_CHAR_FORMAT: str = '"{}"'
 DEFAULT_STRING_FORMAT: str = '"{}"'
 DEFAULT_BYTE_FORMAT: str = '"{}"(byte)'
 DEFAULT_BYTES_FORMAT: str = '"{}"(bytes)'
+NUL_BITS = bitarray("00000000", endian="little")
+
+T = TypeVar("T")
+
+
+def set_array_bytes(field: ParseValueArrayField[Any], data: bytes, padding: bytes) -> None:
+    """Replace all the bytes of a string or bytes field at once.
+
+    The item fields of the field are only created if they are used, and a count field (if any)
+    is set to the new number of bytes. A field with a fixed count keeps its size, so shorter
+    values are padded.
+
+    Args:
+        field: the string or bytes field
+        data: the new bytes
+        padding: the byte(s) to pad shorter values with, if the field has a fixed count
+
+    Raises:
+        ValueError: if the field has a fixed count and the value has more bytes than that
+    """
+    count = field._count
+    if isinstance(count, int) and count > 0 and len(data) != count:
+        if len(data) > count:
+            raise ValueError(f"{field._name} holds {count} bytes, it cannot be set to {len(data)} bytes")
+        data = (data + padding * count)[:count]
+    bits = bitarray(endian="little")
+    bits.frombytes(data)
+    field._set_item_values(values=tuple(data), bits=bits)
+    if isinstance(field._count, UIntFieldGeneric):
+        field._count.value = len(data)
 
 
 class CharField(UIntFieldGeneric[str]):
     """Single ASCII character field."""
 
+    __slots__ = ("_string_encoding",)
+
     def __init__(
         self,
         name: str,
@@ -67,21 +99,29 @@ class CharField(UIntFieldGeneric[str]):
             value: the new value to assign to this field
         """
         _value = ord(value[0])
-        byte_count = math.ceil(self._bit_count / 8)
+        byte_count = self._bit_count_info.byte_count
         my_bytes = int.to_bytes(_value, length=byte_count, byteorder=self.endian, signed=False)
         bits = bitarray(endian="little")
         bits.frombytes(my_bytes)
         self._bits = bits[: self._bit_count]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
 
 
 class UInt8CharField(CharField):
     """Single ASCII character field."""
 
-    ...
+    __slots__ = ()
 
 
 class StringField(ParseValueArrayField[str]):
-    """String parsing field."""
+    """String parsing field.
+
+    The string is decoded from (and encoded to) all of its bytes at once. With a count field
+    instead of a fixed count, the field is count-prefixed: setting the value updates the count.
+    """
+
+    __slots__ = ("_string_encoding",)
 
     def __init__(
         self,
@@ -110,10 +150,21 @@ class StringField(ParseValueArrayField[str]):
             count=count,
             array_item_class=CharField,
             array_item_default=char_default,
-            default=[s for s in default],
             data=data,
             string_format=string_format,
         )
+        if data is None and len(default) > 0:
+            self.set_value(default)
+
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy data type description of this field, a fixed-size byte string.
+
+        Returns:
+            the data type description, or None if this field does not have a fixed size
+        """
+        if not isinstance(self._count, int) or self._count == 0:
+            return None
+        return f"S{self._count}"
 
     def get_value(self) -> str:
         """Get the parsed value of this class.
@@ -121,7 +172,7 @@ class StringField(ParseValueArrayField[str]):
         Returns:
             the parsed value of this class
         """
-        return "".join([v.value for v in self.children.values()])
+        return bytes(self).decode(self._string_encoding)
 
     def set_value(self, value: str) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
         """Set the value of this field.
@@ -131,14 +182,11 @@ class StringField(ParseValueArrayField[str]):
         """
         if value is None:
             return
-        for index, item in enumerate(value):
-            if index < len(self._children):
-                kid = cast(CharField, self[index])
-                kid.value = item
-            else:
-                f = self._array_item_class(f"#{index}", default=self._array_item_default)
-                f.value = item
-                self._children[f.name] = f
+        set_array_bytes(
+            self,
+            value.encode(self._string_encoding),
+            padding=self._array_item_default.encode(self._string_encoding),
+        )
 
     @property
     def value(self) -> str:
@@ -165,6 +213,8 @@ class StringField(ParseValueArrayField[str]):
 class ByteField(UIntFieldGeneric[bytes]):
     """Single byte field that returns bytes object instead of int."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -222,11 +272,13 @@ class ByteField(UIntFieldGeneric[bytes]):
             _value = struct.pack("s", value[0])[0]
         else:
             _value = int(value)
-        byte_count = math.ceil(self._bit_count / 8)
+        byte_count = self._bit_count_info.byte_count
         my_bytes = int.to_bytes(_value, length=byte_count, byteorder=self.endian, signed=False)
         bits = bitarray(endian="little")
         bits.frombytes(my_bytes)
         self._bits = bits[: self._bit_count]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
 
     def get_string_value(self) -> str:
         """Get a formatted value for the field (for any custom formatting).
@@ -240,11 +292,17 @@ class ByteField(UIntFieldGeneric[bytes]):
 class UInt8ByteField(ByteField):
     """Single byte field that returns bytes object instead of int."""
 
-    ...
+    __slots__ = ()
 
 
 class BytesField(ParseValueArrayField[bytes]):
-    """Variable length bytes field that returns bytes."""
+    """Variable length bytes field that returns bytes.
+
+    With a count field instead of a fixed count, the field is count-prefixed: setting the value
+    updates the count.
+    """
+
+    __slots__ = ()
 
     def __init__(
         self,
@@ -270,10 +328,11 @@ class BytesField(ParseValueArrayField[bytes]):
             count=count,
             array_item_class=ByteField,
             array_item_default=byte_default,
-            default=[bytes([b]) for b in default],
             data=data,
             string_format=string_format,
         )
+        if data is None and len(default) > 0:
+            self.set_value(default)
 
     @property
     def value(self) -> bytes:  # pyright:ignore[reportIncompatibleMethodOverride]
@@ -288,13 +347,23 @@ class BytesField(ParseValueArrayField[bytes]):
     def value(self, value: bytes) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
         self.set_value(value=value)
 
+    def _get_numpy_dtype(self) -> Any:
+        """Get the NumPy data type description of this field, a fixed-size byte string.
+
+        Returns:
+            the data type description, or None if this field does not have a fixed size
+        """
+        if not isinstance(self._count, int) or self._count == 0:
+            return None
+        return f"S{self._count}"
+
     def get_value(self) -> bytes:  # pyright:ignore[reportIncompatibleMethodOverride]
         """Get the parsed value of this class.
 
         Returns:
             the parsed value of this class
         """
-        return b"".join([v.value for v in self.children.values()])
+        return bytes(self)
 
     def set_value(self, value: bytes) -> None:  # pyright:ignore[reportIncompatibleMethodOverride]
         """Set the value of this field.
@@ -302,17 +371,9 @@ class BytesField(ParseValueArrayField[bytes]):
         Args:
             value: the new value to assign to this field
         """
-        for index, item in enumerate(value):
-            if index < len(self._children):
-                kid = cast(ByteField, self[index])
-                kid.value = item
-            else:
-                f = self._array_item_class(
-                    name=f"#{index}",
-                    default=self._array_item_default,
-                )
-                f.value = bytes([item])
-                self._children[f.name] = f
+        if value is None:
+            return
+        set_array_bytes(self, bytes(value), padding=self._array_item_default)
 
     def get_string_value(self) -> str:
         """Get a formatted value for the field (for any custom formatting).
@@ -321,3 +382,191 @@ class BytesField(ParseValueArrayField[bytes]):
             the value of the field with custom formatting
         """
         return self.string_format.format(self.get_hex_value())
+
+
+class NullTerminatedFieldGeneric(
+    ParseGenericValue[T],
+    Generic[T],
+):
+    """Base class for variable length fields that end with a null byte."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        default: T,
+        data: dataT | None = None,
+        string_format: str = "{}",
+    ) -> None:
+        """Create base class for variable length fields that end with a null byte.
+
+        Args:
+            name: name of parsed object
+            default: the default value for this class
+            data: bytes to be parsed
+            string_format: python format string (e.g. "{}")
+        """
+        super().__init__(
+            name=name,
+            default=default,
+            data=data,
+            string_format=string_format,
+            endian=DEFAULT_ENDIANNESS,
+        )
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the bits of this field, up to and including the null byte, from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+
+        Raises:
+            IndexError: if there is no null byte in the data
+        """
+        position = bits.find(NUL_BITS, offset)
+        while position != -1 and (position - offset) & 7:
+            position = bits.find(NUL_BITS, position + 1)
+        if position == -1:
+            raise IndexError("Too little data to parse field.")
+        end = position + 8
+        self._bits = bits[offset:end]
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
+        return end
+
+    def _get_data(self) -> bytes:
+        """Get the bytes of this field without the null byte.
+
+        Returns:
+            the bytes of this field
+        """
+        return bytes(self)[:-1]
+
+    def _set_data(self, data: bytes) -> None:
+        """Set the bytes of this field, appending the null byte.
+
+        Args:
+            data: the bytes of this field
+
+        Raises:
+            ValueError: if the bytes contain a null byte
+        """
+        if b"\x00" in data:
+            raise ValueError(f"{self._name} cannot contain a null byte.")
+        bits = bitarray(endian="little")
+        bits.frombytes(data + b"\x00")
+        self._bits = bits
+        self._lazy_bits = None
+        self._invalidate_bits_cache()
+
+
+class NullTerminatedStringField(NullTerminatedFieldGeneric[str]):
+    """Variable length string field that ends with a null byte."""
+
+    __slots__ = ("_string_encoding",)
+
+    def __init__(
+        self,
+        name: str,
+        default: str = "",
+        data: dataT | None = None,
+        string_format: str = DEFAULT_STRING_FORMAT,
+        string_encoding: str = "latin1",
+    ) -> None:
+        """Create variable length string field that ends with a null byte.
+
+        Args:
+            name: name of parsed object
+            default: the default value for this class
+            data: bytes to be parsed
+            string_format: python format string (e.g. "{}")
+            string_encoding: encoding for bytes to string conversion (e.g. 'latin1' or 'utf-8'),
+        """
+        self._string_encoding: str = string_encoding
+        super().__init__(
+            name=name,
+            default=default,
+            data=data,
+            string_format=string_format,
+        )
+
+    def get_value(self) -> str:
+        """Get the parsed value of this class.
+
+        Returns:
+            the parsed value of this class
+        """
+        return self._get_data().decode(self._string_encoding)
+
+    def set_value(self, value: str) -> None:
+        """Set the value of this field.
+
+        Args:
+            value: the new value to assign to this field
+        """
+        self._set_data(value.encode(self._string_encoding))
+
+    def get_string_value(self) -> str:
+        """Get a formatted value for the field (for any custom formatting).
+
+        Returns:
+            the value of the field with custom formatting
+        """
+        return self._string_format.format(self.value)
+
+
+class NullTerminatedBytesField(NullTerminatedFieldGeneric[bytes]):
+    """Variable length bytes field that ends with a null byte."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        default: bytes = b"",
+        data: dataT | None = None,
+        string_format: str = DEFAULT_BYTES_FORMAT,
+    ) -> None:
+        """Create variable length bytes field that ends with a null byte.
+
+        Args:
+            name: name of parsed object
+            default: the default value for this class
+            data: bytes to be parsed
+            string_format: python format string (e.g. "{}")
+        """
+        super().__init__(
+            name=name,
+            default=default,
+            data=data,
+            string_format=string_format,
+        )
+
+    def get_value(self) -> bytes:
+        """Get the parsed value of this class.
+
+        Returns:
+            the parsed value of this class
+        """
+        return self._get_data()
+
+    def set_value(self, value: bytes) -> None:
+        """Set the value of this field.
+
+        Args:
+            value: the new value to assign to this field
+        """
+        self._set_data(bytes(value))
+
+    def get_string_value(self) -> str:
+        """Get a formatted value for the field (for any custom formatting).
+
+        Returns:
+            the value of the field with custom formatting
+        """
+        return self._string_format.format(hex(self.value))
@@ -1,14 +1,15 @@
 """Modbus field classes."""
 from __future__ import annotations
 
-import struct
-from typing import Sequence
+from typing import Sequence, cast
 
 import crc
 from bitarray import bitarray
 from bitarray.util import int2ba
 
-from easyprotocol.base import dataT, input_to_bytes
+from easyprotocol.base import dataT
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.base.parse_children import ParseChildren
 from easyprotocol.fields import (
     BoolField,
     ChecksumField,
@@ -18,6 +19,7 @@ from easyprotocol.fields import (
     UInt16Field,
     UIntField,
 )
+from easyprotocol.fields.checksum import crcDataT
 from easyprotocol.protocols.modbus.constants import (
     ModbusFieldNamesEnum,
     ModbusFunctionEnum,
@@ -27,6 +29,8 @@ from easyprotocol.protocols.modbus.constants import (
 class ModbusAddress(UInt8Field):
     """Modbus device id field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 1,
@@ -49,6 +53,8 @@ class ModbusAddress(UInt8Field):
 class ModbusFunction(UInt8EnumField[ModbusFunctionEnum]):
     """Modbus function field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: ModbusFunctionEnum = ModbusFunctionEnum.ReadCoils,
@@ -72,6 +78,8 @@ class ModbusFunction(UInt8EnumField[ModbusFunctionEnum]):
 class ModbusRegister(UInt16Field):
     """Modbus register field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 1,
@@ -94,6 +102,8 @@ class ModbusRegister(UInt16Field):
 class ModbusTransactionID(UInt16Field):
     """Modbus register field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 0,
@@ -116,6 +126,8 @@ class ModbusTransactionID(UInt16Field):
 class ModbusProtocolID(UInt16Field):
     """Modbus register field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 0,
@@ -138,6 +150,8 @@ class ModbusProtocolID(UInt16Field):
 class ModbusLength(UInt16Field):
     """Modbus register field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 0,
@@ -160,6 +174,8 @@ class ModbusLength(UInt16Field):
 class ModbusCount(UInt16Field):
     """Modbus count field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 1,
@@ -183,6 +199,8 @@ class ModbusCount(UInt16Field):
 class ModbusByteCount(UInt8Field):
     """Modbus byte count field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 0,
@@ -203,9 +221,22 @@ class ModbusByteCount(UInt8Field):
         )
 
 
+MODBUS_CRC_CONFIGURATION = crc.Configuration(
+    width=16,
+    polynomial=0x8005,
+    init_value=0xFFFF,
+    final_xor_value=0x0000,
+    reverse_input=True,
+    reverse_output=True,
+)
+"""CRC-16/MODBUS configuration."""
+
+
 class ModbusCRC(ChecksumField):
     """Modbus Cyclic Redundancy Checksum (CRC) field."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         default: int = 0,
@@ -221,14 +252,7 @@ class ModbusCRC(ChecksumField):
             name=ModbusFieldNamesEnum.CRC.value,
             bit_count=16,
             default=default,
-            crc_configuration=crc.Configuration(
-                width=16,
-                polynomial=0x8005,
-                init_value=0xFFFF,
-                final_xor_value=0x0000,
-                reverse_input=True,
-                reverse_output=True,
-            ),
+            crc_configuration=MODBUS_CRC_CONFIGURATION,
             data=data,
             string_format="{:04X}(hex)",
             endian="little",
@@ -243,34 +267,46 @@ class ModbusCRC(ChecksumField):
         Returns:
             the new checksum, the bytes of the checksum, and the bits of the checksum
         """
-        byte_data = b""
-        if self.parent is not None:
-            byte_data = bytes(self.parent)
-        crc_int = self.crc_calculator.checksum(byte_data[:-2])
+        byte_data: crcDataT = b""
+        if self._parent is not None:
+            # the checksum always ends a Modbus RTU frame
+            frame = memoryview(bytes(self._parent))
+            byte_data = self.get_covered_bytes(frame=frame, start=len(frame) - 2, end=len(frame))
+        crc_int = self.calculate_checksum(byte_data)
         crc_bytes = int.to_bytes(crc_int, length=2, byteorder=self.endian)
         crc_bits = int2ba(crc_int, length=self._bit_count)
         self.value = crc_int
         return (crc_int, crc_bytes, crc_bits)
 
 
-class ModbusCoilArray(ParseArrayField[bool]):
-    """Modbus coil array field."""
+class ModbusBitArray(ParseArrayField[bool]):
+    """Base class for modbus arrays of bits (coils and discrete inputs), packed eight to a byte.
+
+    The bits are kept in a single bitarray, so parsing, serializing and reading or writing single
+    bits never touch per-bit objects. The BoolField sub-fields are only created when they are used
+    (e.g. by indexing the array or getting its value); from then on they hold the bits.
+    """
+
+    __slots__ = ("_packed_bits",)
 
     def __init__(
         self,
+        name: str,
         count: int | UIntField,
         data: dataT | None = None,
         default: Sequence[bool] | Sequence[int] | None = None,
     ) -> None:
-        """Create modbus coil array field.
+        """Create base class for modbus arrays of bits.
 
         Args:
-            count: _description_
-            default: default crc value
+            name: name of parsed object
+            count: the number of bytes of bits in this field
             data: bytes to be parsed
+            default: default bit values (booleans), or default bytes of bits (integers)
         """
+        self._packed_bits: bitarray | None = None
         super().__init__(
-            name=ModbusFieldNamesEnum.CoilArray.value,
+            name=name,
             count=count,
             array_item_class=BoolField,
             array_item_default=False,
@@ -279,83 +315,206 @@ class ModbusCoilArray(ParseArrayField[bool]):
         if default:
             self.set_value(default)
 
+    def _clone(self, memo: dict[int, ParseBase]) -> ParseBase:
+        """Create a copy of this field and all of its sub-fields, without calling any constructors.
+
+        Args:
+            memo: the copies made so far, by the id of the field they were copied from
+
+        Returns:
+            a copy of this field
+        """
+        other = cast(ModbusBitArray, super()._clone(memo=memo))
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            other._packed_bits = bitarray(packed_bits)
+        return other
+
+    def _get_children(self) -> ParseChildren:
+        """Get the sub-field dictionary of this field, first creating the BoolField sub-fields if there are none yet.
+
+        Returns:
+            the sub-field dictionary
+        """
+        if self._packed_bits is not None:
+            self._create_bit_fields()
+        return self._children
+
+    def _create_bit_fields(self) -> None:
+        """Create the BoolField sub-fields that hold the packed bits from now on."""
+        packed_bits = cast(bitarray, self._packed_bits)
+        self._packed_bits = None
+        prototype = BoolField(name="+0")
+        items: dict[str, ParseBase] = {}
+        for index, bit in enumerate(packed_bits.tolist()):
+            item = prototype.clone()
+            item._name = f"+{index}"
+            item.set_value(bit)
+            items[item._name] = item
+        self._children.replace(items)
+
+    def _set_packed_bits(self, bits: bitarray) -> None:
+        """Replace all the bits of this array, dropping any sub-fields.
+
+        Args:
+            bits: the new bits
+        """
+        self._children.clear()
+        self._packed_bits = bits
+
+    def get_packed_bits(self) -> bitarray:
+        """Get the bits of this array, one per coil or discrete input.
+
+        Returns:
+            a copy of the bits
+        """
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            return bitarray(packed_bits)
+        bits = bitarray(endian="little")
+        for item in self._children.values():
+            bits.append(bool(item.value))
+        return bits
+
+    def parse_at(self, bits: bitarray, offset: int) -> int:
+        """Parse the bits that make up this protocol field from a shared buffer of bits.
+
+        Args:
+            bits: little-endian bits holding (at least) this field
+            offset: bit offset where this field starts
+
+        Returns:
+            the bit offset just past the end of this field
+
+        Raises:
+            IndexError: if there is too little data to parse this field
+        """
+        if isinstance(self._count, int):
+            _count = self._count * 8
+        else:
+            if self._count.value is None:
+                _count = 0
+            else:
+                _count = self._count.value * 8
+        end = offset + _count
+        if len(bits) < end or (_count > 0 and len(bits) == offset):
+            raise IndexError("Too little data to parse field.")
+        packed_bits = bits[offset:end]
+        if len(self) > _count:
+            # bits past the parsed count are kept, as when re-parsing sub-fields by name
+            packed_bits += self.get_packed_bits()[_count:]
+        self._set_packed_bits(packed_bits)
+        return end
+
+    def get_bits_lsb(self) -> bitarray:
+        """Get the bits of this field in least-significant-bit first format.
+
+        Returns:
+            lsb bits
+        """
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            # a copy, since set_bit changes the packed bits in place
+            return bitarray(packed_bits)
+        return super().get_bits_lsb()
+
     def set_value(  # pyright:ignore[reportIncompatibleMethodOverride]
         self, value: Sequence[bool] | Sequence[int]
     ) -> None:
-        """Set the fields that are part of this field.
+        """Set the bits of this array, starting with the first one.
 
         Args:
-            value: the new list of fields or dictionary of fields to assign to this field
+            value: the new bit values (booleans), or the new bytes of bits (integers)
         """
         if len(value) == 0:
             return
+        new_bits = bitarray(endian="little")
         if isinstance(value[0], bool):
-            _value = [True if b else False for b in value]
+            new_bits.extend([bool(b) for b in value])
         else:
-            bit_array = bitarray(endian="little")
-            for v in value:
-                bit_array.frombytes(struct.pack("B", v))
-            _value = [True if b else False for b in bit_array]
-        keys = list(self._children.keys())
-        for i, _bool in enumerate(_value):
-            if i < len(self.children):
-                self.children[keys[i]].value = _bool
-            else:
-                f = BoolField(
-                    name=f"+{i}",
-                    default=_bool,
-                )
-                self.append(f)
+            new_bits.frombytes(bytes(cast(Sequence[int], value)))
+        bits = self.get_packed_bits()
+        if len(new_bits) < len(bits):
+            bits[: len(new_bits)] = new_bits
+        else:
+            bits = new_bits
+        self._set_packed_bits(bits)
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse bytes that make of this protocol field into meaningful data.
+    def frombytes(self, data: bytes) -> None:
+        """Replace all the bits of this array with the bits of some bytes (first bit is the lsb of the first byte).
 
         Args:
-            data: bytes to be parsed
+            data: the new bytes of bits
+        """
+        bits = bitarray(endian="little")
+        bits.frombytes(data)
+        self._set_packed_bits(bits)
+
+    def tolist(self) -> list[bool]:
+        """Get the values of all the bits of this array.
 
         Returns:
-            any leftover bits after parsing the ones belonging to this field
+            the bit values
         """
-        bit_data = input_to_bytes(data=data)
-        if isinstance(self._count, int):
-            _count = self._count * 8
+        packed_bits = self._packed_bits
+        if packed_bits is None:
+            packed_bits = self.get_packed_bits()
+        return list(map(bool, packed_bits.tolist()))
+
+    def get_bit(self, index: int) -> bool:
+        """Get the value of one bit of this array.
+
+        Args:
+            index: index of the bit
+
+        Returns:
+            the bit value
+        """
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            return packed_bits[index] == 1
+        return bool(self._children.get_list()[index].value)
+
+    def set_bit(self, index: int, value: bool) -> None:
+        """Set the value of one bit of this array.
+
+        Args:
+            index: index of the bit
+            value: the new bit value
+        """
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            packed_bits[index] = bool(value)
+            self._invalidate_bits_cache()
         else:
-            if self._count.value is None:
-                _count = 0
-            else:
-                _count = self._count.value * 8
-        for i in range(_count):
-            f = self._array_item_class(
-                f"+{i}",
-                self._array_item_default,
-            )
-            bit_data = f.parse(data=bit_data)
-            self.append(f)
-        return bit_data
-
-    @property
-    def string_value(self) -> str:
+            self._children.get_list()[index].value = bool(value)
+
+    def __len__(self) -> int:
+        """Get the number of bits in this array.
+
+        Returns:
+            the number of bits
+        """
+        packed_bits = self._packed_bits
+        if packed_bits is not None:
+            return len(packed_bits)
+        return len(self._children)
+
+    def get_string_value(self) -> str:
         """Get a formatted value for the field (for any custom formatting).
 
         Returns:
             the value of the field with custom formatting
         """
-        chunks: list[str] = []
-        keys = list(self._children.keys())
-        bits_per_chunk = 8
-        for i in range(0, len(keys), bits_per_chunk):
-            chunk_key = keys[i]
-            if (i + bits_per_chunk) < len(keys):
-                vals = "".join(["1" if self.children[keys[j]].value else "0" for j in range(i, i + bits_per_chunk)])
-            else:
-                xtra = "0" * (bits_per_chunk - (len(keys) - i))
-                vals = "".join(["1" if self.children[keys[j]].value else "0" for j in range(i, len(keys))]) + xtra
-            chunks.append(chunk_key + ":" + vals)
-        return f"[{', '.join( chunks)}]"
+        bits = self.get_packed_bits()
+        chunks = [f"+{i}:{bits[i : i + 8].to01():0<8}" for i in range(0, len(bits), 8)]
+        return f"[{', '.join(chunks)}]"
 
 
-class ModbusDiscreteInputArray(ParseArrayField[bool]):
-    """Modbus discrete input array field."""
+class ModbusCoilArray(ModbusBitArray):
+    """Modbus coil array field."""
+
+    __slots__ = ()
 
     def __init__(
         self,
@@ -363,93 +522,42 @@ class ModbusDiscreteInputArray(ParseArrayField[bool]):
         data: dataT | None = None,
         default: Sequence[bool] | Sequence[int] | None = None,
     ) -> None:
-        """Create modbus discrete input array field.
+        """Create modbus coil array field.
 
         Args:
-            count: _description_
-            default: default crc value
+            count: the number of bytes of coils in this field
+            default: default coil values (booleans), or default bytes of coils (integers)
             data: bytes to be parsed
         """
         super().__init__(
-            name=ModbusFieldNamesEnum.DiscreteInputArray.value,
+            name=ModbusFieldNamesEnum.CoilArray.value,
             count=count,
-            array_item_class=BoolField,
-            array_item_default=False,
             data=data,
+            default=default,
         )
-        if default:
-            self.set_value(default)
 
-    def set_value(  # pyright:ignore[reportIncompatibleMethodOverride]
-        self, value: Sequence[bool] | Sequence[int]
-    ) -> None:
-        """Set the fields that are part of this field.
 
-        Args:
-            value: the new list of fields or dictionary of fields to assign to this field
-        """
-        if len(value) == 0:
-            return
-        if isinstance(value[0], bool):
-            _value = [True if b else False for b in value]
-        else:
-            bit_array = bitarray(endian="little")
-            for v in value:
-                bit_array.frombytes(struct.pack("B", v))
-            _value = [True if b else False for b in bit_array]
-        keys = list(self._children.keys())
-        for i, _bool in enumerate(_value):
-            if i < len(self.children):
-                self.children[keys[i]].value = _bool
-            else:
-                f = BoolField(
-                    name=f"+{i}",
-                    default=_bool,
-                )
-                self.append(f)
+class ModbusDiscreteInputArray(ModbusBitArray):
+    """Modbus discrete input array field."""
 
-    def parse(self, data: dataT) -> bitarray:
-        """Parse bytes that make of this protocol field into meaningful data.
+    __slots__ = ()
+
+    def __init__(
+        self,
+        count: int | UIntField,
+        data: dataT | None = None,
+        default: Sequence[bool] | Sequence[int] | None = None,
+    ) -> None:
+        """Create modbus discrete input array field.
 
         Args:
+            count: the number of bytes of discrete inputs in this field
+            default: default discrete input values (booleans), or default bytes of discrete inputs (integers)
             data: bytes to be parsed
-
-        Returns:
-            any leftover bits after parsing the ones belonging to this field
         """
-        bit_data = input_to_bytes(data=data)
-        if isinstance(self._count, int):
-            _count = self._count * 8
-        else:
-            if self._count.value is None:
-                _count = 0
-            else:
-                _count = self._count.value * 8
-        for i in range(_count):
-            f = self._array_item_class(
-                f"+{i}",
-                self._array_item_default,
-            )
-            bit_data = f.parse(data=bit_data)
-            self.append(f)
-        return bit_data
-
-    @property
-    def string_value(self) -> str:
-        """Get a formatted value for the field (for any custom formatting).
-
-        Returns:
-            the value of the field with custom formatting
-        """
-        chunks: list[str] = []
-        keys = list(self._children.keys())
-        bits_per_chunk = 8
-        for i in range(0, len(keys), bits_per_chunk):
-            chunk_key = keys[i]
-            if (i + bits_per_chunk) < len(keys):
-                vals = "".join(["1" if self.children[keys[j]].value else "0" for j in range(i, i + bits_per_chunk)])
-            else:
-                xtra = "0" * (bits_per_chunk - (len(keys) - i))
-                vals = "".join(["1" if self.children[keys[j]].value else "0" for j in range(i, len(keys))]) + xtra
-            chunks.append(chunk_key + ":" + vals)
-        return f"[{', '.join( chunks)}]"
+        super().__init__(
+            name=ModbusFieldNamesEnum.DiscreteInputArray.value,
+            count=count,
+            data=data,
+            default=default,
+        )
@@ -28,6 +28,8 @@ from easyprotocol.protocols.modbus.fields import (
 class ModbusRTUFrame(ParseFieldDict):
     """Modbus header fields plus the checksum."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         function: ModbusFunctionEnum = ModbusFunctionEnum.ReadCoils,
@@ -122,6 +124,8 @@ class ModbusRTUFrame(ParseFieldDict):
 class ModbusTCPFrame(ParseFieldDict):
     """Modbus header fields plus the checksum."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         function: ModbusFunctionEnum = ModbusFunctionEnum.ReadCoils,
@@ -222,6 +226,8 @@ class ModbusTCPFrame(ParseFieldDict):
 class ModbusRTUReadCoilsRequest(ModbusRTUFrame):
     """Modbus read coils request frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: int = 1,
@@ -287,6 +293,8 @@ class ModbusRTUReadCoilsRequest(ModbusRTUFrame):
 class ModbusTCPReadCoilsRequest(ModbusTCPFrame):
     """Modbus read coils request frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         transaction_id: int = 0,
@@ -360,6 +368,8 @@ class ModbusTCPReadCoilsRequest(ModbusTCPFrame):
 class ModbusRTUReadCoilsResponse(ModbusRTUFrame):
     """Modbus read coils response frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: int = 1,
@@ -449,6 +459,8 @@ class ModbusRTUReadCoilsResponse(ModbusRTUFrame):
 class ModbusTCPReadCoilsResponse(ModbusTCPFrame):
     """Modbus read coils response frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         transaction_id: int = 0,
@@ -543,6 +555,8 @@ class ModbusTCPReadCoilsResponse(ModbusTCPFrame):
 class ModbusRTUReadDiscreteInputsRequest(ModbusRTUFrame):
     """Modbus read discrete inputs request frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: int = 1,
@@ -612,6 +626,8 @@ class ModbusRTUReadDiscreteInputsRequest(ModbusRTUFrame):
 class ModbusTCPReadDiscreteInputsRequest(ModbusTCPFrame):
     """Modbus read discrete inputs request frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: int = 1,
@@ -680,6 +696,8 @@ class ModbusTCPReadDiscreteInputsRequest(ModbusTCPFrame):
 class ModbusRTUReadDiscreteInputsResponse(ModbusRTUFrame):
     """Modbus read discrete inputs response frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         address: int = 1,
@@ -769,6 +787,8 @@ class ModbusRTUReadDiscreteInputsResponse(ModbusRTUFrame):
 class ModbusTCPReadDiscreteInputsResponse(ModbusTCPFrame):
     """Modbus read discrete inputs response frame."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         transaction_id: int = 0,
@@ -3,9 +3,18 @@ from __future__ import annotations
 
 import logging
 import socket
+import time
+from typing import cast
 
+from easyprotocol.base.metrics import MetricsRegistry
+from easyprotocol.base.parse_base import ParseBase
 from easyprotocol.base.utils import hex
-from easyprotocol.protocols.modbus.frames import ModbusTCPFrame
+from easyprotocol.protocols.modbus.fields import ModbusFunctionEnum
+from easyprotocol.protocols.modbus.frames import (
+    ModbusTCPFrame,
+    ModbusTCPReadCoilsResponse,
+    ModbusTCPReadDiscreteInputsResponse,
+)
 from easyprotocol.protocols.modbus.modbus_transceiver import ModbusTransceiver
 
 LOGGER = logging.getLogger(__name__)
@@ -20,6 +29,7 @@ class ModbusClient(ModbusTransceiver):
         ip: str = "127.0.0.1",
         port: int = 502,
         verbose: bool = False,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """Create Modbus client.
 
@@ -27,13 +37,13 @@ class ModbusClient(ModbusTransceiver):
             ip: address of client. Defaults to "127.0.0.1".
             port: port number of client. Defaults to 502.
             verbose: logging verbosity. Defaults to False.
+            metrics: registry to count the traffic and errors of the client in. Defaults to a registry of its own.
         """
-        super().__init__(logger=LOGGER)
+        super().__init__(logger=LOGGER, metrics=metrics)
         if verbose:
             LOGGER.setLevel(logging.DEBUG)
         self._ip = ip
         self._port = port
-        self._bytes_buffer = b""
 
     def start(
         self,
@@ -63,22 +73,26 @@ class ModbusClient(ModbusTransceiver):
             self._modbus_socket.settimeout(connection_timeout)
             self._modbus_socket.connect((self._ip, self._port))
             self._error_counter = 0
+            self._connections.inc()
             LOGGER.info("Connected to server at %s:%s", self._ip, self._port)
             self._modbus_socket.settimeout(timeout)
         except socket.timeout as ex:
             if self._error_counter == 0:
                 LOGGER.error("Failed to connect to socket %s:%s: %s", self._ip, self._port, ex)
             self._error_counter += 1
+            self._connection_errors.inc()
             self._modbus_socket = None
         except TimeoutError as ex:
             if self._error_counter == 0:
                 LOGGER.error("Failed to connect to socket %s:%s: %s", self._ip, self._port, ex)
             self._error_counter += 1
+            self._connection_errors.inc()
             self._modbus_socket = None
         except OSError as ex:
             if self._error_counter == 0:
                 LOGGER.error("Failed to connect to socket %s:%s: %s", self._ip, self._port, ex)
             self._error_counter += 1
+            self._connection_errors.inc()
             self._modbus_socket = None
 
     def stop(self) -> None:
@@ -104,13 +118,28 @@ class ModbusClient(ModbusTransceiver):
             response frame or none
         """
         LOGGER.debug("Client: TX: %s (%s)", frame, hex(frame.byte_value))
+        start = time.perf_counter()
         if self.send_message(frame=frame):
             rx_frame = self.read_message()
             if rx_frame:
+                self._latency.observe(time.perf_counter() - start)
                 LOGGER.debug("Client: RX: %s (%s)", rx_frame, hex(rx_frame.byte_value))
             return rx_frame
         return None
 
-    @property
-    def _buffer_len(self) -> int:
-        return len(self._bytes_buffer)
+    def _create_frame(self, header: ParseBase) -> ParseBase | None:
+        """Get the frame to parse a received response into, based on its header.
+
+        Args:
+            header: the parsed header of the response
+
+        Returns:
+            the (unparsed) frame, or None if the response is not supported
+        """
+        function = cast(ModbusTCPFrame, header).functionCode.value
+        if function == ModbusFunctionEnum.ReadCoils:
+            return ModbusTCPReadCoilsResponse.template()
+        if function == ModbusFunctionEnum.ReadDiscreteInputs:
+            return ModbusTCPReadDiscreteInputsResponse.template()
+        LOGGER.debug("Unsupported function: %s", function)
+        return None
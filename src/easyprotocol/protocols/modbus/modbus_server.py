@@ -4,8 +4,10 @@ from __future__ import annotations
 import logging
 import math
 import socket
+import time
 from typing import Generator, cast
 
+from easyprotocol.base.metrics import MetricsRegistry
 from easyprotocol.base.utils import hex
 from easyprotocol.protocols.modbus.fields import ModbusFunctionEnum
 from easyprotocol.protocols.modbus.frames import (
@@ -29,6 +31,7 @@ class ModbusServer(ModbusTransceiver):
         ip: str = "127.0.0.1",
         port: int = 502,
         verbose: bool = False,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """Create modbus server.
 
@@ -36,8 +39,9 @@ class ModbusServer(ModbusTransceiver):
             ip: address of server. Defaults to "127.0.0.1".
             port: port number of server. Defaults to 502.
             verbose: logging verbosity. Defaults to False.
+            metrics: registry to count the traffic and errors of the server in. Defaults to a registry of its own.
         """
-        super().__init__(logger=LOGGER)
+        super().__init__(logger=LOGGER, metrics=metrics)
         if verbose:
             LOGGER.setLevel(logging.DEBUG)
         self._server_ip = ip
@@ -45,7 +49,6 @@ class ModbusServer(ModbusTransceiver):
         self._client_ip = ""
         self._client_port = 0
         self._server_socket: socket.socket | None = None
-        self._bytes_buffer = b""
         self._map: dict[ModbusFunctionEnum, dict[int, dict[int, bool] | dict[int, int] | dict[int, int | bool]]] = {}
         if verbose:
             LOGGER.setLevel(logging.DEBUG)
@@ -107,15 +110,18 @@ class ModbusServer(ModbusTransceiver):
                 self._modbus_socket, (self._client_ip, self._client_port) = self._server_socket.accept()
                 LOGGER.info("Client connected from %s:%s", self._client_ip, self._client_port)
                 self._error_counter = 0
+                self._connections.inc()
                 self._modbus_socket.settimeout(timeout)
             except TimeoutError as ex:
                 if self._error_counter == 0:
                     LOGGER.error("No client connected to server %s:%s: %s", self._server_ip, self._server_port, ex)
                 self._error_counter += 1
+                self._connection_errors.inc()
             except OSError as ex:
                 if self._error_counter == 0:
                     LOGGER.error("No client connected to server %s:%s: %s", self._server_ip, self._server_port, ex)
                 self._error_counter += 1
+                self._connection_errors.inc()
 
     def stop(
         self,
@@ -167,6 +173,7 @@ class ModbusServer(ModbusTransceiver):
             an rx/tx pair. rx or tx can be None
         """
         msg = self.read_message()
+        start = time.perf_counter()
         if msg:
             function = msg.functionCode.value
             if function in self._map:
@@ -184,6 +191,7 @@ class ModbusServer(ModbusTransceiver):
                             coil_array=values,
                         )
                         if self.send_message(tx):
+                            self._latency.observe(time.perf_counter() - start)
                             return msg, tx
                         else:
                             return msg, None
@@ -201,15 +209,12 @@ class ModbusServer(ModbusTransceiver):
                             discrete_input_array=values,
                         )
                         if self.send_message(tx):
+                            self._latency.observe(time.perf_counter() - start)
                             return msg, tx
                         else:
                             return msg, None
         return None, None
 
-    @property
-    def _buffer_len(self) -> int:
-        return len(self._bytes_buffer)
-
     @property
     def server_ip(self) -> str:
         """Get the server ip address.
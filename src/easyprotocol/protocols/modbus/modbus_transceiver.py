@@ -3,7 +3,13 @@ from __future__ import annotations
 
 import logging
 import socket
+from collections import deque
+from typing import Any, Deque, cast
 
+from easyprotocol.base.framer import StreamFramer
+from easyprotocol.base.metrics import Counter, MetricsRegistry
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.protocols.modbus.constants import ModbusFieldNamesEnum
 from easyprotocol.protocols.modbus.fields import ModbusFunctionEnum
 from easyprotocol.protocols.modbus.frames import (
     ModbusTCPFrame,
@@ -11,19 +17,69 @@ from easyprotocol.protocols.modbus.frames import (
     ModbusTCPReadDiscreteInputsRequest,
 )
 
+RECEIVE_BYTE_COUNT = 4096
+"""Maximum number of bytes to read from the socket at a time."""
+
+MAX_FRAME_BYTE_COUNT = 260
+"""Number of bytes in the longest Modbus TCP frame (a 7 byte header and a 253 byte PDU)."""
+
+RX_BYTES_METRIC = "modbus_rx_bytes_total"
+"""Counter of the bytes received."""
+
+TX_BYTES_METRIC = "modbus_tx_bytes_total"
+"""Counter of the bytes sent."""
+
+FRAMES_RECEIVED_METRIC = "modbus_frames_received_total"
+"""Counters of the frames received and parsed, by function."""
+
+FRAMES_SENT_METRIC = "modbus_frames_sent_total"
+"""Counters of the frames sent, by function."""
+
+RX_ERRORS_METRIC = "modbus_rx_errors_total"
+"""Counter of the received frames that were dropped because they failed to parse or were not supported."""
+
+SOCKET_ERRORS_METRIC = "modbus_socket_errors_total"
+"""Counter of the failures to send or receive."""
+
+CONNECTIONS_METRIC = "modbus_connections_total"
+"""Counter of the connections made."""
+
+CONNECTION_ERRORS_METRIC = "modbus_connection_errors_total"
+"""Counter of the failures to connect, which are retried."""
+
+LATENCY_METRIC = "modbus_request_latency_seconds"
+"""Histogram of the time from sending a request to receiving the response (client), or from receiving
+a request to sending the response (server)."""
+
 
 class ModbusTransceiver:
     """Base class for handling sockets and message send/receive."""
 
-    def __init__(self, logger: logging.Logger) -> None:
+    def __init__(self, logger: logging.Logger, metrics: MetricsRegistry | None = None) -> None:
         """Create base class for handling sockets and message send/receive.
 
         Args:
             logger: logger for base class
+            metrics: registry to count the traffic and errors in. Defaults to a registry of this transceiver's own.
         """
         self.logger = logger
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._rx_bytes = self.metrics.counter(RX_BYTES_METRIC)
+        self._tx_bytes = self.metrics.counter(TX_BYTES_METRIC)
+        self._rx_errors = self.metrics.counter(RX_ERRORS_METRIC)
+        self._socket_errors = self.metrics.counter(SOCKET_ERRORS_METRIC)
+        self._connections = self.metrics.counter(CONNECTIONS_METRIC)
+        self._connection_errors = self.metrics.counter(CONNECTION_ERRORS_METRIC)
+        self._latency = self.metrics.histogram(LATENCY_METRIC)
+        self._frame_counters: dict[tuple[str, Any], Counter] = {}
         self._modbus_socket: socket.socket | None = None
-        self._bytes_buffer = b""
+        self._framer = StreamFramer(
+            header=ModbusTCPFrame(),
+            length_field=ModbusFieldNamesEnum.Length.value,
+            frame_factory=self._create_frame,
+            max_frame_bytes=MAX_FRAME_BYTE_COUNT,
+        )
+        self._frames: Deque[ParseBase] = deque()
         self._error_counter = 0
         self._inited = False
 
@@ -53,47 +109,56 @@ class ModbusTransceiver:
         Returns:
             the parsed message or None
         """
-        msg = None
-        if self._modbus_socket is not None:
-            frame_byte_count = 8
+        if len(self._frames) == 0 and self._modbus_socket is not None:
             try:
-                if self._buffer_len < frame_byte_count:
-                    self._bytes_buffer += self._modbus_socket.recv(frame_byte_count - self._buffer_len)
+                data = self._modbus_socket.recv(RECEIVE_BYTE_COUNT)
             except TimeoutError:
-                pass
+                data = b""
             except OSError:
-                pass
-            if self._buffer_len >= frame_byte_count:
-                header = ModbusTCPFrame(data=self._bytes_buffer[:frame_byte_count])
-                if header.functionCode.value == ModbusFunctionEnum.ReadCoils:
-                    frame_byte_count = 14
-                    try:
-                        if self._buffer_len < frame_byte_count:
-                            self._bytes_buffer += self._modbus_socket.recv(frame_byte_count - self._buffer_len)
-                    except TimeoutError:
-                        pass
-                    except OSError:
-                        pass
-                    try:
-                        msg = ModbusTCPReadCoilsRequest(data=self._bytes_buffer)
-                        self._bytes_buffer = self._bytes_buffer[len(msg.byte_value) :]
-                    except Exception as ex:
-                        self.logger.debug("Failed to parse %s: %s", ModbusFunctionEnum.ReadCoils, ex)
-                if header.functionCode.value == ModbusFunctionEnum.ReadDiscreteInputs:
-                    frame_byte_count = 14
-                    try:
-                        if self._buffer_len < frame_byte_count:
-                            self._bytes_buffer += self._modbus_socket.recv(frame_byte_count - self._buffer_len)
-                    except TimeoutError:
-                        pass
-                    except OSError:
-                        pass
-                    try:
-                        msg = ModbusTCPReadDiscreteInputsRequest(data=self._bytes_buffer)
-                        self._bytes_buffer = self._bytes_buffer[len(msg.byte_value) :]
-                    except Exception as ex:
-                        self.logger.debug("Failed to parse %s: %s", ModbusFunctionEnum.ReadDiscreteInputs, ex)
-        return msg
+                data = b""
+                self._socket_errors.inc()
+            if len(data) > 0:
+                self._rx_bytes.inc(len(data))
+                error_count = self._framer.error_count
+                frames = self._framer.feed(data)
+                self._rx_errors.inc(self._framer.error_count - error_count)
+                for frame in frames:
+                    self._count_frame(name=FRAMES_RECEIVED_METRIC, frame=frame)
+                self._frames.extend(frames)
+        if len(self._frames) > 0:
+            return cast(ModbusTCPFrame, self._frames.popleft())
+        return None
+
+    def _create_frame(self, header: ParseBase) -> ParseBase | None:
+        """Get the frame to parse a received message into, based on its header.
+
+        Args:
+            header: the parsed header of the message
+
+        Returns:
+            the (unparsed) frame, or None if the message is not supported
+        """
+        function = cast(ModbusTCPFrame, header).functionCode.value
+        if function == ModbusFunctionEnum.ReadCoils:
+            return ModbusTCPReadCoilsRequest.template()
+        if function == ModbusFunctionEnum.ReadDiscreteInputs:
+            return ModbusTCPReadDiscreteInputsRequest.template()
+        self.logger.debug("Unsupported function: %s", function)
+        return None
+
+    def _count_frame(self, name: str, frame: ParseBase) -> None:
+        """Count a frame that was sent or received, by function.
+
+        Args:
+            name: name of the counter
+            frame: the frame
+        """
+        function = cast(ModbusTCPFrame, frame).functionCode.value
+        counter = self._frame_counters.get((name, function))
+        if counter is None:
+            label = function.name if isinstance(function, ModbusFunctionEnum) else str(function)
+            counter = self._frame_counters[(name, function)] = self.metrics.counter(name, labels={"function": label})
+        counter.inc()
 
     def send_message(self, frame: ModbusTCPFrame) -> bool:
         """Send socket message.
@@ -114,11 +179,17 @@ class ModbusTransceiver:
                 sent_count = self._modbus_socket.send(frame_bytes)
         except TimeoutError as ex:
             self.logger.error("Failed to send message: %s", ex)
+            self._socket_errors.inc()
         except OSError as ex:
             self.logger.error("Failed to send message: %s", ex)
+            self._socket_errors.inc()
             self._modbus_socket = None
-        return sent_count == frame_length
+        self._tx_bytes.inc(sent_count)
+        if sent_count != frame_length:
+            return False
+        self._count_frame(name=FRAMES_SENT_METRIC, frame=frame)
+        return True
 
     @property
     def _buffer_len(self) -> int:
-        return len(self._bytes_buffer)
+        return self._framer.buffered
@@ -0,0 +1,46 @@
+# flake8:noqa
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from easyprotocol.bench import compare_results, get_benchmarks, main, run_benchmarks
+
+
+class TestBench:
+    def test_bench_all(self) -> None:
+        benchmarks = get_benchmarks()
+        names = [benchmark.name for benchmark in benchmarks]
+        assert len(names) == len(set(names))
+        assert "fields.UInt8Field.parse" in names
+        assert "containers.ParseFieldDict[1000].str" in names
+        assert "modbus.ModbusRTUReadCoilsResponse.value_write" in names
+        results = run_benchmarks(benchmarks, repeat=1, min_time=0)
+        assert set(results) == set(names)
+        assert all(result > 0 for result in results.values())
+
+    def test_bench_compare(self) -> None:
+        baseline = {"a": 100.0, "b": 100.0, "c": 100.0}
+        results = {"a": 105.0, "b": 125.0, "d": 500.0}
+        regressions = compare_results(results=results, baseline=baseline, threshold=0.1)
+        assert [(regression.name, regression.baseline, regression.current) for regression in regressions] == [
+            ("b", 100.0, 125.0)
+        ]
+
+    def test_bench_main(self, tmp_path: Path) -> None:
+        output = tmp_path / "bench.json"
+        assert main(["-k", "fields.UInt8Field.", "--repeat", "1", "--min-time", "0", "-o", str(output)]) == 0
+        report = json.loads(output.read_text())
+        assert report["unit"] == "ns"
+        assert sorted(report["results"]) == [
+            "fields.UInt8Field.parse",
+            "fields.UInt8Field.serialize",
+            "fields.UInt8Field.str",
+            "fields.UInt8Field.value_read",
+            "fields.UInt8Field.value_write",
+        ]
+
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": {name: 1e-3 for name in report["results"]}}))
+        args = ["-k", "fields.UInt8Field.", "--repeat", "1", "--min-time", "0", "-o", str(output)]
+        assert main(args + ["--baseline", str(baseline)]) == 1
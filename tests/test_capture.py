@@ -0,0 +1,83 @@
+# flake8:noqa
+from __future__ import annotations
+
+import array
+from pathlib import Path
+
+import pytest
+
+from easyprotocol.base import CaptureReader, ParseFieldDict
+from easyprotocol.fields import UInt8Field, UInt16Field
+from easyprotocol.protocols.modbus.frames import (
+    ModbusTCPFrame,
+    ModbusTCPReadCoilsResponse,
+)
+
+
+class TestCaptureReader:
+    def test_capture_fixed_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.bin"
+        path.write_bytes(b"\x01\x00\x02\x03\x00\x04\x05\x00\x06")
+        schema = ParseFieldDict(name="record", default=[UInt8Field(name="a"), UInt16Field(name="b")])
+        with CaptureReader(path, schema=schema) as reader:
+            records = [(record["a"].value, record["b"].value) for record in reader]
+            columns = reader.parse_many()
+        assert records == [(1, 2), (3, 4), (5, 6)]
+        assert columns["a"] == array.array("B", [1, 3, 5])
+        assert columns["b"] == array.array("H", [2, 4, 6])
+
+    def test_capture_truncated(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.bin"
+        path.write_bytes(b"\x01\x00\x02\x03\x00")
+        schema = ParseFieldDict(name="record", default=[UInt8Field(name="a"), UInt16Field(name="b")])
+        with CaptureReader(path, schema=schema) as reader:
+            with pytest.raises(IndexError):
+                list(reader)
+
+    def test_capture_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.bin"
+        path.write_bytes(b"")
+        with CaptureReader(path, schema=UInt8Field(name="a")) as reader:
+            assert list(reader) == []
+
+    def test_capture_close(self, tmp_path: Path) -> None:
+        path = tmp_path / "capture.bin"
+        path.write_bytes(b"\x01\x00\x02\x03\x00\x04")
+        schema = ParseFieldDict(name="record", default=[UInt8Field(name="a"), UInt16Field(name="b")], lazy=True)
+        with CaptureReader(path, schema=schema) as reader:
+            assert [record["a"].value for record in reader] == [1, 3]
+        assert schema["b"].value == 4
+        assert reader._file.closed  # pyright:ignore[reportPrivateUsage]
+
+        reader = CaptureReader(path, schema=schema)
+        records = iter(reader)
+        assert next(records)["b"].value == 2
+        reader.close()
+        assert reader._file.closed  # pyright:ignore[reportPrivateUsage]
+        assert schema["a"].value == 1
+        assert list(records) == []
+
+        reader = CaptureReader(path, schema=schema)
+        bits = reader._bits  # pyright:ignore[reportPrivateUsage]
+        with pytest.raises(BufferError):
+            reader.close()
+        assert reader._file.closed  # pyright:ignore[reportPrivateUsage]
+        with pytest.raises(ValueError):
+            with CaptureReader(path, schema=schema) as reader:
+                bits = reader._bits  # pyright:ignore[reportPrivateUsage]
+                raise ValueError()
+        del bits
+
+    def test_capture_length_prefixed(self, tmp_path: Path) -> None:
+        frames = [
+            ModbusTCPReadCoilsResponse(transaction_id=i, byte_count=i + 1, coil_array=[True] * 8 * (i + 1))
+            for i in range(3)
+        ]
+        path = tmp_path / "capture.bin"
+        path.write_bytes(b"".join([bytes(frame) for frame in frames]))
+        with CaptureReader(path, schema=ModbusTCPFrame(), length_field="length") as reader:
+            records = [(record["transactionID"].value, record["length"].value) for record in reader]
+        assert records == [(0, 4), (1, 5), (2, 6)]
+
+        with pytest.raises(KeyError):
+            CaptureReader(path, schema=ModbusTCPFrame(), length_field="missing")
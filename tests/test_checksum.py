@@ -0,0 +1,88 @@
+# flake8:noqa
+from __future__ import annotations
+
+import crc
+import pytest
+
+from easyprotocol.base import ParseFieldDict
+from easyprotocol.fields import CRCEngine, UInt8Field, get_crc_engine
+from easyprotocol.fields.checksum import ChecksumField
+from easyprotocol.protocols.modbus.fields import MODBUS_CRC_CONFIGURATION
+from easyprotocol.protocols.modbus.frames import ModbusRTUReadCoilsRequest
+
+CONFIGURATIONS = [configuration.value for family in (crc.Crc8, crc.Crc16, crc.Crc32) for configuration in family] + [
+    MODBUS_CRC_CONFIGURATION,
+    crc.Configuration(width=16, polynomial=0x8005, init_value=0x1234, reverse_input=True, reverse_output=False),
+    crc.Configuration(width=24, polynomial=0x864CFB, init_value=0xB704CE, reverse_input=False, reverse_output=True),
+]
+
+
+class TestCRCEngine:
+    @pytest.mark.parametrize("configuration", CONFIGURATIONS)
+    def test_crc_engine(self, configuration: crc.Configuration) -> None:
+        data = bytes(range(256)) + b"123456789"
+        engine = CRCEngine(configuration)
+        expected = crc.Calculator(configuration).checksum(data)
+        assert engine.checksum(data) == expected
+        assert engine.checksum(memoryview(data)) == expected
+        state = engine.start()
+        for index in range(0, len(data), 7):
+            state.update(memoryview(data)[index : index + 7])
+        assert state.digest() == expected
+        assert engine.verify(data, expected)
+
+    def test_crc_engine_shared(self) -> None:
+        assert get_crc_engine(crc.Crc32.CRC32) is get_crc_engine(crc.Crc32.CRC32.value)
+        field1 = ChecksumField(name="crc1", bit_count=16, crc_configuration=MODBUS_CRC_CONFIGURATION)
+        field2 = ChecksumField(name="crc2", bit_count=16, crc_configuration=MODBUS_CRC_CONFIGURATION)
+        assert field1.crc_calculator is field2.crc_calculator
+        assert get_crc_engine(MODBUS_CRC_CONFIGURATION).checksum(b"\x01\x03\x00\x00\x00\x0A") == 0xCDC5
+
+        state = get_crc_engine(MODBUS_CRC_CONFIGURATION).start().update(b"\x01\x03")
+        copy = state.copy()
+        state.update(b"\x00\x00\x00\x0A")
+        assert copy.digest() != state.digest() == 0xCDC5
+
+        with pytest.raises(ValueError):
+            CRCEngine(crc.Configuration(width=12, polynomial=0x80F))
+
+    def test_parse_validate_checksum(self) -> None:
+        data = bytes(ModbusRTUReadCoilsRequest(address=3, register=10, count=5))
+        frame = ModbusRTUReadCoilsRequest.template()
+        frame.parse(data, validate_checksum=True)
+        assert frame.crc.value == int.from_bytes(data[-2:], byteorder="little")
+        assert bytes(frame) == data
+
+        corrupt = bytearray(data)
+        corrupt[2] ^= 0x01
+        with pytest.raises(ValueError):
+            frame.parse(bytes(corrupt), validate_checksum=True)
+        frame.parse(bytes(corrupt))
+        assert bytes(frame) == bytes(corrupt)
+
+    def test_parse_validate_generic_checksum(self) -> None:
+        def create_frame(a: int = 0, b: int = 0) -> ParseFieldDict:
+            return ParseFieldDict(
+                name="frame",
+                default=[
+                    UInt8Field(name="a", default=a),
+                    UInt8Field(name="b", default=b),
+                    ChecksumField(name="crc", bit_count=16, crc_configuration=crc.Crc16.CCITT.value),
+                ],
+            )
+
+        frame = create_frame(a=1, b=2)
+        frame["crc"].update_field()
+        assert frame["crc"].value == frame["crc"].calculate_checksum(b"\x01\x02")
+        data = bytes(frame)
+        frame["crc"].update_field()
+        assert bytes(frame) == data
+        create_frame().parse(data, validate_checksum=True)
+
+        outer = ParseFieldDict(name="outer", default=[UInt8Field(name="start"), create_frame(), UInt8Field(name="end")])
+        nested = b"\xAA" + data + b"\x55"
+        outer.parse(nested, validate_checksum=True)
+        corrupt = bytearray(nested)
+        corrupt[2] ^= 0x01
+        with pytest.raises(ValueError):
+            outer.parse(bytes(corrupt), validate_checksum=True)
@@ -0,0 +1,113 @@
+# flake8:noqa
+from __future__ import annotations
+
+import logging
+import socket
+
+import pytest
+
+from easyprotocol.base import StreamFramer
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.protocols.modbus.fields import ModbusFunctionEnum
+from easyprotocol.protocols.modbus.frames import (
+    ModbusTCPFrame,
+    ModbusTCPReadCoilsRequest,
+    ModbusTCPReadCoilsResponse,
+)
+from easyprotocol.protocols.modbus.modbus_transceiver import ModbusTransceiver
+
+
+def create_response(header: ParseBase) -> ParseBase | None:
+    if header["function"].value == ModbusFunctionEnum.ReadCoils:
+        return ModbusTCPReadCoilsResponse.template()
+    return None
+
+
+class TestStreamFramer:
+    def test_framer_byte_by_byte(self) -> None:
+        frames = [
+            ModbusTCPReadCoilsResponse(transaction_id=i, byte_count=i + 1, coil_array=[True] * 8 * (i + 1))
+            for i in range(3)
+        ]
+        data = b"".join([bytes(frame) for frame in frames])
+        framer = StreamFramer(header=ModbusTCPFrame(), length_field="length", frame_factory=create_response)
+        parsed: list[ParseBase] = []
+        for index in range(len(data)):
+            parsed.extend(framer.feed(data[index : index + 1]))
+        assert [bytes(frame) for frame in parsed] == [bytes(frame) for frame in frames]
+        assert [frame["transactionID"].value for frame in parsed] == [0, 1, 2]
+        assert framer.buffered == 0
+        assert framer.error_count == 0
+
+    def test_framer_many_per_chunk(self) -> None:
+        frames = [ModbusTCPReadCoilsRequest(transaction_id=i, count=8) for i in range(4)]
+        data = b"".join([bytes(frame) for frame in frames])
+        framer = StreamFramer(
+            header=ModbusTCPFrame(),
+            length_field="length",
+            frame_factory=lambda header: ModbusTCPReadCoilsRequest.template(),
+        )
+        parsed = framer.feed(data[:-3])
+        assert len(parsed) == 3
+        assert framer.buffered == len(bytes(frames[-1])) - 3
+        parsed.extend(framer.feed(data[-3:]))
+        assert len(parsed) == 4
+        assert [bytes(frame) for frame in parsed] == [bytes(frame) for frame in frames]
+        assert framer.buffered == 0
+
+    def test_framer_skipped(self) -> None:
+        request = ModbusTCPReadCoilsRequest(transaction_id=1, count=8)
+        response = ModbusTCPReadCoilsResponse(transaction_id=2, byte_count=1, coil_array=[False] * 8)
+        framer = StreamFramer(header=ModbusTCPFrame(), length_field="length", frame_factory=lambda header: None)
+        assert framer.feed(bytes(request) + bytes(response)) == []
+        assert framer.error_count == 2
+
+    def test_framer_error(self) -> None:
+        response = ModbusTCPReadCoilsResponse(transaction_id=2, byte_count=1, coil_array=[False] * 8)
+        framer = StreamFramer(
+            header=ModbusTCPFrame(),
+            length_field="length",
+            frame_factory=lambda header: ModbusTCPReadCoilsRequest.template(),
+        )
+        assert framer.feed(bytes(response)) == []
+        assert framer.error_count == 1
+
+        framer.feed(bytes(response)[:5])
+        framer.reset()
+        assert framer.buffered == 0
+
+        with pytest.raises(KeyError):
+            StreamFramer(header=ModbusTCPFrame(), length_field="missing")
+
+    def test_framer_max_frame_bytes(self) -> None:
+        request = ModbusTCPReadCoilsRequest(transaction_id=1, count=8)
+        framer = StreamFramer(
+            header=ModbusTCPFrame(),
+            length_field="length",
+            frame_factory=lambda header: ModbusTCPReadCoilsRequest.template(),
+            max_frame_bytes=260,
+        )
+        corrupt = bytearray(bytes(request))
+        corrupt[4:6] = b"\xff\xff"
+        assert framer.feed(bytes(corrupt) + bytes(request)[:3]) == []
+        assert framer.error_count == 1
+        assert framer.buffered == 0
+        parsed = framer.feed(bytes(request))
+        assert [bytes(frame) for frame in parsed] == [bytes(request)]
+        assert framer.error_count == 1
+
+    def test_framer_transceiver(self) -> None:
+        requests = [ModbusTCPReadCoilsRequest(transaction_id=i, count=8) for i in range(2)]
+        transceiver = ModbusTransceiver(logger=logging.getLogger(__name__))
+        left, right = socket.socketpair()
+        try:
+            left.settimeout(0.1)
+            transceiver._modbus_socket = left
+            right.sendall(b"".join([bytes(request) for request in requests]))
+            parsed = [transceiver.read_message(), transceiver.read_message()]
+            assert [bytes(frame) for frame in parsed if frame is not None] == [bytes(request) for request in requests]
+            assert isinstance(parsed[0], ModbusTCPReadCoilsRequest)
+            assert transceiver.read_message() is None
+        finally:
+            left.close()
+            right.close()
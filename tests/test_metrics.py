@@ -0,0 +1,113 @@
+# flake8:noqa
+from __future__ import annotations
+
+import socket
+import threading
+
+import pytest
+
+from easyprotocol.base import MetricsRegistry
+from easyprotocol.protocols.modbus import ModbusClient, ModbusFunctionEnum, ModbusServer
+from easyprotocol.protocols.modbus.frames import ModbusTCPReadCoilsRequest
+
+
+class TestMetricsRegistry:
+    def test_counter_threads(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("events", labels={"kind": "a"})
+        assert registry.counter("events", labels={"kind": "a"}) is counter
+
+        def count() -> None:
+            for _ in range(1000):
+                counter.inc()
+            registry.counter("bytes").inc(10)
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registry.snapshot().counters == {'events{kind="a"}': 8000, "bytes": 80}
+
+    def test_finished_thread_cells(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("events")
+        histogram = registry.histogram("latency", buckets=[0.1, 1.0])
+
+        def record() -> None:
+            counter.inc()
+            histogram.observe(0.5)
+
+        for _ in range(100):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+        assert len(counter._cells) == 0  # pyright:ignore[reportPrivateUsage]
+        assert len(histogram._cells) == 0  # pyright:ignore[reportPrivateUsage]
+        counter.inc()
+        assert counter.value == 101
+        assert len(counter._cells) == 1  # pyright:ignore[reportPrivateUsage]
+        snapshot = histogram.snapshot()
+        assert snapshot.counts == (0, 100, 0)
+        assert snapshot.sum == pytest.approx(50.0)
+
+    def test_histogram(self) -> None:
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+            histogram.observe(value)
+        snapshot = registry.snapshot().histograms["latency"]
+        assert snapshot.buckets == (0.1, 1.0)
+        assert snapshot.counts == (2, 1, 2)
+        assert snapshot.count == 5
+        assert snapshot.sum == pytest.approx(5.65)
+        with pytest.raises(ValueError):
+            registry.histogram("bad", buckets=[1.0, 0.5])
+
+
+class TestModbusMetrics:
+    def test_client_server_metrics(self) -> None:
+        client_metrics = MetricsRegistry()
+        server_metrics = MetricsRegistry()
+        client = ModbusClient(metrics=client_metrics)
+        server = ModbusServer(metrics=server_metrics)
+        server.add_mapping(function=ModbusFunctionEnum.ReadCoils, address=1, values={i: True for i in range(8)})
+        left, right = socket.socketpair()
+        try:
+            left.settimeout(1)
+            right.settimeout(1)
+            client._modbus_socket = left
+            server._modbus_socket = right
+            request = ModbusTCPReadCoilsRequest(transaction_id=1, address=1, register=0, count=8)
+            thread = threading.Thread(target=server.receive_and_send)
+            thread.start()
+            response = client.send_receive_frame(request)
+            thread.join()
+            assert response is not None
+
+            right.sendall(b"\x00\x01\x00\x00\x00\x03\x01\x7f\x00")
+            assert client.read_message() is None
+        finally:
+            left.close()
+            right.close()
+
+        client_snapshot = client_metrics.snapshot()
+        server_snapshot = server_metrics.snapshot()
+        assert client_snapshot.counters['modbus_frames_sent_total{function="ReadCoils"}'] == 1
+        assert client_snapshot.counters['modbus_frames_received_total{function="ReadCoils"}'] == 1
+        assert server_snapshot.counters['modbus_frames_received_total{function="ReadCoils"}'] == 1
+        assert server_snapshot.counters['modbus_frames_sent_total{function="ReadCoils"}'] == 1
+        assert client_snapshot.counters["modbus_tx_bytes_total"] == len(bytes(request))
+        assert server_snapshot.counters["modbus_rx_bytes_total"] == len(bytes(request))
+        assert client_snapshot.counters["modbus_rx_bytes_total"] == len(bytes(response)) + 9
+        assert client_snapshot.counters["modbus_rx_errors_total"] == 1
+        assert client_snapshot.histograms["modbus_request_latency_seconds"].count == 1
+        assert server_snapshot.histograms["modbus_request_latency_seconds"].count == 1
+
+    def test_connection_errors(self) -> None:
+        client = ModbusClient(port=1)
+        client.start(connection_timeout=0.01)
+        client.start(connection_timeout=0.01)
+        counters = client.metrics.snapshot().counters
+        assert counters["modbus_connection_errors_total"] == 2
+        assert counters["modbus_connections_total"] == 0
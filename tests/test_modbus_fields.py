@@ -0,0 +1,53 @@
+# flake8:noqa
+from __future__ import annotations
+
+import pytest
+
+from easyprotocol.protocols.modbus.fields import (
+    ModbusCoilArray,
+    ModbusDiscreteInputArray,
+)
+from easyprotocol.protocols.modbus.frames import ModbusTCPReadCoilsResponse
+
+
+class TestModbusBitArray:
+    def test_coil_array_parse(self) -> None:
+        obj = ModbusCoilArray(count=2, data=b"\x05\x81")
+        assert len(obj) == 16
+        assert obj.tolist()[:4] == [True, False, True, False]
+        assert obj.get_bit(15) is True
+        assert bytes(obj) == b"\x05\x81"
+        assert obj.string_value == "[+0:10100000, +8:10000001]"
+
+        bits = obj.bits_lsb
+        obj.set_bit(1, True)
+        assert bytes(obj) == b"\x07\x81"
+        assert bits.tobytes() == b"\x05\x81"
+        copy = obj.clone()
+        assert obj._packed_bits is not None  # pyright:ignore[reportPrivateUsage]
+        assert copy._packed_bits is not None  # pyright:ignore[reportPrivateUsage]
+        obj.frombytes(b"\x00\xff")
+        assert bytes(obj) == b"\x00\xff"
+        assert bytes(copy) == b"\x07\x81"
+
+        with pytest.raises(IndexError):
+            ModbusCoilArray(count=3, data=b"\x05\x81")
+
+    def test_coil_array_fields(self) -> None:
+        obj = ModbusDiscreteInputArray(count=1, default=[True, False, True])
+        assert len(obj) == 3
+        assert bytes(obj) == b"\x05"
+        assert [item.value for item in obj.value] == [True, False, True]
+        assert obj[2].name == "+2"
+        obj[2].value = False
+        assert obj.tolist() == [True, False, False]
+        assert bytes(obj) == b"\x01"
+        obj.set_value([0xFF])
+        assert obj.tolist() == [True] * 8
+
+    def test_coil_array_frame(self) -> None:
+        coils = [True, False, False] * 100
+        frame = ModbusTCPReadCoilsResponse(byte_count=38, coil_array=coils)
+        parsed = ModbusTCPReadCoilsResponse(data=bytes(frame))
+        assert parsed.coilArray.tolist()[: len(coils)] == coils
+        assert bytes(parsed) == bytes(frame)
@@ -9,9 +9,11 @@ import pytest
 from bitarray import bitarray
 from parse_data import ParseData
 
+from easyprotocol.base import ParseFieldDict
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS
-from easyprotocol.fields.array import ParseValueArrayField
-from easyprotocol.fields.unsigned_int import BoolField, UInt8Field
+from easyprotocol.fields.array import ParseCompactArrayField, ParseValueArrayField
+from easyprotocol.fields.float import Float32IEEField
+from easyprotocol.fields.unsigned_int import BoolField, UInt8Field, UInt16Field
 
 
 def check_array_strings(
@@ -283,3 +285,98 @@ class TestArray:
             obj=obj,
             tst=tst,
         )
+
+    def test_array_parse_numeric(self) -> None:
+        values = [1, 0x1234, 0xFFFF, 7]
+        byte_data = struct.pack(">4H", *values)
+        obj = ParseValueArrayField(
+            name="test",
+            count=len(values),
+            array_item_class=UInt16Field,
+            array_item_default=0,
+            data=byte_data,
+        )
+        assert obj._item_values is not None  # pyright:ignore[reportPrivateUsage]
+        assert obj.value == values
+        assert obj[1] == 0x1234
+        assert len(obj) == len(values)
+        assert bytes(obj) == byte_data
+        copy = obj.clone()
+        assert obj._item_values is not None  # pyright:ignore[reportPrivateUsage]
+        assert copy._item_values is not None  # pyright:ignore[reportPrivateUsage]
+        assert copy.value == values
+        assert bytes(copy) == byte_data
+
+        assert [item.name for item in obj] == ["#0", "#1", "#2", "#3"]
+        assert obj._item_values is None  # pyright:ignore[reportPrivateUsage]
+        assert all(item.parent is obj for item in obj.children.values())
+        obj.children["#2"].value = 2
+        assert obj.value == [1, 0x1234, 2, 7]
+        assert bytes(obj) == struct.pack(">4H", 1, 0x1234, 2, 7)
+        assert copy.value == values
+
+    def test_array_set_item(self) -> None:
+        obj = ParseValueArrayField(
+            name="test",
+            count=3,
+            array_item_class=UInt8Field,
+            array_item_default=0,
+            default=[1, 2, 3],
+        )
+        obj[1] = 9
+        assert obj.value == [1, 9, 3]
+        obj.value = [4, 5, 6]
+        assert obj.value == [4, 5, 6]
+        assert bytes(obj) == b"\x04\x05\x06"
+        assert obj.get_field_at(2).value == 6
+        old = obj.get_field_at(1)
+        new = UInt8Field(name="new", default=7)
+        obj[1] = new
+        assert list(obj.children.keys()) == ["#0", "new", "#2"]
+        assert new.parent is obj
+        assert old.parent is None
+        assert bytes(obj) == b"\x04\x07\x06"
+
+
+class TestCompactArray:
+    def test_compact_array_parse(self) -> None:
+        count = UInt8Field(name="count")
+        obj = ParseCompactArrayField(name="test", count=count, array_item_class=UInt16Field, array_item_default=0)
+        parent = ParseFieldDict(name="parent", default=[count, obj, UInt8Field(name="tail")])
+        parent.parse(b"\x03\x00\x01\x00\x02\x12\x34\xff")
+        assert obj.value == [1, 2, 0x1234]
+        assert obj[2] == 0x1234
+        assert obj[1:] == [2, 0x1234]
+        assert len(obj) == 3
+        assert list(obj) == [1, 2, 0x1234]
+        assert obj.children == {}
+        assert obj.get_field_at(2).value == 0x1234
+        assert parent["tail"].value == 0xFF
+        assert bytes(parent) == b"\x03\x00\x01\x00\x02\x12\x34\xff"
+
+        copy = parent.clone()
+        obj[0:2] = [5, 6, 7]
+        assert obj.value == [5, 6, 7, 0x1234]
+        assert bytes(parent) == b"\x03\x00\x05\x00\x06\x00\x07\x12\x34\xff"
+        del obj[-1]
+        obj.append(8)
+        assert bytes(obj) == b"\x00\x05\x00\x06\x00\x07\x00\x08"
+        assert copy["test"].value == [1, 2, 0x1234]
+
+    def test_compact_array_float(self) -> None:
+        obj = ParseCompactArrayField(
+            name="test",
+            count=2,
+            array_item_class=Float32IEEField,
+            array_item_default=0.0,
+            default=[1.5, -2.0],
+        )
+        assert bytes(obj) == struct.pack(">2f", 1.5, -2.0)
+        obj.parse(struct.pack(">2f", 0.25, 4.0))
+        assert obj.value == [0.25, 4.0]
+        assert str(obj).startswith("test: [")
+
+        with pytest.raises(IndexError):
+            obj.parse(b"\x00")
+        with pytest.raises(TypeError):
+            ParseCompactArrayField(name="test", count=2, array_item_class=BoolField, array_item_default=False)
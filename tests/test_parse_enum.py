@@ -10,7 +10,7 @@ from parse_data import ParseData
 from test_parse_uint import check_int_properties, check_int_value
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS
-from easyprotocol.fields.enum import EnumField
+from easyprotocol.fields.enum import EnumField, get_enum_member
 
 
 def check_enum_strings(
@@ -358,3 +358,12 @@ class TestEnums:
             obj=obj,
             tst=tst,
         )
+
+    def test_enum_undefined_value(self) -> None:
+        obj = EnumField(name="test", bit_count=8, enum_type=ExampleEnum, default=ExampleEnum.ONE, data=b"\x7f")
+        assert obj.value == 0x7F
+        assert not isinstance(obj.value, IntEnum)
+        assert obj.string_value == "127"
+        obj.value = ExampleEnum.ONE
+        assert obj.value is ExampleEnum.ONE
+        assert get_enum_member(ExampleEnum, 0x7F) == 0x7F
@@ -782,3 +782,357 @@ class TestParseDict:
         obj.pop(f2_name)
         assert len(obj) == 1
         assert f2.parent is None
+
+    def test_parsedict_struct_plan(self) -> None:
+        from easyprotocol.base.parse_struct import StructRun
+        from easyprotocol.fields import Float32IEEField, UInt16Field, UInt32Field
+
+        obj = ParseFieldDict(
+            name="test",
+            default=[
+                UInt8Field(name="a"),
+                UInt16Field(name="b", endian="big"),
+                UInt32Field(name="c", endian="little"),
+                UIntField(name="d", bit_count=4),
+                UIntField(name="e", bit_count=4),
+                Float32IEEField(name="f", endian="big"),
+            ],
+        )
+        data = struct.pack("<B", 1) + struct.pack(">H", 0x0203) + struct.pack("<I", 0x04050607) + b"\x98"
+        data += struct.pack(">f", 1.5)
+        obj.parse(data)
+        assert obj["a"].value == 1
+        assert obj["b"].value == 0x0203
+        assert obj["c"].value == 0x04050607
+        assert obj["d"].value == 8
+        assert obj["e"].value == 9
+        assert obj["f"].value == 1.5
+        assert obj.byte_value == data
+        steps = obj._get_struct_plan().steps
+        assert isinstance(steps[0], StructRun)
+        assert steps[0].fields == (obj["a"], obj["b"])
+        assert isinstance(steps[1], StructRun)
+        assert steps[1].fields == (obj["c"],)
+        assert steps[2] is obj["d"]
+
+        obj["c"].value = 0x0A0B0C0D
+        assert obj.byte_value[3:7] == struct.pack("<I", 0x0A0B0C0D)
+        assert obj["c"].bits_lsb.tobytes() == struct.pack("<I", 0x0A0B0C0D)
+
+    def test_parsedict_struct_plan_unaligned(self) -> None:
+        obj = ParseFieldDict(name="test", default=[UInt8Field(name="a"), UInt8Field(name="b")])
+        bits = bitarray("1010", endian="little")
+        bits.frombytes(b"\x12\x34")
+        assert obj.parse_at(bits=bits, offset=4) == 20
+        assert obj["a"].value == 0x12
+        assert obj["b"].value == 0x34
+        with pytest.raises(IndexError):
+            obj.parse(b"\x12")
+
+    def test_parsedict_struct_plan_overrides(self) -> None:
+        class Const(UInt8Field):
+            def get_bits_lsb(self) -> bitarray:
+                bits = bitarray(endian="little")
+                bits.frombytes(b"\x2a")
+                return bits
+
+        class Scaled(UInt8Field):
+            def get_value(self) -> Any:
+                return super().get_value() * 10
+
+        obj = ParseFieldDict(
+            name="test",
+            default=[UInt8Field(name="a", default=1), Const(name="c"), Scaled(name="s", default=3)],
+        )
+        assert bytes(obj) == b"\x01\x2a\x03"
+        assert obj["s"].value == 30
+        steps = obj._get_struct_plan().steps
+        assert steps[1] is obj["c"]
+        obj.parse(b"\x04\x05\x06")
+        assert obj["s"].value == 60
+        assert bytes(obj) == b"\x04\x2a\x06"
+
+    def test_parsedict_lazy(self) -> None:
+        from enum import IntEnum
+
+        from easyprotocol.fields import (
+            Float32IEEField,
+            ParseArrayField,
+            UInt8EnumField,
+            UInt16Field,
+        )
+
+        class Color(IntEnum):
+            RED = 1
+            BLUE = 2
+
+        count = UInt8Field(name="count")
+        inner = ParseFieldDict(
+            name="inner", default=[UIntField(name="lo", bit_count=4), UIntField(name="hi", bit_count=4)]
+        )
+        obj = ParseFieldDict(
+            name="test",
+            default=[
+                UInt8EnumField(name="color", enum_type=Color, default=Color.RED),
+                UInt16Field(name="u16", endian="little"),
+                Float32IEEField(name="f32"),
+                inner,
+                count,
+                ParseArrayField(name="array", count=count, array_item_class=UInt8Field, array_item_default=0),
+            ],
+            lazy=True,
+        )
+        data = b"\x02\x34\x12" + struct.pack(">f", 2.5) + b"\x21\x02\xaa\xbb"
+        leftover = obj.parse(data + b"\xff")
+        assert obj.lazy is True
+        assert leftover.tobytes() == b"\xff"
+        assert obj["u16"]._bits is None
+        assert inner["hi"]._bits is None
+
+        assert obj["color"].value == Color.BLUE
+        assert obj["u16"].value == 0x1234
+        assert obj["f32"].value == 2.5
+        assert inner["lo"].value == 1
+        assert inner["hi"].value == 2
+        assert [f.value for f in obj["array"]] == [0xAA, 0xBB]
+        assert bytes(obj) == data
+
+        obj["u16"].value = 0x5678
+        assert bytes(obj)[1:3] == b"\x78\x56"
+        with pytest.raises(IndexError):
+            obj.parse(data[:4])
+
+    def test_parsedict_lazy_mutable_data(self) -> None:
+        obj = ParseFieldDict(name="test", default=[UInt8Field(name="a"), UInt8Field(name="b")], lazy=True)
+        receive_buffer = bytearray(b"\x01\x02")
+        obj.parse(receive_buffer)
+        receive_buffer[0] = 9
+        receive_buffer.extend(b"\x03")
+        assert obj["a"].value == 1
+        assert obj["b"].value == 2
+
+        bits = bitarray(endian="little")
+        bits.frombytes(b"\x04\x05")
+        obj.parse(bits)
+        bits.setall(0)
+        obj.parse(memoryview(receive_buffer))
+        receive_buffer[1] = 9
+        assert obj["a"].value == 9
+        assert obj["b"].value == 2
+
+    def test_parsedict_lazy_subclass(self) -> None:
+        from easyprotocol.base.parse_field_list import ParseFieldList
+        from easyprotocol.fields import ParseArrayField
+        from easyprotocol.fields.array import ParseValueArrayField
+
+        def create_subclass(cls: type[ParseBase]) -> type[ParseBase]:
+            class Sub(cls):
+                def parse_at(self, bits: bitarray, offset: int) -> int:
+                    return super().parse_at(bits, offset)
+
+            return Sub
+
+        fields: list[ParseBase] = [
+            create_subclass(ParseFieldDict)(name="dict", default=[UInt8Field(name="a"), UInt8Field(name="b")]),
+            create_subclass(ParseFieldList)(name="list", default=[UInt8Field(name="a"), UInt8Field(name="b")]),
+        ]
+        for cls in (ParseArrayField, ParseValueArrayField):
+            fields.append(
+                create_subclass(cls)(name=cls.__name__, count=2, array_item_class=UInt8Field, array_item_default=0)
+            )
+        for field in fields:
+            field.lazy = True
+            field.parse(b"\x01\x02")
+            assert bytes(field) == b"\x01\x02"
+            field.lazy = False
+
+        obj = ParseFieldDict(name="test", default=fields, lazy=True)
+        data = bytes(range(2 * len(fields)))
+        obj.parse(data)
+        assert bytes(obj) == data
+
+    def test_parsedict_bits_cache(self) -> None:
+        from easyprotocol.base.parse_field_list import ParseFieldList
+        from easyprotocol.fields.array import ParseValueArrayField
+
+        inner = ParseFieldList(name="inner", default=[UInt8Field(name="a"), UInt8Field(name="b")])
+        array = ParseValueArrayField(
+            name="array", count=2, array_item_class=UInt8Field, array_item_default=0, default=[1, 2]
+        )
+        obj = ParseFieldDict(name="test", default=[inner, array, UInt8Field(name="c")])
+
+        data = bytes(obj)
+        assert data == b"\x00\x00\x01\x02\x00"
+        assert bytes(obj) is data
+        assert obj.bits_lsb is obj.bits_lsb
+
+        inner[1].value = 9
+        assert bytes(obj) == b"\x00\x09\x01\x02\x00"
+        array.children["#1"].value = 8
+        assert bytes(obj) == b"\x00\x09\x01\x08\x00"
+        obj["c"].bits_lsb = bitarray("1", endian="little")
+        assert bytes(obj) == b"\x00\x09\x01\x08\x01"
+
+        obj.pop("c")
+        assert bytes(obj) == b"\x00\x09\x01\x08"
+        obj["d"] = UInt8Field(name="d", default=0xDD)
+        assert bytes(obj) == b"\x00\x09\x01\x08\xdd"
+        obj.parse(b"\x01\x02\x03\x04\x05")
+        assert bytes(obj) == b"\x01\x02\x03\x04\x05"
+        inner.parse(b"\x06\x07")
+        assert bytes(obj) == b"\x06\x07\x03\x04\x05"
+
+        class Mid(ParseFieldList):
+            def get_bits_lsb(self) -> bitarray:
+                bits = bitarray(endian="little")
+                for child in self.children.values():
+                    bits += child.bits_lsb
+                return bits
+
+        item = UInt8Field(name="item")
+        top = ParseFieldDict(name="top", default=[Mid(name="mid", default=[item])])
+        assert bytes(top) == b"\x00"
+        item.value = 9
+        assert bytes(top) == b"\x09"
+
+    def test_parsedict_clone(self) -> None:
+        from easyprotocol.fields.array import ParseArrayField
+
+        count = UInt8Field(name="count", default=2)
+        array = ParseArrayField(
+            name="array", count=count, array_item_class=UInt8Field, array_item_default=0, default=[1, 2]
+        )
+        obj = ParseFieldDict(name="test", default=[UInt8Field(name="a", default=5), count, array])
+        assert bytes(obj) == b"\x05\x02\x01\x02"
+
+        other = obj.clone()
+        assert type(other) is ParseFieldDict
+        assert other is not obj
+        assert other.name == obj.name
+        assert bytes(other) == bytes(obj)
+        assert other.parent is None
+        for key in obj.keys():
+            assert other[key] is not obj[key]
+            assert other[key].parent is other
+        assert other["array"]._count is other["count"]  # pyright:ignore[reportGeneralTypeIssues]
+
+        other["a"].value = 6
+        other.parse(b"\x07\x03\x01\x02\x03")
+        assert bytes(other) == b"\x07\x03\x01\x02\x03"
+        assert bytes(obj) == b"\x05\x02\x01\x02"
+        assert len(obj["array"]) == 2
+        obj.parse(b"\x08\x02\x09\x0a")
+        assert bytes(obj) == b"\x08\x02\x09\x0a"
+        assert bytes(other) == b"\x07\x03\x01\x02\x03"
+
+    def test_parsedict_template(self) -> None:
+        class TestDict(ParseFieldDict):
+            def __init__(self) -> None:
+                super().__init__(name="test", default=[UInt8Field(name="a", default=5)])
+
+        obj1 = TestDict.template()
+        obj2 = TestDict.template()
+        assert type(obj1) is TestDict
+        assert obj1 is not obj2
+        assert obj1["a"] is not obj2["a"]
+        obj1["a"].value = 6
+        assert bytes(obj1) == b"\x06"
+        assert bytes(obj2) == b"\x05"
+        assert bytes(TestDict.template()) == b"\x05"
+
+    def test_parsedict_parse_many(self) -> None:
+        import array
+
+        from easyprotocol.fields import Int16Field, UInt16Field
+
+        obj = ParseFieldDict(
+            name="test",
+            default=[UInt8Field(name="a"), UInt16Field(name="b", endian="little"), Int16Field(name="c", endian="big")],
+        )
+        data = b"\x01\x02\x00\xff\xfe" + b"\x03\x04\x01\x00\x05" + b"\x06"
+        columns = obj.parse_many(data)
+        assert list(columns.keys()) == ["a", "b", "c"]
+        assert columns["a"] == array.array("B", [1, 3])
+        assert columns["b"] == array.array("H", [2, 0x104])
+        assert columns["c"] == array.array("h", [-2, 5])
+        assert bytes(obj) == b"\x00\x00\x00\x00\x00"
+
+        columns = obj.parse_many(memoryview(data), count=1)
+        assert columns["c"] == array.array("h", [-2])
+        with pytest.raises(IndexError):
+            obj.parse_many(data, count=3)
+
+    def test_parsedict_parse_many_unaligned(self) -> None:
+        import array
+
+        from easyprotocol.fields import StringField
+
+        obj = ParseFieldDict(
+            name="test",
+            default=[
+                UIntField(name="a", bit_count=4),
+                UIntField(name="b", bit_count=4),
+                UInt8Field(name="c"),
+                StringField(name="d", count=2),
+            ],
+        )
+        columns = obj.parse_many(b"\x21\x03ab\x54\x06cd\xff")
+        assert columns["a"] == [1, 4]
+        assert columns["b"] == [2, 5]
+        assert columns["c"] == array.array("B", [3, 6])
+        assert columns["d"] == ["ab", "cd"]
+        assert obj["d"].value == ""
+        with pytest.raises(IndexError):
+            obj.parse_many(b"\x21\x03ab\x54\x06cd\xff", count=3)
+
+    def test_parsedict_parse_many_numpy(self) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        obj = ParseFieldDict(name="test", default=[UInt8Field(name="a"), UInt8Field(name="b")])
+        columns = obj.parse_many(b"\x01\x02\x03\x04", as_numpy=True)
+        assert isinstance(columns["a"], numpy.ndarray)
+        assert columns["a"].tolist() == [1, 3]
+        assert columns["b"].tolist() == [2, 4]
+
+    def test_parsedict_numpy_dtype(self) -> None:
+        numpy = pytest.importorskip("numpy")
+        from easyprotocol.base import ParseFieldList, get_numpy_dtype
+        from easyprotocol.fields import (
+            Float32IEEField,
+            Int32Field,
+            StringField,
+            UInt16Field,
+        )
+
+        obj = ParseFieldDict(
+            name="test",
+            default=[
+                UInt8Field(name="a"),
+                UInt16Field(name="b", endian="little"),
+                Int32Field(name="c", endian="big"),
+                Float32IEEField(name="d", endian="big"),
+                StringField(name="e", count=3),
+                ParseFieldList(name="f", default=[UInt8Field(name="g")]),
+            ],
+        )
+        dtype = get_numpy_dtype(obj)
+        assert dtype == numpy.dtype(
+            [("a", "u1"), ("b", "<u2"), ("c", ">i4"), ("d", ">f4"), ("e", "S3"), ("f", [("g", "u1")])]
+        )
+        data = b"\x01\x02\x03\xff\xff\xff\xfe\x3f\x80\x00\x00abc\x07" * 2
+        records = numpy.frombuffer(data, dtype=dtype)
+        obj.parse(data[: dtype.itemsize])
+        assert records["a"][1] == obj["a"].value
+        assert records["b"][1] == obj["b"].value
+        assert records["c"][1] == obj["c"].value
+        assert records["d"][1] == obj["d"].value
+        assert records["e"][1] == obj["e"].value.encode()
+        assert records["f"]["g"][1] == obj["f"][0].value
+
+        columns = obj.parse_many(data, as_numpy=True)
+        assert columns["c"].tolist() == [-2, -2]
+
+        with pytest.raises(TypeError):
+            get_numpy_dtype(ParseFieldDict(name="test", default=[UIntField(name="a", bit_count=24)]))
+        with pytest.raises(TypeError):
+            get_numpy_dtype(ParseFieldDict(name="test", default=[UIntField(name="a", bit_count=4)]))
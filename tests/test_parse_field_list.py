@@ -560,6 +560,25 @@ class TestParseFieldList:
         assert obj[2] == f3_also
         assert obj[2].value == f3_also.value
 
+    def test_ParseFieldList_index(self) -> None:
+        fields = [UInt8Field(name=f"f{i}", default=i) for i in range(5)]
+        obj = ParseFieldList(name="test", default=fields)
+        assert [obj[i] for i in range(5)] == fields
+        obj[1] = 11
+        assert fields[1].value == 11
+        assert bytes(obj) == b"\x00\x0b\x02\x03\x04"
+        obj.set_value([7, 8])
+        assert bytes(obj) == b"\x07\x08\x02\x03\x04"
+
+        f5 = UInt8Field(name="f5", default=5)
+        obj.append(f5)
+        assert obj[5] == f5
+        assert obj[-1] == f5
+        del obj[0]
+        assert obj[0] == fields[1]
+        assert obj[4] == f5
+        assert obj[1:3] == fields[2:4]
+
     def test_ParseFieldList_insert(self) -> None:
         name = "test"
         f1_name = "f1"
@@ -587,3 +606,83 @@ class TestParseFieldList:
         assert obj[1].value == f2.value
         assert obj[2] == f3
         assert obj[2].value == f3.value
+
+    def test_ParseFieldList_insert_delete(self) -> None:
+        fields = [UInt8Field(name=f"f{i}", default=i) for i in range(6)]
+        obj = ParseFieldList(name="test", default=fields[:3])
+        obj.insert(1, fields[3])
+        obj.insert(-1, fields[4])
+        obj.insert(10, fields[5])
+        assert list(obj.children.keys()) == ["f0", "f3", "f1", "f4", "f2", "f5"]
+        assert [obj[i] for i in range(6)] == [fields[i] for i in [0, 3, 1, 4, 2, 5]]
+        assert bytes(obj) == b"\x00\x03\x01\x04\x02\x05"
+        assert all(field.parent == obj for field in fields)
+
+        del obj[1:5:2]
+        assert list(obj.children.keys()) == ["f0", "f1", "f2", "f5"]
+        assert fields[3].parent is None
+        assert fields[4].parent is None
+        del obj[-1]
+        assert bytes(obj) == b"\x00\x01\x02"
+        obj.insert(0, fields[2])
+        assert list(obj.children.keys()) == ["f2", "f0", "f1"]
+
+    def test_ParseFieldList_parse_at(self) -> None:
+        f1 = UInt8Field(name="f1")
+        f2 = UInt8Field(name="f2")
+        obj = ParseFieldList(name="test", default=[f1, f2])
+        bits = bitarray(endian="little")
+        bits.frombytes(b"\x00\xaa\xbb\xcc")
+
+        offset = obj.parse_at(bits=bits, offset=8)
+        assert offset == 24
+        assert f1.value == 0xAA
+        assert f2.value == 0xBB
+        assert bytes(obj) == b"\xaa\xbb"
+        leftover = obj.parse(data=b"\x01\x02\x03")
+        assert leftover.tobytes() == b"\x03"
+
+    def test_ParseFieldList_parse_legacy_field(self) -> None:
+        class LegacyField(ParseGenericValue[int]):
+            def parse(self, data: Any) -> bitarray:
+                bits = bitarray(endian="little")
+                bits.frombytes(data.tobytes())
+                self._bits = bits[:8]
+                return data[8:]
+
+        f1 = LegacyField(name="f1")
+        f2 = UInt8Field(name="f2")
+        obj = ParseFieldList(name="test", default=[f1, f2], data=b"\x01\x02")
+        assert bytes(f1) == b"\x01"
+        assert f2.value == 2
+
+    def test_ParseFieldList_parse_memoryview(self) -> None:
+        from easyprotocol.base.utils import input_to_bytes
+
+        receive_buffer = bytearray(b"\x01\x02\x03\x04\x05\x06")
+        bits = input_to_bytes(memoryview(receive_buffer))
+        receive_buffer[0] = 0x11
+        assert bits.tobytes()[0] == 0x11
+
+        obj = ParseFieldList(name="test", default=[UInt8Field(name="f1"), UInt8Field(name="f2")])
+        frames: list[bytes] = []
+        offset = 0
+        while offset < len(bits):
+            offset = obj.parse_at(bits=bits, offset=offset)
+            frames.append(bytes(obj))
+        assert frames == [b"\x11\x02", b"\x03\x04", b"\x05\x06"]
+
+        leftover = obj.parse(memoryview(receive_buffer)[2:5])
+        assert obj[0].value == 3
+        assert obj[1].value == 4
+        assert leftover.tobytes() == b"\x05"
+        obj.parse(memoryview(bytes(range(8)))[::2])
+        assert bytes(obj) == b"\x00\x02"
+
+        obj.lazy = True
+        obj.parse(memoryview(receive_buffer))
+        receive_buffer[1] = 0x12
+        assert obj[0].value == 0x11
+        assert obj[1].value == 2
+        obj.parse(receive_buffer)
+        assert obj[1].value == 0x12
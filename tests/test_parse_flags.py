@@ -10,7 +10,7 @@ from parse_data import ParseData
 from test_parse_uint import check_int_properties, check_int_value
 
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS
-from easyprotocol.fields.flags import FlagsField
+from easyprotocol.fields.flags import FlagsField, get_flag_names
 
 
 def check_flags_strings(
@@ -354,3 +354,12 @@ class TestFlags:
             obj=obj,
             tst=tst,
         )
+
+    def test_flags_string_value_shared(self) -> None:
+        obj = FlagsField(name="test", bit_count=8, flags_type=ExampleFlags, default=ExampleFlags.NONE, data=b"\x0b")
+        assert obj.value == ExampleFlags.ONE | ExampleFlags.TWO | ExampleFlags.EIGHT
+        assert obj.string_value == "NONE|ONE|TWO|EIGHT"
+        other = FlagsField(name="other", bit_count=8, flags_type=ExampleFlags, default=ExampleFlags.NONE, data=b"\x04")
+        assert other.string_value == "NONE|FOUR"
+        assert get_flag_names(ExampleFlags) is get_flag_names(ExampleFlags)
+        assert get_flag_names(ExampleFlags).get(0x0B) == "NONE|ONE|TWO|EIGHT"
@@ -4,9 +4,11 @@ from __future__ import annotations
 import struct
 from collections import OrderedDict
 
+import pytest
 from bitarray import bitarray
 from parse_data import ParseData
 
+from easyprotocol.base import ParseFieldDict
 from easyprotocol.base.parse_base import DEFAULT_ENDIANNESS
 from easyprotocol.base.utils import hex
 from easyprotocol.fields.string import (
@@ -17,8 +19,11 @@ from easyprotocol.fields.string import (
     ByteField,
     BytesField,
     CharField,
+    NullTerminatedBytesField,
+    NullTerminatedStringField,
     StringField,
 )
+from easyprotocol.fields.unsigned_int import UInt8Field
 
 
 def check_str_byte_value(
@@ -394,3 +399,59 @@ class TestBytes:
             obj=obj,
             tst=tst,
         )
+
+
+class TestStringSlices:
+    def test_string_set_value(self) -> None:
+        obj = StringField(name="test", count=3, default="abc")
+        obj.value = "xyz"
+        assert obj.value == "xyz"
+        assert bytes(obj) == b"xyz"
+        assert obj[1] == "y"
+        assert [str(child) for child in obj.children.values()] == ['#0: "x"', '#1: "y"', '#2: "z"']
+
+        obj = StringField(name="test", count=2, string_encoding="utf-8", data="\u00e9".encode("utf-8"))
+        assert obj.value == "\u00e9"
+
+    def test_string_fixed_count(self) -> None:
+        obj = StringField(name="test", count=8)
+        obj.value = "abc"
+        assert bytes(obj) == b"abc\x00\x00\x00\x00\x00"
+        with pytest.raises(ValueError):
+            obj.value = "abcdefghijk"
+        assert bytes(obj) == b"abc\x00\x00\x00\x00\x00"
+
+        serial = BytesField(name="serial", count=4, byte_default=b"\xff")
+        serial.value = b"\x12"
+        assert bytes(serial) == b"\x12\xff\xff\xff"
+        with pytest.raises(ValueError):
+            serial.value = b"\x00" * 5
+
+    def test_string_count_prefixed(self) -> None:
+        count = UInt8Field(name="count")
+        name = StringField(name="name", count=count)
+        serial = BytesField(name="serial", count=2)
+        frame = ParseFieldDict(name="frame", default=[count, name, serial])
+        frame.parse(b"\x05modem\x12\x34")
+        assert name.value == "modem"
+        assert serial.value == b"\x12\x34"
+        name.value = "router1"
+        assert count.value == 7
+        assert bytes(frame) == b"\x07router1\x12\x34"
+
+    def test_string_null_terminated(self) -> None:
+        name = NullTerminatedStringField(name="name")
+        serial = NullTerminatedBytesField(name="serial")
+        frame = ParseFieldDict(name="frame", default=[name, serial, UInt8Field(name="tail")])
+        frame.parse(b"modem\x00\x12\x34\x00\xff")
+        assert name.value == "modem"
+        assert serial.value == b"\x12\x34"
+        assert frame["tail"].value == 0xFF
+        assert str(name) == 'name: "modem"'
+        name.value = "router"
+        assert bytes(frame) == b"router\x00\x12\x34\x00\xff"
+
+        with pytest.raises(IndexError):
+            NullTerminatedStringField(name="name", data=b"modem")
+        with pytest.raises(ValueError):
+            serial.value = b"\x00"
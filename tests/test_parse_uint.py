@@ -338,6 +338,65 @@ class TestUIntField:
             tst=tst,
         )
 
+    def test_uintfield_bit_count_info(self) -> None:
+        from easyprotocol.base.utils import get_bit_count_info
+
+        info = get_bit_count_info(12)
+        assert info.byte_count == 2
+        assert info.mask == 0xFFF
+        assert info.unsigned_limit == 0x10000
+        assert info.signed_limit == 0x8000
+        assert info.int_backed is False
+        assert get_bit_count_info(1).int_backed is True
+        assert get_bit_count_info(24).int_backed is True
+        assert UIntField(name="a", bit_count=12)._bit_count_info is info  # pyright:ignore[reportPrivateUsage]
+
+    def test_uintfield_set_value_int_backed(self) -> None:
+        obj = UIntField(name="test", bit_count=16, endian="little")
+        obj.value = 0x1234
+        assert obj._bits is None  # pyright:ignore[reportPrivateUsage]
+        assert obj.value == 0x1234
+        assert obj.bits_lsb.tobytes() == b"\x34\x12"
+        assert bytes(obj) == b"\x34\x12"
+
+        obj = UIntField(name="test", bit_count=4)
+        obj.value = 0xA
+        assert obj._bits is None  # pyright:ignore[reportPrivateUsage]
+        assert obj.value == 0xA
+        assert obj.bits_lsb == bitarray("0101", endian="little")
+        assert obj.bits.to01() == "1010"
+
+        obj = UIntField(name="test", bit_count=12)
+        obj.value = 0x123
+        assert obj._bits is not None  # pyright:ignore[reportPrivateUsage]
+
+        obj = UIntField(name="test", bit_count=8)
+        with pytest.raises(OverflowError):
+            obj.value = 0x100
+        with pytest.raises(OverflowError):
+            obj.value = -1
+
+    def test_uintfield_slots(self) -> None:
+        from easyprotocol.base.parse_children import ParseChildren
+        from easyprotocol.base.parse_field_list import ParseFieldList
+
+        obj1 = UInt8Field(name="a")
+        obj2 = UInt16Field(name="b")
+        assert not hasattr(obj1, "__dict__")
+        with pytest.raises(AttributeError):
+            obj1.extra = 1  # pyright:ignore[reportGeneralTypeIssues]
+        assert obj1._children is obj2._children  # pyright:ignore[reportPrivateUsage]
+        assert len(obj1._children) == 0  # pyright:ignore[reportPrivateUsage]
+        assert isinstance(obj1._children, ParseChildren)  # pyright:ignore[reportPrivateUsage]
+        obj1._children.clear()  # pyright:ignore[reportPrivateUsage]
+        with pytest.raises(TypeError):
+            obj1._children["c"] = UInt8Field(name="c")  # pyright:ignore[reportPrivateUsage]
+
+        parent = ParseFieldList(name="parent", default=[obj1, obj2])
+        assert not hasattr(parent, "__dict__")
+        assert len(parent._children) == 2  # pyright:ignore[reportPrivateUsage]
+        assert len(obj1._children) == 0  # pyright:ignore[reportPrivateUsage]
+
     @pytest.mark.parametrize(
         PARAMETER_NAMES,
         TEST_VALUES_N_BIT_UINT_BE_VARIABLE,
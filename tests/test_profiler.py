@@ -0,0 +1,69 @@
+# flake8:noqa
+from __future__ import annotations
+
+import io
+import pstats
+
+import pytest
+
+from easyprotocol.base import FieldProfiler
+from easyprotocol.base.parse_base import ParseBase
+from easyprotocol.fields import UInt8Field
+from easyprotocol.fields.unsigned_int import UIntFieldGeneric
+from easyprotocol.protocols.modbus.frames import ModbusTCPReadCoilsResponse
+
+
+class TestFieldProfiler:
+    def test_profiler_swaps_methods(self) -> None:
+        originals = {name: UIntFieldGeneric.__dict__[name] for name in ("parse_at", "get_value", "set_value")}
+        profiler = FieldProfiler()
+        assert not profiler.enabled
+        with profiler:
+            assert profiler.enabled
+            assert UIntFieldGeneric.__dict__["get_value"] is not originals["get_value"]
+            with pytest.raises(RuntimeError):
+                FieldProfiler().enable()
+        assert not profiler.enabled
+        assert {name: UIntFieldGeneric.__dict__[name] for name in originals} == originals
+        assert ParseBase.parse.__name__ == "parse"
+
+    def test_profiler_field_paths(self) -> None:
+        frame = ModbusTCPReadCoilsResponse(transaction_id=1, byte_count=2, coil_array=[True] * 16)
+        data = bytes(frame)
+        frame = ModbusTCPReadCoilsResponse.template()
+        with FieldProfiler() as profiler:
+            frame.parse(data)
+            frame.parse(data)
+            frame["bit array"][3].value = False
+            bytes(frame)
+        entries = profiler.entries
+        assert entries[("ReadCoilsResponse", "parse")].calls == 2
+        assert entries[("ReadCoilsResponse", "parse")].byte_count == 2 * len(data)
+        assert entries[("ReadCoilsResponse.bit array", "parse_at")].byte_count == 4
+        assert entries[("ReadCoilsResponse.bit array.+3", "set_value")].calls == 1
+        assert entries[("ReadCoilsResponse", "get_bits_lsb")].byte_count == len(data)
+        parse = entries[("ReadCoilsResponse", "parse")]
+        assert 0 < parse.own <= parse.cumulative
+
+        table = profiler.get_table(sort_by="path")
+        assert table.splitlines()[0].split() == ["path", "method", "calls", "cumulative", "ms", "own", "ms", "bytes"]
+        assert "ReadCoilsResponse.bit array.+3" in table
+        assert len(profiler.get_table(limit=2).splitlines()) == 3
+        with pytest.raises(ValueError):
+            profiler.get_table(sort_by="missing")
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats("cumulative").print_stats()
+        assert "ReadCoilsResponse.bit array:0(parse_at)" in stream.getvalue()
+        assert ("ReadCoilsResponse", 0, "parse_at") in stats.stats[("ReadCoilsResponse.bit array", 0, "parse_at")][4]
+
+    def test_profiler_super_calls_counted_once(self) -> None:
+        field = UInt8Field(name="field")
+        with FieldProfiler(methods=["get_value", "set_value"]) as profiler:
+            field.value = 3
+            assert field.value == 3
+        assert profiler.entries[("field", "set_value")].calls == 1
+        assert profiler.entries[("field", "get_value")].calls == 1
+        profiler.clear()
+        assert profiler.entries == {}